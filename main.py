@@ -3,83 +3,500 @@
 """
 Angolla Music Player - Tek Dosya, Güncel Sürüm (Sade Geçiş + Çalışan Görselleştirme)
 """
+import time
+_STARTUP_T0 = time.perf_counter()
+
 import math
 import sys
 import os
 import pickle
 import random
-import time
 import ctypes
+import importlib
+import json
+import unicodedata
 import sqlite3
-from typing import Optional, Dict, Any, List
-import vlc
+import hashlib
+import threading
+import queue
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List, Callable
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QVBoxLayout,
     QWidget, QLabel, QHBoxLayout, QSlider, QListWidget, QSplitter,
     QAction, QStatusBar, QTreeView, QStackedWidget, QListWidgetItem,
-    QMenu, QFileDialog, QMessageBox, QShortcut, QFileSystemModel,
+    QMenu, QFileDialog, QMessageBox, QShortcut,
     QDialog, QCheckBox, QGridLayout, QComboBox, QLineEdit,
     QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
-    , QColorDialog
+    , QColorDialog, QInputDialog, QAbstractSlider
 )
 from PyQt5.QtMultimedia import (
-    QMediaPlayer, QMediaContent, QMediaPlaylist, QAudioProbe
+    QMediaPlayer, QMediaContent, QMediaPlaylist, QAudioProbe,
+    QAudio, QAudioOutput, QAudioFormat, QAudioDeviceInfo
 )
 from PyQt5.QtCore import (
     QUrl, Qt, QTime, QDir, QModelIndex, QTimer, QByteArray,
-    QSettings, QPointF, pyqtSignal
+    QSettings, QPointF, QRectF, QObject, QIODevice, pyqtSignal,
+    QAbstractItemModel, QMimeData, QFileSystemWatcher
 )
 from PyQt5.QtGui import (
     QPainter, QBrush, QColor, QPixmap, QKeySequence, QPen,
-    QFont, QIcon
+    QFont, QIcon, QLinearGradient, QPalette
 )
 
 # Ek araçlar
-import webbrowser
 import urllib.parse
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape as xml_escape
+
+
+# ---------------------------------------------------------------------------
+# AÇILIŞ PROFİLİ / GECİKMELİ İÇE AKTARMA
+# ---------------------------------------------------------------------------
+
+class StartupProfiler:
+    """--profile-startup ile açılış aşamalarının sürelerini ölçer ve döker."""
+
+    def __init__(self, t0: float):
+        self.enabled = "--profile-startup" in sys.argv
+        self.t0 = t0
+        self.phases = []
+        self.marks = []
+        self._reported = False
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.phases.append((name, time.perf_counter() - start))
+
+    def mark(self, name: str):
+        if self.enabled:
+            self.marks.append((name, time.perf_counter() - self.t0))
+
+    def report(self):
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        print("\n--- Açılış profili ---")
+        for name, seconds in self.phases:
+            print(f"  {name:<32} {seconds * 1000:8.1f} ms")
+        for name, seconds in self.marks:
+            print(f"  @ {name:<30} {seconds * 1000:8.1f} ms (başlangıçtan)")
+
+
+STARTUP = StartupProfiler(_STARTUP_T0)
+
+_UNLOADED = object()
+
 
-# İsteğe bağlı ek kütüphaneler
-try:
-    import numpy as np
-except Exception:
-    np = None
-    print("Uyarı: NumPy yüklenemedi. Görselleştirme sınırlı çalışacak.")
-
-try:
-    from mutagen import File as MutagenFile
-    from mutagen.id3 import ID3
-    from mutagen.mp4 import MP4
-except Exception:
-    MutagenFile = None
-    ID3 = None
-    MP4 = None
-    print("Uyarı: Mutagen yüklenemedi. Etiket/kapak okuma sınırlı olacak.")
+class LazyImport:
+    """
+    Modülü (ya da içindeki bir adı) ilk kullanımda içe aktarır. Yüklenemezse
+    yanlış (falsy) değerlidir: 'if not np' kontrolleri bunu karşılar.
+    """
+
+    def __init__(self, module: str, attr: Optional[str] = None, warning: str = ""):
+        self._module = module
+        self._attr = attr
+        self._warning = warning
+        self._target = _UNLOADED
+
+    def load(self):
+        if self._target is _UNLOADED:
+            with STARTUP.phase(f"içe aktar: {self._module}"):
+                try:
+                    module = importlib.import_module(self._module)
+                    self._target = getattr(module, self._attr) if self._attr else module
+                except Exception:
+                    self._target = None
+                    if self._warning:
+                        print(self._warning)
+        return self._target
+
+    def __bool__(self):
+        return self.load() is not None
+
+    def __getattr__(self, name):
+        target = self.load()
+        if target is None:
+            raise AttributeError(f"{self._module} yüklenemedi ({name})")
+        return getattr(target, name)
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+
+# İsteğe bağlı ek kütüphaneler (ilk kullanımda yüklenir)
+np = LazyImport(
+    "numpy",
+    warning="Uyarı: NumPy yüklenemedi. Görselleştirme sınırlı çalışacak. 'pip install numpy' önerilir."
+)
+_MUTAGEN_WARNING = ("Uyarı: Mutagen yüklenemedi. Etiket/kapak okuma sınırlı olacak. "
+                    "'pip install mutagen' ile yükleyin.")
+MutagenFile = LazyImport("mutagen", "File", warning=_MUTAGEN_WARNING)
+ID3 = LazyImport("mutagen.id3", "ID3")
+MP4 = LazyImport("mutagen.mp4", "MP4")
+TCON = LazyImport("mutagen.id3", "TCON")
+vlc = LazyImport("vlc", warning="Uyarı: python-vlc yüklenemedi. QtMultimedia ses motoru kullanılacak.")
 
 # Sabitler
 PLAYLIST_FILE = "angolla_playlist.pkl"
 DB_FILE = "angolla_library.db"
+CONFIG_FILE = "angolla_config.json"
+AUDIO_EXTENSIONS = (".mp3", ".flac", ".ogg", ".m4a", ".wav")
 SETTINGS_KEY = "AngollaPlayer/Settings"
+PLAYLIST_FILE_FILTER = "Çalma Listeleri (*.m3u *.m3u8 *.pls *.xspf)"
+PLAYLIST_IMPORT_CHUNK = 2000
+LIBRARY_INGEST_CHUNK = 500
+LIBRARY_MAINTENANCE_INTERVAL = 24 * 3600      # saniye
+LIBRARY_MAINTENANCE_CHECK_MS = 5 * 60 * 1000  # boşta mı diye bakma aralığı
+SKIP_COALESCE_MS = 220
+EQ_APPLY_MS = 16  # ~bir kare
+CONFIG_SAVE_DELAY_MS = 750
+DEFAULT_BACKEND = "qt"
 
 
 # ---------------------------------------------------------------------------
 # KÜTÜPHANE YÖNETİCİSİ
 # ---------------------------------------------------------------------------
 
+TRACK_BASE_COLUMNS = ("path", "title", "artist", "album", "duration", "last_scanned")
+# Sonradan eklenen sıralama ve teknik sütunlar (eski veritabanlarına ALTER ile eklenir)
+TRACK_EXTRA_COLUMNS = (
+    ("albumartist", "TEXT"),
+    ("tracknumber", "INTEGER"),
+    ("discnumber", "INTEGER"),
+    ("year", "INTEGER"),
+    ("genre", "TEXT"),
+    ("bitrate", "INTEGER"),       # kbps
+    ("samplerate", "INTEGER"),    # Hz
+    ("channels", "INTEGER"),
+    ("codec", "TEXT"),
+    ("signature", "TEXT"),        # içerik imzası (taşıma/yeniden adlandırma tespiti)
+)
+# Etiket okumadan hesaplanan sütunlar: eklendiklerinde kütüphane yeniden taranmaz
+TRACK_DERIVED_COLUMNS = frozenset({"signature"})
+# Alım sırasında hesaplanan sıralama anahtarları ve katlanmış arama metni
+TRACK_SORT_COLUMNS = (
+    ("title_sort", "TEXT"),
+    ("artist_sort", "TEXT"),
+    ("album_sort", "TEXT"),
+    ("search_text", "TEXT"),
+)
+TRACK_INDEXES = {
+    "idx_tracks_artist_order": "artist, album, discnumber, tracknumber",
+    "idx_tracks_sort_artist": "artist_sort, album_sort, discnumber, tracknumber, title_sort",
+    "idx_tracks_sort_album": "album_sort, discnumber, tracknumber, title_sort",
+    "idx_tracks_sort_title": "title_sort, artist_sort",
+    "idx_tracks_genre": "genre",
+    "idx_tracks_year": "year",
+    "idx_tracks_format": "codec, samplerate, bitrate",
+    "idx_tracks_album_id": "album_id, discnumber, tracknumber",
+    "idx_tracks_signature": "signature",
+    "idx_tracks_duration": "duration",
+}
+# Gözatma ağacında albümün bağlandığı sanatçı: albüm sanatçısı, yoksa parça sanatçısı
+GROUP_ARTIST_SQL = "COALESCE(NULLIF(albumartist, ''), NULLIF(artist, ''), 'Bilinmeyen Sanatçı')"
+GROUP_ALBUM_SQL = "COALESCE(NULLIF(album, ''), 'Bilinmeyen Albüm')"
+# Düz liste sıralamaları (sütun -> ORDER BY), tümü indeksten karşılanır
+LIBRARY_SORT_ORDERS = {
+    "title": ("title_sort", "artist_sort"),
+    "artist": ("artist_sort", "album_sort", "discnumber", "tracknumber", "title_sort"),
+    "album": ("album_sort", "discnumber", "tracknumber", "title_sort"),
+    "duration": ("duration",),
+}
+
+# Türk alfabesi sırası; harfler rakamlardan sonra, diğer yazı sistemlerinden
+# önce gelen 'A'..'`' aralığına eşlenir, böylece anahtar SQLite'ın BINARY
+# karşılaştırmasıyla doğru sıralanır (sorguda Python collation'ı gerekmez).
+_TR_ALPHABET = "abcçdefgğhıijklmnoöpqrsştuüvwxyz"
+_TR_SORT_RANK = {ch: chr(0x41 + i) for i, ch in enumerate(_TR_ALPHABET)}
+_TR_FOLD = str.maketrans("çğıöşü", "cgiosu")
+SORT_ARTICLES = ("the ", "a ", "an ")
+
+# Faset süzgeçleri facet_counts özet tablosundan sayılır: her (tür, yıl,
+# biçim, bit hızı bandı) birleşimi için parça sayısı, tetikleyicilerle
+# tracks ile aynı transaction'da güncel tutulur. Bilinmeyen değerler
+# '' / 0 / -1 olarak saklanır (UNIQUE anahtarda NULL eşleşmez).
+BITRATE_BANDS = (320, 256, 192, 128)  # kbps alt sınırları; altı 0, bilinmeyen -1
+
+
+def _bitrate_band_sql(column: str) -> str:
+    bands = " ".join(f"WHEN {column} >= {band} THEN {band}" for band in BITRATE_BANDS)
+    return f"CASE WHEN COALESCE({column}, 0) <= 0 THEN -1 {bands} ELSE 0 END"
+
+
+FACET_KEY_COLUMNS = ("genre", "year", "codec", "bitrate_band")
+# faset -> (başlık, özet tablodaki ifade, tracks üzerindeki ifade)
+LIBRARY_FACETS = {
+    "genre": ("Tür", "genre", "COALESCE(genre, '')"),
+    "decade": ("On Yıl", "year / 10 * 10", "COALESCE(year, 0) / 10 * 10"),
+    "year": ("Yıl", "year", "COALESCE(year, 0)"),
+    "codec": ("Biçim", "codec", "COALESCE(codec, '')"),
+    "bitrate": ("Bit Hızı", "bitrate_band", _bitrate_band_sql("bitrate")),
+}
+# Faset listelerinin sırası: yıllar yeniden eskiye, diğerleri çoktan aza
+_FACET_ORDER = {"decade": "1 DESC", "year": "1 DESC", "bitrate": "1 DESC"}
+
+
+def _facet_track_clause(facet: str, value) -> tuple:
+    """Seçili faset değeri için tracks koşulu; bilinen değerler indeksli sütuna gider."""
+    if value and facet == "decade":
+        return "year >= ? AND year < ?", [value, value + 10]
+    if value and facet in ("genre", "year", "codec"):
+        return f"{facet} = ?", [value]
+    return f"{LIBRARY_FACETS[facet][2]} = ?", [value]
+
+
+def tr_lower(text: str) -> str:
+    """Türkçe küçük harf: I -> ı, İ -> i."""
+    return (text or "").replace("I", "ı").replace("İ", "i").lower()
+
+
+def fold_text(text: str) -> str:
+    """Arama için katlama: büyük/küçük harf, aksan ve Türkçe harf farkı yok sayılır."""
+    decomposed = unicodedata.normalize("NFKD", tr_lower(text).translate(_TR_FOLD))
+    return " ".join("".join(c for c in decomposed if not unicodedata.combining(c)).split())
+
+
+def sort_key(text: str) -> str:
+    """
+    Türkçe alfabe sırasına göre sıralama anahtarı. Baştaki İngilizce
+    tanımlık ("The Beatles") atılır, noktalama yok sayılır, yabancı
+    aksanlı harfler temel harfin yerine sıralanır.
+    """
+    lowered = " ".join(tr_lower(text).split())
+    for article in SORT_ARTICLES:
+        if lowered.startswith(article) and len(lowered) > len(article):
+            lowered = lowered[len(article):]
+            break
+    key = []
+    for ch in lowered:
+        if ch in _TR_SORT_RANK:
+            key.append(_TR_SORT_RANK[ch])
+            continue
+        for base in unicodedata.normalize("NFKD", ch):
+            if base in _TR_SORT_RANK:
+                key.append(_TR_SORT_RANK[base])
+            elif base == " " or (base.isalnum() and not unicodedata.combining(base)):
+                key.append(base)
+    return "".join(key)
+
+
+DB_STATEMENT_CACHE = 256   # bağlantı başına hazır (prepared) ifade önbelleği
+DB_WRITE_BATCH = 64        # yazıcının tek transaction'da birleştirdiği en fazla işlem
+LIBRARY_PRUNE_WORKERS = 16   # eşzamanlı stat (NFS/SMB gecikmesi örtüşsün)
+LIBRARY_PRUNE_BATCH = 500
+LIBRARY_VACUUM_PAGES = 2000  # bakım başına geri verilecek en fazla boş sayfa
+LIBRARY_MOVE_GRACE_MS = 10000  # kaybolan dosya, taşınmış olabilir diye bu kadar bekletilir
+
+
+def _open_db(db_file: str, readonly=False) -> sqlite3.Connection:
+    if readonly:
+        uri = f"file:{urllib.parse.quote(os.path.abspath(db_file))}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                               cached_statements=DB_STATEMENT_CACHE)
+    else:
+        conn = sqlite3.connect(db_file, check_same_thread=False,
+                               cached_statements=DB_STATEMENT_CACHE)
+    conn.execute("PRAGMA busy_timeout = 5000")
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+class LibraryEvents(QObject):
+    """Arka plan iş parçacıklarından GUI'ye kütüphane bildirimleri (kuyruklu bağlantı)."""
+
+    tracks_changed = pyqtSignal()
+    scan_finished = pyqtSignal(str, int, int)  # kök, okunan dosya, atlanan klasör
+    maintenance_finished = pyqtSignal(list, int, bool)  # silinenler, erişilemeyen, elle mi
+    watch_requested = pyqtSignal(list)    # izleyiciye eklenecek klasörler
+    unwatch_requested = pyqtSignal(list)  # izlemesi bırakılacak (silinen) klasörler
+    ingest_progress = pyqtSignal(int)     # canlı alımda kalan dosya (0: bitti)
+
+
+class _DbWriter(threading.Thread):
+    """
+    Tek yazar iş parçacığı. Kuyruktaki işlemler (bağlantı alan çağrılabilirler)
+    birleştirilip tek transaction'da yürütülür; her işlem kendi SAVEPOINT'inde
+    çalışır, hata veren yalnızca kendini geri alır. Future'lar COMMIT'ten sonra
+    tamamlanır, bekleyen okuyucu yazılanı görür. transactional=False işlemler
+    (VACUUM gibi) tek başına, transaction dışında çalışır.
+    """
+
+    def __init__(self, db_file: str, on_commit):
+        super().__init__(name="angolla-db-writer", daemon=True)
+        self.db_file = db_file
+        self.queue = queue.Queue()
+        self._on_commit = on_commit
+
+    def submit(self, op, touches_tracks=False, transactional=True) -> Future:
+        future = Future()
+        self.queue.put((op, touches_tracks, transactional, future))
+        return future
+
+    def stop(self):
+        self.queue.put(None)
+        self.join(timeout=5)
+
+    def run(self):
+        conn = _open_db(self.db_file)
+        conn.isolation_level = None  # transaction'ları burada yönetiyoruz
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        # INSERT OR REPLACE'ın sildiği satır için de faset tetikleyicisi çalışsın
+        conn.execute("PRAGMA recursive_triggers = ON")
+        stopping = False
+        carry = None
+        while not stopping:
+            item = carry if carry is not None else self.queue.get()
+            carry = None
+            if item is None:
+                break
+            if not item[2]:
+                self._run_standalone(conn, item)
+                continue
+            batch = [item]
+            while len(batch) < DB_WRITE_BATCH:
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                if not item[2]:
+                    carry = item
+                    break
+                batch.append(item)
+            self._run_batch(conn, batch)
+        conn.close()
+
+    def _run_standalone(self, conn, item):
+        op, touches_tracks, _, future = item
+        try:
+            result = op(conn)
+        except Exception as e:
+            future.set_exception(e)
+            return
+        future.set_result(result)
+        if touches_tracks:
+            self._on_commit()
+
+    def _run_batch(self, conn, batch):
+        outcomes = []
+        changed = False
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for op, touches_tracks, _, future in batch:
+                conn.execute("SAVEPOINT op")
+                try:
+                    result = op(conn)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO op")
+                    outcomes.append((future, None, e))
+                else:
+                    changed = changed or touches_tracks
+                    outcomes.append((future, result, None))
+                conn.execute("RELEASE op")
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            outcomes = [(future, None, e) for _, _, _, future in batch]
+            changed = False
+        for future, result, error in outcomes:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+        if changed:
+            self._on_commit()
+
+
 class LibraryManager:
-    """SQLite üzerinde parça bilgilerini tutan basit kütüphane yöneticisi."""
+    """
+    SQLite kütüphanesi (WAL). Yazmalar tek bir yazar iş parçacığının
+    kuyruğundan geçer; okumalar her iş parçacığının kendi salt-okunur
+    bağlantısıyla yapılır, böylece tarayıcı, izleyici ve arayüz
+    birbirini kilitlemez.
+    """
 
     def __init__(self, db_file=DB_FILE):
         self.db_file = db_file
-        self.conn = None
+        self.events = LibraryEvents()
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._writer = None
+        self._closed = False
         self._connect_db()
 
     def _connect_db(self):
-        self.conn = sqlite3.connect(self.db_file)
-        self.cursor = self.conn.cursor()
-        self._setup_db()
+        self._writer = _DbWriter(self.db_file, self.events.tracks_changed.emit)
+        self._writer.start()
+        self._write("setup", self._setup_db, wait=True)
+        self._write("backfill", self._backfill_browse_tables, wait=True, touches_tracks=True)
+        self._write("sort_keys", self._fill_sort_keys, wait=True, touches_tracks=True)
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = _open_db(self.db_file, readonly=True)
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def release_reader(self):
+        """Çağıran iş parçacığının okuyucu bağlantısını kapatır (iş parçacığı biterken)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            self._local.conn = None
+            with self._readers_lock:
+                if conn in self._readers:
+                    self._readers.remove(conn)
+            conn.close()
+
+    def _write(self, name: str, op, wait=False, touches_tracks=False, transactional=True):
+        """İşlemi yazar kuyruğuna koyar; wait=True ise COMMIT'i bekleyip sonucu döndürür."""
+        if self._closed:
+            # Kapanıştan sonra gelen geç yazma (tarama/bakım iş parçacığı)
+            # yazarı yeniden başlatmaz
+            if wait:
+                return None
+            future = Future()
+            future.set_exception(RuntimeError(f"kütüphane kapatıldı ({name})"))
+            return future
+        if self._writer is None:
+            self._connect_db()
+        future = self._writer.submit(op, touches_tracks, transactional)
+
+        def _report(done: Future):
+            error = done.exception()
+            if error is not None:
+                print(f"Veritabanı hatası ({name}): {error}")
+
+        future.add_done_callback(_report)
+        if wait:
+            try:
+                return future.result()
+            except Exception:
+                return None
+        return future
+
+    def flush(self):
+        """Kuyruktaki tüm yazmalar işlenene kadar bekler."""
+        self._write("flush", lambda conn: None, wait=True)
 
-    def _setup_db(self):
-        self.cursor.execute("""
+    def _setup_db(self, conn):
+        conn.execute("""
             CREATE TABLE IF NOT EXISTS tracks (
                 id INTEGER PRIMARY KEY,
                 path TEXT UNIQUE,
@@ -90,41 +507,1060 @@ class LibraryManager:
                 last_scanned REAL
             )
         """)
-        self.conn.commit()
+        self._migrate_track_columns(conn)
+        # Artımlı tarama için klasör ağacı: mtime değişmeyen klasör listelenmez
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS directories (
+                path TEXT PRIMARY KEY,
+                parent TEXT,
+                mtime_ns INTEGER,
+                entry_count INTEGER
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_directories_parent ON directories(parent)"
+        )
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS eq_presets (
+                name TEXT PRIMARY KEY,
+                bands TEXT
+            )
+        """)
+        # Gözatma ağacı: sanatçı -> albüm -> parça, toplamlar önceden hesaplı
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS artists (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE,
+                album_count INTEGER NOT NULL DEFAULT 0,
+                track_count INTEGER NOT NULL DEFAULT 0,
+                total_duration INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS albums (
+                id INTEGER PRIMARY KEY,
+                artist_id INTEGER NOT NULL REFERENCES artists(id) ON DELETE CASCADE,
+                title TEXT NOT NULL,
+                year INTEGER,
+                track_count INTEGER NOT NULL DEFAULT 0,
+                total_duration INTEGER NOT NULL DEFAULT 0,
+                UNIQUE (artist_id, title)
+            )
+        """)
+        if "album_id" not in {row[1] for row in conn.execute("PRAGMA table_info(tracks)")}:
+            conn.execute(
+                "ALTER TABLE tracks ADD COLUMN album_id INTEGER "
+                "REFERENCES albums(id) ON DELETE SET NULL"
+            )
+        self._migrate_sort_columns(conn)
+        self._setup_facet_counts(conn)
+        # Albüm sıralaması ve teknik filtreler indeksten karşılanır
+        for name, columns in TRACK_INDEXES.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON tracks({columns})")
+
+    def _backfill_browse_tables(self, conn):
+        """Albüme bağlanmamış parçaları (eski veritabanı) sanatçı/albüm tablolarına işler."""
+        if conn.execute("SELECT 1 FROM tracks WHERE album_id IS NULL LIMIT 1").fetchone() is None:
+            return
+        conn.execute(
+            f"INSERT OR IGNORE INTO artists (name) "
+            f"SELECT DISTINCT {GROUP_ARTIST_SQL} FROM tracks WHERE album_id IS NULL"
+        )
+        conn.execute(
+            f"INSERT OR IGNORE INTO albums (artist_id, title) "
+            f"SELECT DISTINCT ar.id, {GROUP_ALBUM_SQL} FROM tracks "
+            f"JOIN artists ar ON ar.name = {GROUP_ARTIST_SQL} WHERE album_id IS NULL"
+        )
+        conn.execute(
+            f"UPDATE tracks SET album_id = ("
+            f"  SELECT al.id FROM albums al JOIN artists ar ON ar.id = al.artist_id"
+            f"  WHERE ar.name = {GROUP_ARTIST_SQL} AND al.title = {GROUP_ALBUM_SQL}"
+            f") WHERE album_id IS NULL"
+        )
+        self._refresh_aggregates(conn, None)
+
+    @staticmethod
+    def _album_id(conn, artist: str, album: str, cache: Dict[tuple, int]) -> int:
+        key = (artist, album)
+        if key not in cache:
+            conn.execute(
+                "INSERT OR IGNORE INTO artists (name, sort_name) VALUES (?, ?)",
+                (artist, sort_key(artist))
+            )
+            artist_id = conn.execute(
+                "SELECT id FROM artists WHERE name = ?", (artist,)
+            ).fetchone()[0]
+            conn.execute(
+                "INSERT OR IGNORE INTO albums (artist_id, title, sort_title) VALUES (?, ?, ?)",
+                (artist_id, album, sort_key(album))
+            )
+            cache[key] = conn.execute(
+                "SELECT id FROM albums WHERE artist_id = ? AND title = ?", (artist_id, album)
+            ).fetchone()[0]
+        return cache[key]
+
+    @staticmethod
+    def _album_ids_for_paths(conn, paths: List[str]) -> set:
+        ids = set()
+        for start in range(0, len(paths), 500):
+            chunk = paths[start:start + 500]
+            ids.update(
+                row[0] for row in conn.execute(
+                    f"SELECT DISTINCT album_id FROM tracks WHERE path IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ) if row[0] is not None
+            )
+        return ids
+
+    @staticmethod
+    def _refresh_aggregates(conn, album_ids: Optional[set]):
+        """
+        Albüm ve sanatçı toplamlarını (parça sayısı, süre, yıl) günceller;
+        boşalan albüm ve sanatçıları siler. None: tümü.
+        """
+        if album_ids is None:
+            chunks = [None]
+        else:
+            ids = list(album_ids)
+            chunks = [ids[start:start + 500] for start in range(0, len(ids), 500)]
+        artist_ids = set()
+        for chunk in chunks:
+            if chunk is None:
+                where, args = "", []
+            else:
+                where, args = f"WHERE id IN ({','.join('?' * len(chunk))})", chunk
+            artist_ids.update(row[0] for row in conn.execute(
+                f"SELECT DISTINCT artist_id FROM albums {where}", args
+            ))
+            conn.execute(f"""
+                UPDATE albums SET
+                    track_count = (SELECT COUNT(*) FROM tracks WHERE album_id = albums.id),
+                    total_duration = (SELECT COALESCE(SUM(duration), 0) FROM tracks
+                                      WHERE album_id = albums.id),
+                    year = (SELECT MIN(year) FROM tracks WHERE album_id = albums.id)
+                {where}
+            """, args)
+            conn.execute(
+                f"DELETE FROM albums {where} {'AND' if where else 'WHERE'} track_count = 0", args
+            )
+        artist_ids = list(artist_ids)
+        for start in range(0, len(artist_ids), 500):
+            chunk = artist_ids[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            conn.execute(f"""
+                UPDATE artists SET
+                    album_count = (SELECT COUNT(*) FROM albums WHERE artist_id = artists.id),
+                    track_count = (SELECT COALESCE(SUM(track_count), 0) FROM albums
+                                   WHERE artist_id = artists.id),
+                    total_duration = (SELECT COALESCE(SUM(total_duration), 0) FROM albums
+                                      WHERE artist_id = artists.id)
+                WHERE id IN ({marks})
+            """, chunk)
+            conn.execute(
+                f"DELETE FROM artists WHERE id IN ({marks}) AND album_count = 0", chunk
+            )
+
+    @staticmethod
+    def _migrate_sort_columns(conn):
+        """Sıralama/arama sütunlarını ekler; değerleri _fill_sort_keys doldurur."""
+        for table, columns in (("tracks", TRACK_SORT_COLUMNS),
+                               ("artists", (("sort_name", "TEXT"),)),
+                               ("albums", (("sort_title", "TEXT"),))):
+            existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+            for name, kind in columns:
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {kind}")
+        conn.execute("DROP INDEX IF EXISTS idx_albums_artist")
+        # Albüm çalma sırası album_id üzerinden gelir (get_album_paths)
+        conn.execute("DROP INDEX IF EXISTS idx_tracks_album_order")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_albums_artist_sort ON albums(artist_id, year, sort_title)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_artists_sort ON artists(sort_name)")
+
+    @staticmethod
+    def _setup_facet_counts(conn):
+        """Faset özet tablosu ve tetikleyicileri; tablo yeni kurulduysa bir kez doldurulur."""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'facet_counts'"
+        ).fetchone()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS facet_counts (
+                genre TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                codec TEXT NOT NULL,
+                bitrate_band INTEGER NOT NULL,
+                track_count INTEGER NOT NULL,
+                PRIMARY KEY (genre, year, codec, bitrate_band)
+            ) WITHOUT ROWID
+        """)
+        keys = ", ".join(FACET_KEY_COLUMNS)
+
+        def values(row=""):
+            return (f"COALESCE({row}genre, '')", f"COALESCE({row}year, 0)",
+                    f"COALESCE({row}codec, '')", _bitrate_band_sql(f"{row}bitrate"))
+
+        def match(row):
+            return " AND ".join(f"{col} = {expr}" for col, expr in zip(FACET_KEY_COLUMNS, values(row)))
+
+        # OR IGNORE yazılmaz: tetikleyicide dıştaki INSERT OR REPLACE'ın çakışma
+        # kuralı geçerli olur ve satır sıfırlanırdı
+        add = (f"INSERT INTO facet_counts ({keys}, track_count) "
+               f"SELECT {', '.join(values('NEW.'))}, 0 "
+               f"WHERE NOT EXISTS (SELECT 1 FROM facet_counts WHERE {match('NEW.')});"
+               f" UPDATE facet_counts SET track_count = track_count + 1 WHERE {match('NEW.')};")
+        drop = (f"UPDATE facet_counts SET track_count = track_count - 1 WHERE {match('OLD.')};"
+                f" DELETE FROM facet_counts WHERE {match('OLD.')} AND track_count <= 0;")
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS trg_facets_insert AFTER INSERT ON tracks "
+                     f"BEGIN {add} END")
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS trg_facets_delete AFTER DELETE ON tracks "
+                     f"BEGIN {drop} END")
+        conn.execute(f"CREATE TRIGGER IF NOT EXISTS trg_facets_update "
+                     f"AFTER UPDATE OF genre, year, codec, bitrate ON tracks BEGIN {drop} {add} END")
+        if not exists:
+            conn.execute(
+                f"INSERT INTO facet_counts ({keys}, track_count) "
+                f"SELECT {', '.join(values())}, COUNT(*) "
+                f"FROM tracks GROUP BY 1, 2, 3, 4"
+            )
 
-    def add_track(self, path: str, tags: Dict[str, Any]):
-        if not self.conn:
-            self._connect_db()
+    @staticmethod
+    def _fill_sort_keys(conn):
+        """Anahtarı olmayan satırları (eski veritabanı, SQL ile eklenenler) doldurur."""
+        rows = conn.execute(
+            "SELECT id, title, artist, album, albumartist FROM tracks WHERE search_text IS NULL"
+        ).fetchall()
+        conn.executemany(
+            "UPDATE tracks SET title_sort = ?, artist_sort = ?, album_sort = ?, search_text = ? "
+            "WHERE id = ?",
+            [LibraryManager._sort_values(*row[1:]) + (row[0],) for row in rows]
+        )
+        conn.executemany("UPDATE artists SET sort_name = ? WHERE id = ?", [
+            (sort_key(name), artist_id) for artist_id, name in
+            conn.execute("SELECT id, name FROM artists WHERE sort_name IS NULL").fetchall()
+        ])
+        conn.executemany("UPDATE albums SET sort_title = ? WHERE id = ?", [
+            (sort_key(title), album_id) for album_id, title in
+            conn.execute("SELECT id, title FROM albums WHERE sort_title IS NULL").fetchall()
+        ])
+
+    @staticmethod
+    def _sort_values(title, artist, album, albumartist) -> tuple:
+        """TRACK_SORT_COLUMNS sırasıyla değerler."""
+        return (
+            sort_key(title),
+            sort_key(artist),
+            sort_key(album),
+            fold_text(" ".join(filter(None, (title, artist, album, albumartist)))),
+        )
+
+    @staticmethod
+    def _migrate_track_columns(conn):
+        """Eski veritabanına eksik sütunları ekler ve kütüphaneyi yeniden okumaya işaretler."""
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(tracks)")}
+        missing = [(name, kind) for name, kind in TRACK_EXTRA_COLUMNS if name not in existing]
+        if not missing:
+            return
+        for name, kind in missing:
+            conn.execute(f"ALTER TABLE tracks ADD COLUMN {name} {kind}")
+        if all(name in TRACK_DERIVED_COLUMNS for name, _ in missing):
+            return  # imzalar arka planda doldurulur (fill_signatures)
+        # Yeni alanlar dosyalardan doldurulsun: sonraki tarama her şeyi okur
+        conn.execute("UPDATE tracks SET last_scanned = 0")
+        conn.execute("DROP TABLE IF EXISTS directories")
+
+    @staticmethod
+    def _track_row(path: str, tags: Dict[str, Any], scanned: float) -> tuple:
+        title = tags.get("title", os.path.basename(path))
+        artist = tags.get("artist", "Bilinmeyen Sanatçı")
+        album = tags.get("album", "Bilinmeyen Albüm")
+        return (
+            (path, title, artist, album, tags.get("duration", 0), scanned)
+            + tuple(tags.get(name) for name, _ in TRACK_EXTRA_COLUMNS)
+            + LibraryManager._sort_values(title, artist, album, tags.get("albumartist"))
+        )
+
+    # --- yazmalar (yazar kuyruğu) ---
+    def add_track(self, path: str, tags: Dict[str, Any], wait=False):
+        return self.add_tracks([(path, tags)], wait=wait)
+
+    def add_tracks(self, items: List[tuple], wait=False):
+        """(path, tags) listesini tek işlemde yazar."""
+        if not items:
+            return None
+        items = list(items)
+        now = time.time()
+        columns = (TRACK_BASE_COLUMNS + tuple(name for name, _ in TRACK_EXTRA_COLUMNS)
+                   + tuple(name for name, _ in TRACK_SORT_COLUMNS) + ("album_id",))
+        sql = (f"INSERT OR REPLACE INTO tracks ({', '.join(columns)}) "
+               f"VALUES ({', '.join('?' * len(columns))})")
+
+        def op(conn):
+            # Parçanın eski albümü de yeniden sayılmalı (etiket değişmiş olabilir)
+            touched = self._album_ids_for_paths(conn, [path for path, _ in items])
+            cache: Dict[tuple, int] = {}
+            rows = []
+            for path, tags in items:
+                album_id = self._album_id(
+                    conn,
+                    tags.get("albumartist") or tags.get("artist") or "Bilinmeyen Sanatçı",
+                    tags.get("album") or "Bilinmeyen Albüm",
+                    cache
+                )
+                rows.append(self._track_row(path, tags, now) + (album_id,))
+            conn.executemany(sql, rows)
+            self._refresh_aggregates(conn, touched | set(cache.values()))
+
+        return self._write("add_tracks", op, wait=wait, touches_tracks=True)
+
+    def remove_tracks(self, paths: List[str], wait=False):
+        if not paths:
+            return None
+        paths = list(paths)
+
+        def op(conn):
+            touched = self._album_ids_for_paths(conn, paths)
+            conn.executemany("DELETE FROM tracks WHERE path = ?", [(p,) for p in paths])
+            self._refresh_aggregates(conn, touched)
+
+        return self._write("remove_tracks", op, wait=wait, touches_tracks=True)
+
+    def move_tracks(self, moves: List[tuple], wait=False):
+        """
+        (eski, yeni) yol çiftleri: satır (id, etiketler, albüm) korunur, yalnızca
+        yol değişir. Yeni yol zaten eklenmişse (oluşturma olayı silmeden önce
+        gelmiş) o kopya kaldırılır, eski satır yerine geçer.
+        """
+        if not moves:
+            return None
+        now = time.time()
+        moves = list(moves)
+
+        def op(conn):
+            touched = self._album_ids_for_paths(conn, [new for _, new in moves])
+            conn.executemany(
+                "DELETE FROM tracks WHERE path = ? AND EXISTS (SELECT 1 FROM tracks WHERE path = ?)",
+                [(new, old) for old, new in moves]
+            )
+            conn.executemany(
+                "UPDATE OR IGNORE tracks SET path = ?, last_scanned = ? WHERE path = ?",
+                [(new, now, old) for old, new in moves]
+            )
+            self._refresh_aggregates(conn, touched)
+
+        return self._write("move_tracks", op, wait=wait, touches_tracks=True)
+
+    def fill_signatures(self, rows: List[tuple], wait=False):
+        """(imza, yol) çiftleri; imzası olmayan eski kayıtlar için."""
+        if not rows:
+            return None
+        rows = list(rows)
+        return self._write("fill_signatures", lambda conn: conn.executemany(
+            "UPDATE tracks SET signature = ? WHERE path = ?", rows
+        ), wait=wait)
+
+    def save_dir_states(self, rows: List[tuple], wait=False):
+        """(path, parent, mtime_ns, entry_count) satırlarını tek işlemde yazar."""
+        if not rows:
+            return None
+        rows = list(rows)
+        return self._write("save_dir_states", lambda conn: conn.executemany(
+            "INSERT OR REPLACE INTO directories "
+            "(path, parent, mtime_ns, entry_count) VALUES (?, ?, ?, ?)",
+            rows
+        ), wait=wait)
+
+    def remove_dirs(self, folders: List[str], wait=False):
+        """Silinen klasörleri, alt ağaçlarını ve içindeki parçaları kaldırır."""
+        if not folders:
+            return None
+        folders = list(folders)
+
+        def op(conn):
+            touched = set()
+            for folder in folders:
+                prefix = folder.rstrip(os.sep) + os.sep
+                upper = prefix[:-1] + chr(ord(os.sep) + 1)
+                conn.execute(
+                    "DELETE FROM directories WHERE path = ? OR (path >= ? AND path < ?)",
+                    (folder, prefix, upper)
+                )
+                touched.update(row[0] for row in conn.execute(
+                    "SELECT DISTINCT album_id FROM tracks WHERE path >= ? AND path < ?",
+                    (prefix, upper)
+                ) if row[0] is not None)
+                conn.execute("DELETE FROM tracks WHERE path >= ? AND path < ?", (prefix, upper))
+            self._refresh_aggregates(conn, touched)
+
+        return self._write("remove_dirs", op, wait=wait, touches_tracks=True)
+
+    def save_eq_preset(self, name: str, amps_db: List[float]):
+        bands = ",".join(f"{db:.2f}" for db in amps_db)
+        self._write("save_eq_preset", lambda conn: conn.execute(
+            "INSERT OR REPLACE INTO eq_presets (name, bands) VALUES (?, ?)", (name, bands)
+        ))
+
+    def delete_eq_preset(self, name: str):
+        self._write("delete_eq_preset", lambda conn: conn.execute(
+            "DELETE FROM eq_presets WHERE name = ?", (name,)
+        ))
+
+    # --- bakım ---
+    def prune_missing(self, roots: List[str]) -> tuple:
+        """
+        Diskte olmayan parçaları paralel stat ile bulur, toplu halde siler.
+        Erişilemeyen kökün (bağlı olmayan ağ paylaşımı / harici disk) altındaki
+        parçalara dokunulmaz: boş kalmış bağlama noktası klasörü de erişilemez
+        sayılır, altındaki parçaların tümü kayıpsa kök yine silinmez. Kök
+        dışındaki bir parça ancak klasörü hâlâ duruyorsa silinir.
+        Dönüş: (silinen yollar, erişilemeyen sayısı).
+        """
+        prefixes = [(root, root.rstrip(os.sep) + os.sep) for root in roots]
+
+        def root_of(path: str) -> Optional[str]:
+            return next((root for root, prefix in prefixes if path.startswith(prefix)), None)
+
+        def online(root: str) -> bool:
+            try:
+                with os.scandir(root) as entries:
+                    return next(entries, None) is not None
+            except OSError:
+                return False
+
+        totals: Dict[str, int] = {}
+        pending: Dict[str, List[str]] = {}
+        removed, unreachable = [], 0
+        with ThreadPoolExecutor(max_workers=LIBRARY_PRUNE_WORKERS,
+                                thread_name_prefix="angolla-prune") as pool:
+            for batch in self.iter_track_paths(LIBRARY_PRUNE_BATCH):
+                gone = []
+                for path, ok in zip(batch, pool.map(os.path.exists, batch)):
+                    root = root_of(path)
+                    if root is not None:
+                        totals[root] = totals.get(root, 0) + 1
+                        if not ok:
+                            pending.setdefault(root, []).append(path)
+                    elif not ok:
+                        if os.path.isdir(os.path.dirname(path)):
+                            gone.append(path)
+                        else:
+                            unreachable += 1
+                self.remove_tracks(gone)
+                removed.extend(gone)
+
+        # Kök altındakiler ancak kök erişilebilir ve parçalarından bir kısmı
+        # hâlâ yerindeyse silinir
+        for root, paths in pending.items():
+            if len(paths) >= totals[root] or not online(root):
+                unreachable += len(paths)
+                continue
+            for start in range(0, len(paths), LIBRARY_PRUNE_BATCH):
+                self.remove_tracks(paths[start:start + LIBRARY_PRUNE_BATCH])
+            removed.extend(paths)
+        return removed, unreachable
+
+    def optimize(self):
+        """
+        ANALYZE ve artımlı VACUUM. Eski veritabanı auto_vacuum=INCREMENTAL'a
+        bir kez tam VACUUM ile geçirilir. Dönüş: geri verilen sayfa sayısı.
+        """
+        def op(conn):
+            conn.execute("ANALYZE")
+            free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("VACUUM")
+            else:
+                # Her adım bir sayfa bırakır; execute tek adım attığı için executescript
+                conn.executescript(f"PRAGMA incremental_vacuum({LIBRARY_VACUUM_PAGES});")
+            return free_before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+        return self._write("optimize", op, wait=True, transactional=False)
+
+    # --- okumalar (iş parçacığı başına bağlantı) ---
+    def iter_track_paths(self, batch_size: int):
+        """Parça yollarını id sırasıyla sayfa sayfa verir (anahtar kümesi sayfalama)."""
+        conn = self._reader()
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, path FROM tracks WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [path for _, path in rows]
+
+    def get_signatures(self, paths: List[str]) -> Dict[str, Optional[str]]:
+        """Veritabanında bulunan yolların içerik imzaları (imzasız kayıt: None)."""
+        conn = self._reader()
+        result: Dict[str, Optional[str]] = {}
+        for start in range(0, len(paths), 500):
+            chunk = paths[start:start + 500]
+            result.update(conn.execute(
+                f"SELECT path, signature FROM tracks WHERE path IN ({','.join('?' * len(chunk))})",
+                chunk
+            ).fetchall())
+        return result
+
+    def iter_unsigned_paths(self, batch_size: int):
+        """İmzası olmayan parçaların yolları, id sırasıyla sayfa sayfa."""
+        conn = self._reader()
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                "SELECT id, path FROM tracks WHERE id > ? AND signature IS NULL "
+                "ORDER BY id LIMIT ?",
+                (last_id, batch_size)
+            ).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            yield [path for _, path in rows]
+
+    def get_paths_by_signature(self, signatures: List[str], since: float) -> Dict[str, List[str]]:
+        """since'ten sonra eklenmiş/taranmış parçalar, imzaya göre gruplu."""
+        conn = self._reader()
+        result: Dict[str, List[str]] = {}
+        for start in range(0, len(signatures), 500):
+            chunk = signatures[start:start + 500]
+            for signature, path in conn.execute(
+                f"SELECT signature, path FROM tracks "
+                f"WHERE signature IN ({','.join('?' * len(chunk))}) AND last_scanned >= ?",
+                chunk + [since]
+            ):
+                result.setdefault(signature, []).append(path)
+        return result
+
+    def get_scan_times_under(self, folder: str, recursive=False) -> Dict[str, float]:
+        """
+        Klasör altındaki kayıtlı parçalar: yol -> last_scanned. Yol aralığı
+        sorgusu path üzerindeki UNIQUE indeksi kullanır.
+        """
+        prefix = folder.rstrip(os.sep) + os.sep
+        upper = prefix[:-1] + chr(ord(os.sep) + 1)
         try:
-            self.cursor.execute("""
-                INSERT OR REPLACE INTO tracks
-                (path, title, artist, album, duration, last_scanned)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                path,
-                tags.get("title", os.path.basename(path)),
-                tags.get("artist", "Bilinmeyen Sanatçı"),
-                tags.get("album", "Bilinmeyen Albüm"),
-                tags.get("duration", 0),
-                time.time()
-            ))
-            self.conn.commit()
+            rows = self._reader().execute(
+                "SELECT path, last_scanned FROM tracks WHERE path >= ? AND path < ?",
+                (prefix, upper)
+            ).fetchall()
         except Exception as e:
-            print(f"Veritabanı hatası (add_track): {e}")
+            print(f"Veritabanı hatası (get_scan_times_under): {e}")
+            return {}
+        if recursive:
+            return {path: scanned or 0.0 for path, scanned in rows}
+        return {
+            path: scanned or 0.0 for path, scanned in rows
+            if os.sep not in path[len(prefix):]
+        }
 
-    def get_all_tracks(self):
-        if not self.conn:
-            self._connect_db()
-        self.cursor.execute(
-            "SELECT path, title, artist, album, duration "
-            "FROM tracks ORDER BY artist, album, title"
-        )
-        return self.cursor.fetchall()
+    def get_dir_states_under(self, folder: str) -> Dict[str, tuple]:
+        """Klasör ve alt ağacının kayıtlı durumu: yol -> (üst, mtime_ns, girdi sayısı)."""
+        folder = folder.rstrip(os.sep) or os.sep
+        prefix = folder.rstrip(os.sep) + os.sep
+        upper = prefix[:-1] + chr(ord(os.sep) + 1)
+        try:
+            rows = self._reader().execute(
+                "SELECT path, parent, mtime_ns, entry_count FROM directories "
+                "WHERE path = ? OR (path >= ? AND path < ?)",
+                (folder, prefix, upper)
+            ).fetchall()
+        except Exception as e:
+            print(f"Veritabanı hatası (get_dir_states_under): {e}")
+            return {}
+        return {path: (parent, mtime_ns, count) for path, parent, mtime_ns, count in rows}
+
+    def get_all_tracks(self, query: str = "", order: str = "artist", descending=False,
+                       facets: Optional[Dict[str, Any]] = None):
+        """
+        Düz liste: (path, title, artist, album, duration). Sıralama önceden
+        hesaplanmış anahtarlarla (LIBRARY_SORT_ORDERS); sorgu katlanıp her
+        kelimesi search_text içinde aranır (büyük/küçük harf ve aksan duyarsız).
+        facets: LIBRARY_FACETS anahtarı -> seçili değer.
+        """
+        direction = " DESC" if descending else ""
+        order_sql = ", ".join(col + direction for col in LIBRARY_SORT_ORDERS[order])
+        terms = fold_text(query).split()
+        clauses = ["instr(search_text, ?) > 0" for _ in terms]
+        args: List[Any] = list(terms)
+        for facet, value in (facets or {}).items():
+            clause, values = _facet_track_clause(facet, value)
+            clauses.append(clause)
+            args.extend(values)
+        where = " AND ".join(clauses)
+        return self._reader().execute(
+            f"SELECT path, title, artist, album, duration FROM tracks "
+            f"{'WHERE ' + where if where else ''} ORDER BY {order_sql}", args
+        ).fetchall()
+
+    def get_facet_counts(self, facets: Optional[Dict[str, Any]] = None,
+                         query: str = "") -> Dict[str, List[tuple]]:
+        """
+        Her faset için [(değer, parça sayısı)]. Bir fasetin sayıları öteki
+        fasetlerin seçimiyle süzülür (kendi seçimi hariç), böylece seçim
+        değiştirilebilir kalır. Sorgu yoksa yalnızca facet_counts okunur;
+        arama metni varsa sayılar listeyle tutsun diye eşleşen parçalar tek
+        geçişte gruplanıp fasetler bu küçük özetten sayılır.
+        """
+        facets = facets or {}
+        terms = fold_text(query).split()
+        if terms:
+            return self._search_facet_counts(facets, terms)
+        conn = self._reader()
+        counts = {}
+        for facet, (_, expr, _) in LIBRARY_FACETS.items():
+            others = [(LIBRARY_FACETS[f][1], v) for f, v in facets.items() if f != facet]
+            where = " AND ".join(f"{other} = ?" for other, _ in others)
+            counts[facet] = conn.execute(
+                f"SELECT {expr}, SUM(track_count) FROM facet_counts "
+                f"{'WHERE ' + where if where else ''} GROUP BY 1 "
+                f"ORDER BY {_FACET_ORDER.get(facet, '2 DESC, 1')}",
+                [v for _, v in others]
+            ).fetchall()
+        return counts
+
+    def _search_facet_counts(self, facets: Dict[str, Any], terms: List[str]) -> Dict[str, List[tuple]]:
+        keys = ", ".join(LIBRARY_FACETS[f][2] for f in ("genre", "year", "codec", "bitrate"))
+        summary = self._reader().execute(
+            f"SELECT {keys}, COUNT(*) FROM tracks "
+            f"WHERE {' AND '.join('instr(search_text, ?) > 0' for _ in terms)} "
+            f"GROUP BY 1, 2, 3, 4", terms
+        ).fetchall()
+        value_of = {
+            "genre": lambda row: row[0],
+            "decade": lambda row: row[1] // 10 * 10,
+            "year": lambda row: row[1],
+            "codec": lambda row: row[2],
+            "bitrate": lambda row: row[3],
+        }
+        counts = {}
+        for facet in LIBRARY_FACETS:
+            others = [(value_of[f], v) for f, v in facets.items() if f != facet]
+            totals: Dict[Any, int] = {}
+            for row in summary:
+                if all(get(row) == v for get, v in others):
+                    value = value_of[facet](row)
+                    totals[value] = totals.get(value, 0) + row[4]
+            if facet in _FACET_ORDER:
+                counts[facet] = sorted(totals.items(), reverse=True)
+            else:
+                counts[facet] = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+        return counts
+
+    def get_browse_artists(self) -> List[tuple]:
+        """Ağacın üst düzeyi: (id, ad, albüm, parça, toplam süre); tek sorgu, birleştirme yok."""
+        return self._reader().execute(
+            "SELECT id, name, album_count, track_count, total_duration "
+            "FROM artists ORDER BY sort_name"
+        ).fetchall()
+
+    def get_browse_albums(self, artist_id: int) -> List[tuple]:
+        """(id, başlık, yıl, parça, toplam süre); idx_albums_artist_sort üzerinden."""
+        return self._reader().execute(
+            "SELECT id, title, year, track_count, total_duration "
+            "FROM albums WHERE artist_id = ? ORDER BY year, sort_title", (artist_id,)
+        ).fetchall()
+
+    def get_browse_tracks(self, album_id: int) -> List[tuple]:
+        """(path, title, artist, duration, tracknumber); idx_tracks_album_id üzerinden."""
+        return self._reader().execute(
+            "SELECT path, title, artist, duration, tracknumber FROM tracks "
+            "WHERE album_id = ? ORDER BY discnumber, tracknumber, title_sort", (album_id,)
+        ).fetchall()
+
+    def get_artist_paths(self, artist_id: int) -> List[str]:
+        return [row[0] for row in self._reader().execute(
+            "SELECT t.path FROM albums al JOIN tracks t ON t.album_id = al.id "
+            "WHERE al.artist_id = ? "
+            "ORDER BY al.year, al.sort_title, t.discnumber, t.tracknumber, t.title_sort",
+            (artist_id,)
+        )]
+
+    def get_album_paths(self, album_id: int) -> List[str]:
+        return [row[0] for row in self.get_browse_tracks(album_id)]
+
+    def get_tracks_by_paths(self, paths: List[str]) -> Dict[str, tuple]:
+        """Verilen yollar için kayıtlı (title, artist, album, duration) döndürür.
+
+        Sorgular SQLite değişken sınırına takılmamak için parçalara bölünür;
+        dosya okunmaz, yalnızca önbellekteki metaveri kullanılır.
+        """
+        result = {}
+        paths = list(paths)
+        conn = self._reader()
+        for start in range(0, len(paths), 500):
+            chunk = paths[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            try:
+                rows = conn.execute(
+                    "SELECT path, title, artist, album, duration "
+                    f"FROM tracks WHERE path IN ({marks})",
+                    chunk
+                ).fetchall()
+            except Exception as e:
+                print(f"Veritabanı hatası (get_tracks_by_paths): {e}")
+                break
+            for path, title, artist, album, duration in rows:
+                result[path] = (title, artist, album, duration)
+        return result
+
+    def get_genre(self, path: str) -> Optional[str]:
+        """Kayıtlı tür; parça kütüphanede yoksa None, türü boşsa ""."""
+        row = self._reader().execute(
+            "SELECT genre FROM tracks WHERE path = ?", (path,)
+        ).fetchone()
+        return None if row is None else (row[0] or "")
+
+    def get_eq_presets(self) -> Dict[str, List[float]]:
+        """Kullanıcı EQ ön ayarları: ad -> bant dB listesi."""
+        try:
+            rows = self._reader().execute(
+                "SELECT name, bands FROM eq_presets ORDER BY name"
+            ).fetchall()
+        except Exception as e:
+            print(f"Veritabanı hatası (get_eq_presets): {e}")
+            return {}
+        presets = {}
+        for name, bands in rows:
+            try:
+                presets[name] = [float(v) for v in bands.split(",")]
+            except (AttributeError, ValueError):
+                continue
+        return presets
 
     def close(self):
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+        """
+        Bekleyen yazmaları işler, yazarı durdurur ve okuyucu bağlantılarını
+        kapatır. Sonraki yazmalar reddedilir.
+        """
+        self._closed = True
+        if self._writer is not None:
+            self._writer.stop()
+            self._writer = None
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        self._local = threading.local()
+
+
+# ---------------------------------------------------------------------------
+# AYAR DEPOSU
+# ---------------------------------------------------------------------------
+
+_MISSING = object()
+
+
+class ConfigStore(QObject):
+    """
+    Tipli anahtarlar ve varsayılanlarla ayar deposu (dict gibi kullanılır).
+    Değişen değer kirli işaretlenir; kısa bir gecikmeden sonra tek seferde,
+    geçici dosya + rename ile atomik olarak JSON'a yazılır. Çıkışta flush().
+    """
+
+    SCHEMA = {
+        "volume": (int, 70),
+        "shuffle_mode": (bool, False),
+        "shuffle_spread": (bool, False),
+        "repeat_mode": (int, int(QMediaPlaylist.Sequential)),
+        "theme": (str, "AURA Mavi"),
+        "show_album_art": (bool, True),
+        "crossfade_duration": (int, 1000),
+        "preload_seconds": (int, 5),
+        "vis_mode": (str, "Çizgiler"),
+        "bar_color": (str, "#40C4FF"),
+        "bar_style": (str, "solid"),
+        "eq_gains": (list, [1.0] * 10),
+        "eq_preset": (str, None),
+        "eq_auto_genre": (bool, False),
+        "playback_backend": (str, DEFAULT_BACKEND),
+        "library_roots": (list, []),
+        "library_maintenance_at": (float, 0.0),
+    }
+
+    def __init__(self, path: str = CONFIG_FILE, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._values: Dict[str, Any] = {}
+        self._dirty = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(CONFIG_SAVE_DELAY_MS)
+        self._timer.timeout.connect(self.flush)
+        self.load()
+
+    def _coerce(self, key: str, value):
+        kind, default = self.SCHEMA.get(key, (None, None))
+        if kind is None or value is None:
+            return value
+        try:
+            if kind is list:
+                return [float(v) for v in value] if key == "eq_gains" else list(value)
+            return kind(value)
+        except (TypeError, ValueError):
+            print(f"Geçersiz ayar değeri ({key}): {value!r}")
+            return default
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            raw = self._migrate_legacy()
+        except (OSError, ValueError) as e:
+            print(f"Ayar okuma hatası: {e}")
+            raw = {}
+        self._values = {k: self._coerce(k, v) for k, v in raw.items()}
+
+    def _migrate_legacy(self) -> Dict[str, Any]:
+        """Eski sürümün QSettings içindeki pickle bloğunu bir kez taşır."""
+        settings = QSettings(SETTINGS_KEY, "AngollaPlayer")
+        raw = {}
+        try:
+            data = settings.value("config")
+            if data and isinstance(data, QByteArray):
+                raw = dict(pickle.loads(data.data()))
+            backend = settings.value("playback_backend")
+            if backend:
+                raw["playback_backend"] = backend
+        except Exception as e:
+            print(f"Eski ayarlar taşınamadı: {e}")
+            return {}
+        if raw:
+            self._values = {k: self._coerce(k, v) for k, v in raw.items()}
+            self._dirty = True
+            if self.flush():
+                settings.remove("config")
+                settings.remove("playback_backend")
+        return raw
+
+    def get(self, key: str, default=_MISSING):
+        if key in self._values:
+            return self._values[key]
+        if default is not _MISSING:
+            return default
+        default = self.SCHEMA.get(key, (None, None))[1]
+        # Şemadaki liste/sözlük varsayılanı paylaşılmasın: çağıran değiştirebilir
+        return type(default)(default) if isinstance(default, (list, dict)) else default
+
+    def __getitem__(self, key: str):
+        if key not in self._values and key not in self.SCHEMA:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __setitem__(self, key: str, value):
+        value = self._coerce(key, value)
+        if key in self._values and self._values[key] == value:
+            return
+        self._values[key] = value
+        self._dirty = True
+        self._timer.start()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._values
+
+    def pop(self, key: str, default=None):
+        if key not in self._values:
+            return default
+        self._dirty = True
+        self._timer.start()
+        return self._values.pop(key)
+
+    def flush(self) -> bool:
+        """Kirli ise atomik olarak yazar (yarım kalmış dosya oluşmaz)."""
+        self._timer.stop()
+        if not self._dirty:
+            return True
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._values, f, ensure_ascii=False, indent=2, sort_keys=True)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Ayar kaydetme hatası: {e}")
+            return False
+        self._dirty = False
+        return True
+
+
+# ---------------------------------------------------------------------------
+# ÇALMA LİSTESİ BİÇİMLERİ (M3U / M3U8 / PLS / XSPF)
+# ---------------------------------------------------------------------------
+# Okuyucular dosyayı satır satır (XSPF için iterparse ile) işler ve
+# (yol, etiketler) çiftleri üretir. Etiketler yalnızca listede yazan
+# bilgilerden gelir; ses dosyaları açılmaz.
+
+def _resolve_playlist_location(location: str, base_dir: str) -> Optional[str]:
+    """Liste içindeki konumu mutlak yerel yola çevirir (uzak URL'ler atlanır)."""
+    location = location.strip()
+    if not location:
+        return None
+    if location.lower().startswith("file:"):
+        parsed = urllib.parse.urlparse(location)
+        return os.path.normpath(urllib.parse.unquote(parsed.path))
+    if "://" in location:
+        return None
+    location = os.path.expanduser(location)
+    if not os.path.isabs(location):
+        location = os.path.join(base_dir, location)
+    return os.path.normpath(location)
+
+
+def _split_display_title(text: str) -> Dict[str, Any]:
+    """'Sanatçı - Başlık' biçimindeki metni etiket sözlüğüne ayırır."""
+    text = text.strip()
+    if " - " in text:
+        artist, title = text.split(" - ", 1)
+        return {"artist": artist.strip(), "title": title.strip()}
+    return {"title": text} if text else {}
+
+
+def iter_m3u(path: str):
+    base_dir = os.path.dirname(os.path.abspath(path))
+    pending = {}
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("#"):
+                if line.upper().startswith("#EXTINF:"):
+                    info = line[8:]
+                    length, _, text = info.partition(",")
+                    # "#EXTINF:123 tvg-id=..." gibi öznitelikleri at
+                    length = length.split()[0] if length.split() else "-1"
+                    pending = _split_display_title(text)
+                    try:
+                        seconds = float(length)
+                        if seconds > 0:
+                            pending["duration"] = int(seconds * 1000)
+                    except ValueError:
+                        pass
+                continue
+            resolved = _resolve_playlist_location(line, base_dir)
+            if resolved:
+                yield resolved, pending
+            pending = {}
+
+
+def iter_pls(path: str):
+    # Alanlar numaraya göre toplanır: PLS'de FileN/TitleN/LengthN sırası
+    # serbesttir (önce tüm File'lar, sonra Title'lar gelebilir)
+    base_dir = os.path.dirname(os.path.abspath(path))
+    entries: Dict[int, Dict[str, str]] = {}
+
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+        for line in f:
+            key, sep, value = line.strip().partition("=")
+            if not sep:
+                continue
+            lowered = key.lower()
+            for field in ("file", "title", "length"):
+                if lowered.startswith(field) and lowered[len(field):].isdigit():
+                    entries.setdefault(int(lowered[len(field):]), {})[field] = value
+                    break
+
+    for number in sorted(entries):
+        entry = entries[number]
+        resolved = _resolve_playlist_location(entry.get("file", ""), base_dir)
+        if not resolved:
+            continue
+        tags = _split_display_title(entry.get("title", ""))
+        try:
+            seconds = int(entry.get("length", "-1"))
+            if seconds > 0:
+                tags["duration"] = seconds * 1000
+        except ValueError:
+            pass
+        yield resolved, tags
+
+
+def iter_xspf(path: str):
+    base_dir = os.path.dirname(os.path.abspath(path))
+    for _, elem in ET.iterparse(path, events=("end",)):
+        if elem.tag.rsplit("}", 1)[-1] != "track":
+            continue
+        fields = {}
+        for child in elem:
+            fields[child.tag.rsplit("}", 1)[-1]] = (child.text or "").strip()
+        elem.clear()
+        resolved = _resolve_playlist_location(fields.get("location", ""), base_dir)
+        if not resolved:
+            continue
+        tags = {}
+        if fields.get("title"):
+            tags["title"] = fields["title"]
+        if fields.get("creator"):
+            tags["artist"] = fields["creator"]
+        if fields.get("album"):
+            tags["album"] = fields["album"]
+        if fields.get("duration", "").isdigit():
+            tags["duration"] = int(fields["duration"])
+        yield resolved, tags
+
+
+def iter_playlist_file(path: str):
+    """Uzantıya göre doğru okuyucuyu seçer."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".m3u", ".m3u8"):
+        return iter_m3u(path)
+    if ext == ".pls":
+        return iter_pls(path)
+    if ext == ".xspf":
+        return iter_xspf(path)
+    raise ValueError(f"Desteklenmeyen çalma listesi biçimi: {ext}")
+
+
+def _entry_label(track_path: str, tags: Dict[str, Any]) -> str:
+    title = tags.get("title") or os.path.basename(track_path)
+    artist = tags.get("artist")
+    return f"{artist} - {title}" if artist else title
+
+
+def write_playlist_file(path: str, entries):
+    """(yol, etiketler) çiftlerini uzantıya uygun biçimde akış halinde yazar."""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, "w", encoding="utf-8") as f:
+        if ext in (".m3u", ".m3u8"):
+            f.write("#EXTM3U\n")
+            for track_path, tags in entries:
+                seconds = int(tags.get("duration", 0) / 1000) or -1
+                f.write(f"#EXTINF:{seconds},{_entry_label(track_path, tags)}\n")
+                f.write(f"{track_path}\n")
+        elif ext == ".pls":
+            count = 0
+            f.write("[playlist]\n")
+            for track_path, tags in entries:
+                count += 1
+                seconds = int(tags.get("duration", 0) / 1000) or -1
+                f.write(f"File{count}={track_path}\n")
+                f.write(f"Title{count}={_entry_label(track_path, tags)}\n")
+                f.write(f"Length{count}={seconds}\n")
+            f.write(f"NumberOfEntries={count}\nVersion=2\n")
+        elif ext == ".xspf":
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write('<playlist version="1" xmlns="http://xspf.org/ns/0/">\n')
+            f.write("  <trackList>\n")
+            for track_path, tags in entries:
+                f.write("    <track>\n")
+                f.write(
+                    "      <location>"
+                    f"{xml_escape('file://' + urllib.parse.quote(track_path))}"
+                    "</location>\n"
+                )
+                for tag, key in (("title", "title"), ("creator", "artist"),
+                                 ("album", "album")):
+                    if tags.get(key):
+                        f.write(f"      <{tag}>{xml_escape(str(tags[key]))}</{tag}>\n")
+                if tags.get("duration"):
+                    f.write(f"      <duration>{int(tags['duration'])}</duration>\n")
+                f.write("    </track>\n")
+            f.write("  </trackList>\n</playlist>\n")
+        else:
+            raise ValueError(f"Desteklenmeyen çalma listesi biçimi: {ext}")
 
 
 # ---------------------------------------------------------------------------
@@ -132,15 +1568,28 @@ class LibraryManager:
 # ---------------------------------------------------------------------------
 
 class LibraryTableWidget(QTableWidget):
+    # Sıralama istemci tarafında yapılmaz: başlığa tıklanınca veritabanından
+    # önceden hesaplanmış anahtarlarla sıralı olarak yeniden yüklenir
+    SORT_ORDERS = ("title", "artist", "album", "duration")
+    sort_requested = pyqtSignal(str, bool)  # LIBRARY_SORT_ORDERS anahtarı, azalan mı
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setColumnCount(4)
         self.setHorizontalHeaderLabels(["Başlık", "Sanatçı", "Albüm", "Süre"])
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(1, Qt.AscendingOrder)
+        header.sortIndicatorChanged.connect(
+            lambda column, order: self.sort_requested.emit(
+                self.SORT_ORDERS[column], order == Qt.DescendingOrder
+            )
+        )
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.setSortingEnabled(True)
 
     def load_tracks(self, tracks: List):
         self.setRowCount(len(tracks))
@@ -168,12 +1617,1378 @@ class LibraryTableWidget(QTableWidget):
         return paths
 
 
-# ---------------------------------------------------------------------------
-# EKOLAYZIR
-# ---------------------------------------------------------------------------
+# Onluk sayının okunuşuna göre ek: 1990'lar, 1980'ler, 2000'ler
+_DECADE_SUFFIX = ("ler", "lar", "ler", "lar", "lar", "ler", "lar", "ler", "ler", "lar")
+
+
+def facet_label(facet: str, value) -> str:
+    if facet == "genre":
+        return value or "Bilinmeyen Tür"
+    if facet == "codec":
+        return value or "Bilinmeyen Biçim"
+    if facet == "bitrate":
+        if value < 0:
+            return "Bilinmiyor"
+        if value == 0:
+            return f"< {BITRATE_BANDS[-1]} kbps"
+        upper = [band for band in BITRATE_BANDS if band > value]
+        return f"{value}–{upper[-1] - 1} kbps" if upper else f"{value}+ kbps"
+    if not value:
+        return "Bilinmiyor"
+    if facet == "decade":
+        return f"{value}'{_DECADE_SUFFIX[value // 10 % 10]}"
+    return str(value)
+
+
+class LibraryFacetPane(QWidget):
+    """
+    Tür / on yıl / yıl / biçim / bit hızı süzgeç listeleri. Değerler parça
+    sayılarıyla gösterilir; tıklanan değer süzgece girer, yeniden tıklamak
+    ya da "Tümü" kaldırır. Sayılar dışarıdan (get_facet_counts) verilir.
+    """
+
+    filters_changed = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filters: Dict[str, Any] = {}
+        self._lists: Dict[str, QListWidget] = {}
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        for facet, (title, _, _) in LIBRARY_FACETS.items():
+            column = QVBoxLayout()
+            column.addWidget(QLabel(title))
+            view = QListWidget()
+            view.itemClicked.connect(lambda item, f=facet: self._on_item_clicked(f, item))
+            column.addWidget(view)
+            layout.addLayout(column)
+            self._lists[facet] = view
+        self.setMaximumHeight(180)
+
+    def set_counts(self, counts: Dict[str, List[tuple]]):
+        for facet, view in self._lists.items():
+            rows = counts.get(facet, [])
+            selected = self.filters.get(facet)
+            if selected is not None and selected not in {value for value, _ in rows}:
+                rows = [(selected, 0)] + rows
+            view.blockSignals(True)
+            view.clear()
+            view.addItem(f"Tümü ({sum(count for _, count in rows)})")
+            for value, count in rows:
+                item = QListWidgetItem(f"{facet_label(facet, value)} ({count})")
+                item.setData(Qt.UserRole, value)
+                view.addItem(item)
+                if value == selected:
+                    item.setSelected(True)
+            if selected is None:
+                view.item(0).setSelected(True)
+            view.blockSignals(False)
+
+    def clear_filters(self):
+        if self.filters:
+            self.filters.clear()
+            self.filters_changed.emit({})
+
+    def _on_item_clicked(self, facet: str, item: QListWidgetItem):
+        value = item.data(Qt.UserRole)
+        if value is None or self.filters.get(facet) == value:
+            self.filters.pop(facet, None)
+        else:
+            self.filters[facet] = value
+        self.filters_changed.emit(dict(self.filters))
+
+
+def _format_total(ms: int) -> str:
+    seconds = int(ms or 0) // 1000
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+
+class _LibraryNode:
+    __slots__ = ("kind", "key", "label", "parent", "children", "row", "count", "duration")
+
+    def __init__(self, kind, key, label, parent=None, row=0, count=0, duration=0):
+        self.kind = kind      # "root" | "artist" | "album" | "track"
+        self.key = key        # sanatçı/albüm id'si ya da parça yolu
+        self.label = label
+        self.parent = parent
+        self.children = None  # None: henüz sorgulanmadı
+        self.row = row
+        self.count = count
+        self.duration = duration
+
+
+class LibraryBrowseModel(QAbstractItemModel):
+    """
+    Sanatçı -> Albüm -> Parça gözatma ağacı. Açılışta yalnızca sanatçılar
+    (tek sorgu) okunur; bir düğümün çocukları düğüm genişletilince
+    sorgulanır. Sayılar ve süreler artists/albums tablolarında hazırdır.
+    """
+
+    COLUMNS = ("Ad", "Parça", "Süre")
+
+    def __init__(self, library: "LibraryManager", parent=None):
+        super().__init__(parent)
+        self.library = library
+        self._root = _LibraryNode("root", None, "")
+        self._artist_icon = QIcon.fromTheme("avatar-default")
+        self._album_icon = QIcon.fromTheme("media-optical")
+        self._track_icon = QIcon.fromTheme("audio-x-generic")
+
+    def reload(self):
+        self.beginResetModel()
+        self._root.children = None
+        self.endResetModel()
+
+    def refresh(self, is_expanded: Optional[Callable[[QModelIndex], bool]] = None):
+        """
+        Yüklü düğümleri veritabanıyla eşitler; modeli sıfırlamaz. Açık
+        düğümlerin çocukları yeniden sorgulanıp satır satır eklenir,
+        silinir ya da güncellenir; kapalı düğümlerin çocukları bırakılır
+        ve açıldıklarında yeniden sorgulanır. Ağaç açık kalır.
+        """
+        self._sync_children(self._root, QModelIndex(), is_expanded)
+
+    def _sync_children(self, node: _LibraryNode, parent: QModelIndex, is_expanded):
+        if node.children is None:
+            return
+        if node is not self._root and is_expanded is not None and not is_expanded(parent):
+            if node.children:
+                self.beginRemoveRows(parent, 0, len(node.children) - 1)
+                node.children = None
+                self.endRemoveRows()
+            else:
+                node.children = None
+            return
+
+        fresh = self._load_children(node)
+        children = node.children
+        fresh_keys = {child.key for child in fresh}
+
+        # Silinenler: ardışık bloklar halinde, sondan başa
+        row = len(children) - 1
+        while row >= 0:
+            if children[row].key in fresh_keys:
+                row -= 1
+                continue
+            last = row
+            while row > 0 and children[row - 1].key not in fresh_keys:
+                row -= 1
+            self.beginRemoveRows(parent, row, last)
+            del children[row:last + 1]
+            self._renumber(children, row)
+            self.endRemoveRows()
+            row -= 1
+
+        # Yeniler, yer değiştirenler ve sayısı/adı değişenler
+        old_keys = {child.key for child in children}
+        row = 0
+        while row < len(fresh):
+            item = fresh[row]
+            if item.key not in old_keys:
+                end = row + 1
+                while end < len(fresh) and fresh[end].key not in old_keys:
+                    end += 1
+                for child in fresh[row:end]:
+                    child.parent = node
+                self.beginInsertRows(parent, row, end - 1)
+                children[row:row] = fresh[row:end]
+                self._renumber(children, row)
+                self.endInsertRows()
+                row = end
+                continue
+
+            pos = next(i for i in range(row, len(children)) if children[i].key == item.key)
+            if pos != row:
+                self.beginMoveRows(parent, pos, pos, parent, row)
+                children.insert(row, children.pop(pos))
+                self._renumber(children, row, pos + 1)
+                self.endMoveRows()
+            current = children[row]
+            if (current.label, current.count, current.duration) != (
+                    item.label, item.count, item.duration):
+                current.label, current.count, current.duration = (
+                    item.label, item.count, item.duration
+                )
+                self.dataChanged.emit(
+                    self.index(row, 0, parent),
+                    self.index(row, len(self.COLUMNS) - 1, parent),
+                )
+            if current.children is not None:
+                self._sync_children(current, self.index(row, 0, parent), is_expanded)
+            row += 1
+
+    @staticmethod
+    def _renumber(children: List[_LibraryNode], start: int, stop: Optional[int] = None):
+        for row in range(start, len(children) if stop is None else stop):
+            children[row].row = row
+
+    def _load_children(self, node: _LibraryNode) -> List[_LibraryNode]:
+        if node.kind == "root":
+            return [
+                _LibraryNode("artist", artist_id, name, node, row, tracks, duration)
+                for row, (artist_id, name, _, tracks, duration)
+                in enumerate(self.library.get_browse_artists())
+            ]
+        if node.kind == "artist":
+            return [
+                _LibraryNode("album", album_id, f"{title} ({year})" if year else title,
+                             node, row, tracks, duration)
+                for row, (album_id, title, year, tracks, duration)
+                in enumerate(self.library.get_browse_albums(node.key))
+            ]
+        if node.kind == "album":
+            children = []
+            for row, (path, title, artist, duration, number) in enumerate(
+                    self.library.get_browse_tracks(node.key)):
+                label = f"{number:02d}. {title}" if number else title
+                if artist and artist != node.parent.label:
+                    label = f"{label} — {artist}"
+                children.append(_LibraryNode("track", path, label, node, row, 0, duration))
+            return children
+        return []
+
+    def _node(self, index: QModelIndex) -> _LibraryNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    # --- QAbstractItemModel ---
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if node.children is None or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index=None):
+        if index is None:
+            return QObject.parent(self)
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        children = self._node(parent).children
+        return len(children) if children else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._node(parent)
+        return node.kind != "track" and (node.children is None or bool(node.children))
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return node.kind != "track" and node.children is None
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if node.kind == "track" or node.children is not None:
+            return
+        children = self._load_children(node)
+        if children:
+            self.beginInsertRows(parent, 0, len(children) - 1)
+            node.children = children
+            self.endInsertRows()
+        else:
+            node.children = []
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return node.label
+            if column == 1:
+                return str(node.count) if node.kind != "track" else None
+            return _format_total(node.duration) if node.duration else None
+        if role == Qt.DecorationRole and column == 0:
+            return {"artist": self._artist_icon, "album": self._album_icon}.get(
+                node.kind, self._track_icon
+            )
+        if role == Qt.ToolTipRole and node.kind == "track":
+            return node.key
+        if role == Qt.TextAlignmentRole and column > 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def mimeTypes(self):
+        return ["text/uri-list"]
+
+    def mimeData(self, indexes):
+        mime = QMimeData()
+        mime.setUrls([QUrl.fromLocalFile(p) for p in self.paths_for_indexes(indexes)])
+        return mime
+
+    # --- yardımcılar ---
+    def track_path(self, index: QModelIndex) -> Optional[str]:
+        node = self._node(index)
+        return node.key if node.kind == "track" else None
+
+    def paths_for_indexes(self, indexes) -> List[str]:
+        """Seçili düğümlerin parça yolları; sanatçı/albüm için veritabanından."""
+        paths = []
+        seen = set()
+        for index in indexes:
+            node = self._node(index)
+            if node.kind == "artist":
+                node_paths = self.library.get_artist_paths(node.key)
+            elif node.kind == "album":
+                node_paths = self.library.get_album_paths(node.key)
+            elif node.kind == "track":
+                node_paths = [node.key]
+            else:
+                continue
+            for path in node_paths:
+                if path not in seen:
+                    seen.add(path)
+                    paths.append(path)
+        return paths
+
+
+# ---------------------------------------------------------------------------
+# HIZLI ETİKET OKUYUCU (TARAMA KİPİ)
+# ---------------------------------------------------------------------------
+
+SCAN_READ_LIMIT = 256 * 1024      # dosya başına okunacak en fazla bayt
+SCAN_FRAME_LIMIT = 64 * 1024      # bundan büyük metin çerçeveleri atlanır
+
+_ID3_FRAMES = {
+    b"TIT2": "title", b"TPE1": "artist", b"TALB": "album", b"TPE2": "albumartist",
+    b"TRCK": "tracknumber", b"TPOS": "discnumber", b"TDRC": "year", b"TYER": "year",
+    b"TCON": "genre",
+    b"TT2": "title", b"TP1": "artist", b"TAL": "album", b"TP2": "albumartist",
+    b"TRK": "tracknumber", b"TPA": "discnumber", b"TYE": "year", b"TCO": "genre",
+}
+_ID3_ENCODINGS = {0: "latin-1", 1: "utf-16", 2: "utf-16-be", 3: "utf-8"}
+_VORBIS_KEYS = {
+    "TITLE": "title", "ARTIST": "artist", "ALBUM": "album",
+    "ALBUMARTIST": "albumartist", "ALBUM ARTIST": "albumartist",
+    "TRACKNUMBER": "tracknumber", "DISCNUMBER": "discnumber",
+    "DATE": "year", "YEAR": "year", "GENRE": "genre",
+}
+_MP4_KEYS = {
+    b"\xa9nam": "title", b"\xa9ART": "artist", b"\xa9alb": "album",
+    b"aART": "albumartist", b"\xa9day": "year", b"\xa9gen": "genre",
+}
+_MP4_NUMBER_KEYS = {b"trkn": "tracknumber", b"disk": "discnumber"}
+_MP4_CODECS = {b"mp4a": "AAC", b"alac": "ALAC"}
+
+# MPEG Layer III bit hızları (kbps) ve örnekleme hızları
+_MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _leading_int(value) -> Optional[int]:
+    """"3/12" -> 3, "2003-05-01" -> 2003; sayı yoksa None."""
+    text = str(value).strip()
+    end = 0
+    while end < len(text) and text[end].isdigit():
+        end += 1
+    return int(text[:end]) if end else None
+
+
+def _id3_genre(text: str) -> str:
+    # ID3v1 sayısal türleri ("(17)", "17") Mutagen'in tablosuyla çözülür
+    if TCON and text and (text.isdigit() or text.startswith("(")):
+        genres = TCON.load()(encoding=3, text=[text]).genres
+        if genres:
+            return genres[0]
+    return text
+
+
+def _normalize_tags(tags: Dict[str, Any]) -> Dict[str, Any]:
+    """Her iki okuyucunun çıktısını veritabanı sütun türlerine getirir."""
+    for key in ("tracknumber", "discnumber", "year"):
+        if key in tags and not isinstance(tags[key], int):
+            tags[key] = _leading_int(tags[key])
+    for key in ("title", "artist", "album", "albumartist", "genre"):
+        if key in tags:
+            tags[key] = str(tags[key]).strip() or None
+    return {key: value for key, value in tags.items() if value is not None}
+
+
+def _mp4_codec_name(codec: str) -> str:
+    return "AAC" if codec.startswith("mp4a") else codec.upper()
+
+
+def read_full_tags(path: str) -> Dict[str, Any]:
+    """
+    Mutagen ile tek geçişte etiketler ve teknik bilgi: ID3, MP4 atomları ve
+    Vorbis yorumları (FLAC/Ogg). Okunamayan dosyada boş sözlük döner.
+    """
+    if not MutagenFile:
+        return {}
+    try:
+        audio = MutagenFile(path)
+    except Exception:
+        return {}
+    if not audio:
+        return {}
+
+    tags: Dict[str, Any] = {}
+    info = audio.info
+    if info is not None:
+        tags["duration"] = int(getattr(info, "length", 0) * 1000)
+        tags["bitrate"] = int(getattr(info, "bitrate", 0) or 0) // 1000 or None
+        tags["samplerate"] = getattr(info, "sample_rate", None)
+        tags["channels"] = getattr(info, "channels", None)
+        codec = getattr(info, "codec", None)
+        tags["codec"] = _mp4_codec_name(codec) if codec else {
+            "MP3": "MP3", "FLAC": "FLAC", "OggVorbis": "Vorbis",
+            "OggOpus": "Opus", "WAVE": "PCM",
+        }.get(type(audio).__name__, type(audio).__name__)
+
+    raw = audio.tags
+    try:
+        if raw is None:
+            pass
+        elif ID3 and isinstance(raw, ID3.load()):
+            for frame_id, key in _ID3_FRAMES.items():
+                frame = raw.get(frame_id.decode("latin-1"))
+                if frame is not None and frame.text and key not in tags:
+                    tags[key] = str(frame.text[0])
+            if "TCON" in raw and raw["TCON"].genres:
+                tags["genre"] = raw["TCON"].genres[0]
+        elif MP4 and isinstance(audio, MP4.load()):
+            for atom, key in _MP4_KEYS.items():
+                values = raw.get(atom.decode("latin-1"))
+                if values:
+                    tags[key] = str(values[0])
+            for atom, key in _MP4_NUMBER_KEYS.items():
+                values = raw.get(atom.decode("latin-1"))
+                if values and values[0][0]:
+                    tags[key] = values[0][0]
+        else:
+            # Vorbis yorumları: anahtarlar büyük/küçük harf duyarsız
+            for name, key in _VORBIS_KEYS.items():
+                values = raw.get(name)
+                if values and key not in tags:
+                    tags[key] = str(values[0])
+    except Exception:
+        pass
+    return _normalize_tags(tags)
+
+
+class _ScanBudgetExceeded(Exception):
+    pass
+
+
+class _BoundedReader:
+    """Okunan bayt sayısını sınırlayan dosya sarmalayıcı; seek bütçeden düşmez."""
+
+    def __init__(self, fh, limit: int):
+        self._fh = fh
+        self.remaining = limit
+
+    def read(self, n: int) -> bytes:
+        if n > self.remaining:
+            raise _ScanBudgetExceeded()
+        data = self._fh.read(n)
+        self.remaining -= len(data)
+        return data
+
+    def seek(self, pos: int, whence=0):
+        return self._fh.seek(pos, whence)
+
+    def tell(self) -> int:
+        return self._fh.tell()
+
+
+def _syncsafe(data: bytes) -> int:
+    return (data[0] << 21) | (data[1] << 14) | (data[2] << 7) | data[3]
+
+
+def _id3_text(body: bytes) -> str:
+    if not body:
+        return ""
+    codec = _ID3_ENCODINGS.get(body[0], "latin-1")
+    return body[1:].decode(codec, "replace").split("\x00")[0].strip()
+
+
+def _scan_id3v2(r: _BoundedReader, tags: Dict[str, Any]) -> int:
+    """ID3v2 metin çerçevelerini okur, diğerlerini atlar. Ses verisinin ofsetini döndürür."""
+    r.seek(0)
+    header = r.read(10)
+    if len(header) < 10 or header[:3] != b"ID3":
+        return 0
+    major, flags = header[3], header[5]
+    end = 10 + _syncsafe(header[6:10])
+    audio_start = end + (10 if flags & 0x10 else 0)
+    if flags & 0x80 and major < 4:
+        # Tüm etikete uygulanan unsync: çerçeveler güvenle okunamaz
+        raise ValueError("unsynchronised ID3 tag")
+
+    pos = 10
+    if flags & 0x40:
+        ext = r.read(4)
+        pos += _syncsafe(ext) if major >= 4 else 4 + int.from_bytes(ext, "big")
+
+    id_len, hdr_len = (3, 6) if major == 2 else (4, 10)
+    while pos + hdr_len <= end:
+        r.seek(pos)
+        fh = r.read(hdr_len)
+        frame_id = fh[:id_len]
+        if not frame_id.strip(b"\x00"):
+            break  # dolgu
+        if major == 2:
+            size = int.from_bytes(fh[3:6], "big")
+            encoded = False
+        elif major == 3:
+            size = int.from_bytes(fh[4:8], "big")
+            encoded = bool(fh[9] & 0xE0)  # sıkıştırma / şifreleme / gruplama
+        else:
+            size = _syncsafe(fh[4:8])
+            encoded = bool(fh[9] & 0x0F)
+        if size <= 0:
+            break
+        key = _ID3_FRAMES.get(frame_id)
+        if key and key not in tags and not encoded and size <= SCAN_FRAME_LIMIT:
+            tags[key] = _id3_text(r.read(size))
+        pos += hdr_len + size
+    return audio_start
+
+
+def _scan_mp3_stream(r: _BoundedReader, start: int, file_size: int) -> Dict[str, Any]:
+    """İlk çerçeveden akış bilgisi; süre Xing/Info/VBRI başlığından, yoksa CBR tahmini."""
+    r.seek(start)
+    buf = r.read(min(8192, max(0, file_size - start)))
+    i = 0
+    while i + 4 <= len(buf):
+        if buf[i] != 0xFF or buf[i + 1] & 0xE0 != 0xE0:
+            i += 1
+            continue
+        h = int.from_bytes(buf[i:i + 4], "big")
+        version = (h >> 19) & 3
+        layer = (h >> 17) & 3
+        br_index = (h >> 12) & 0xF
+        sr_index = (h >> 10) & 3
+        if version == 1 or layer != 1 or br_index in (0, 15) or sr_index == 3:
+            i += 1
+            continue
+        mpeg1 = version == 3
+        bitrate = _MP3_BITRATES[1 if mpeg1 else 2][br_index] * 1000
+        rate = _MP3_SAMPLE_RATES[version][sr_index]
+        samples = 1152 if mpeg1 else 576
+        mono = (h >> 6) & 3 == 3
+        side = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+
+        stream = {"samplerate": rate, "channels": 1 if mono else 2, "codec": "MP3"}
+        audio_bytes = file_size - start - i
+        frames = None
+        x = i + 4 + side
+        if buf[x:x + 4] in (b"Xing", b"Info") and int.from_bytes(buf[x + 4:x + 8], "big") & 1:
+            frames = int.from_bytes(buf[x + 8:x + 12], "big")
+        v = i + 36
+        if frames is None and buf[v:v + 4] == b"VBRI":
+            frames = int.from_bytes(buf[v + 14:v + 18], "big")
+        if frames:
+            stream["duration"] = frames * samples * 1000 // rate
+            stream["bitrate"] = audio_bytes * 8 // max(1, stream["duration"])
+        else:
+            stream["duration"] = audio_bytes * 8 * 1000 // bitrate
+            stream["bitrate"] = bitrate // 1000
+        return stream
+    return {"duration": 0}
+
+
+def _scan_mp3(r: _BoundedReader, file_size: int) -> Dict[str, Any]:
+    tags: Dict[str, Any] = {}
+    audio_start = _scan_id3v2(r, tags)
+    if len(tags) < 3 and file_size >= 128:
+        r.seek(file_size - 128)
+        v1 = r.read(128)
+        if v1[:3] == b"TAG":
+            for key, lo, hi in (("title", 3, 33), ("artist", 33, 63), ("album", 63, 93)):
+                text = v1[lo:hi].split(b"\x00")[0].decode("latin-1").strip()
+                if text and key not in tags:
+                    tags[key] = text
+            if v1[127] < 255 and "genre" not in tags:
+                tags["genre"] = str(v1[127])
+            file_size -= 128
+    if "genre" in tags:
+        tags["genre"] = _id3_genre(tags["genre"])
+    tags.update(_scan_mp3_stream(r, audio_start, file_size))
+    return tags
+
+
+def _parse_vorbis_comment(data: bytes, tags: Dict[str, Any]):
+    """Vorbis yorum bloğu; yarım kalan (kesilmiş) veride eldekilerle yetinir."""
+    vendor_len = int.from_bytes(data[0:4], "little")
+    p = 4 + vendor_len
+    count = int.from_bytes(data[p:p + 4], "little")
+    p += 4
+    for _ in range(count):
+        if p + 4 > len(data):
+            break
+        length = int.from_bytes(data[p:p + 4], "little")
+        p += 4
+        if p + length > len(data):
+            break
+        name, _, value = data[p:p + length].partition(b"=")
+        p += length
+        key = _VORBIS_KEYS.get(name.decode("ascii", "replace").upper())
+        if key and key not in tags:
+            tags[key] = value.decode("utf-8", "replace")
+
+
+def _scan_flac(r: _BoundedReader, file_size: int) -> Optional[Dict[str, Any]]:
+    tags: Dict[str, Any] = {}
+    start = _scan_id3v2(r, {})
+    r.seek(start)
+    if r.read(4) != b"fLaC":
+        return None
+    duration = 0
+    while True:
+        header = r.read(4)
+        if len(header) < 4:
+            break
+        block_type = header[0] & 0x7F
+        size = int.from_bytes(header[1:4], "big")
+        pos = r.tell()
+        if block_type == 0:
+            info = r.read(size)
+            rate = (info[10] << 12) | (info[11] << 4) | (info[12] >> 4)
+            total = ((info[13] & 0x0F) << 32) | int.from_bytes(info[14:18], "big")
+            if rate:
+                duration = total * 1000 // rate
+            tags["samplerate"] = rate
+            tags["channels"] = ((info[12] >> 1) & 0x07) + 1
+        elif block_type == 4:
+            _parse_vorbis_comment(r.read(min(size, SCAN_FRAME_LIMIT)), tags)
+        # PICTURE (6) ve diğer bloklar okunmadan atlanır
+        r.seek(pos + size)
+        if header[0] & 0x80:
+            break
+    tags["duration"] = duration
+    tags["codec"] = "FLAC"
+    if duration:
+        # Bit hızı yalnızca ses çerçevelerinden: son meta veri bloğundan sonrası
+        tags["bitrate"] = max(0, file_size - r.tell()) * 8 // duration
+    return tags
+
+
+def _ogg_packets(r: _BoundedReader, count: int) -> List[bytes]:
+    """İlk `count` paketi birleştirir; SCAN_FRAME_LIMIT'i aşan paket kesilir."""
+    packets, current = [], b""
+    while len(packets) < count:
+        header = r.read(27)
+        if len(header) < 27 or header[:4] != b"OggS":
+            break
+        table = r.read(header[26])
+        body = r.read(sum(table))
+        offset = 0
+        for lacing in table:
+            current += body[offset:offset + lacing]
+            offset += lacing
+            if lacing < 255:
+                packets.append(current)
+                current = b""
+                if len(packets) >= count:
+                    break
+        if len(current) >= SCAN_FRAME_LIMIT:
+            packets.append(current)  # kapak gömülü dev yorum paketi
+            break
+    return packets
+
+
+def _scan_ogg(r: _BoundedReader, file_size: int) -> Optional[Dict[str, Any]]:
+    r.seek(0)
+    packets = _ogg_packets(r, 2)
+    if len(packets) < 2:
+        return None
+    ident, comment = packets
+    tags: Dict[str, Any] = {}
+    nominal = 0
+    if ident.startswith(b"\x01vorbis") and comment.startswith(b"\x03vorbis"):
+        rate, pre_skip = int.from_bytes(ident[12:16], "little"), 0
+        nominal = int.from_bytes(ident[20:24], "little", signed=True)
+        tags.update(codec="Vorbis", channels=ident[11], samplerate=rate)
+        _parse_vorbis_comment(comment[7:], tags)
+    elif ident.startswith(b"OpusHead") and comment.startswith(b"OpusTags"):
+        rate, pre_skip = 48000, int.from_bytes(ident[10:12], "little")
+        tags.update(codec="Opus", channels=ident[9], samplerate=rate)
+        _parse_vorbis_comment(comment[8:], tags)
+    else:
+        return None
+
+    # Süre: son sayfanın granül konumu
+    tail = min(file_size, 65536)
+    r.seek(file_size - tail)
+    data = r.read(tail)
+    last = data.rfind(b"OggS")
+    duration = 0
+    if last >= 0 and rate:
+        granule = int.from_bytes(data[last + 6:last + 14], "little", signed=True)
+        duration = max(0, granule - pre_skip) * 1000 // rate
+    tags["duration"] = duration
+    if nominal > 0:
+        tags["bitrate"] = nominal // 1000  # Mutagen gibi: Vorbis başlığındaki değer
+    elif duration:
+        audio_bytes = file_size - _ogg_audio_start(r, file_size)
+        tags["bitrate"] = max(0, audio_bytes) * 8 // duration
+    return tags
+
+
+def _ogg_audio_start(r: _BoundedReader, file_size: int) -> int:
+    """
+    İlk ses sayfasının ofseti. Başlık sayfalarının (yorum paketi ve gömülü
+    kapak dahil) granül konumu 0'dır, paketi sürenlerinki -1; yalnızca
+    sayfa başlıkları okunur.
+    """
+    pos = 0
+    while pos + 27 <= file_size:
+        r.seek(pos)
+        header = r.read(27)
+        if len(header) < 27 or header[:4] != b"OggS":
+            break
+        granule = int.from_bytes(header[6:14], "little", signed=True)
+        if granule > 0:
+            return pos
+        pos += 27 + header[26] + sum(r.read(header[26]))
+    return pos
+
+
+def _mp4_atoms(r: _BoundedReader, start: int, end: int):
+    pos = start
+    while pos + 8 <= end:
+        r.seek(pos)
+        header = r.read(8)
+        size, name, header_len = int.from_bytes(header[:4], "big"), header[4:8], 8
+        if size == 1:
+            size, header_len = int.from_bytes(r.read(8), "big"), 16
+        elif size == 0:
+            size = end - pos
+        if size < header_len:
+            return
+        yield name, pos + header_len, pos + size
+        pos += size
+
+
+def _scan_mp4(r: _BoundedReader, file_size: int) -> Optional[Dict[str, Any]]:
+    r.seek(0)
+    if r.read(8)[4:8] != b"ftyp":
+        return None
+    tags: Dict[str, Any] = {"duration": 0}
+    mdat_bytes = 0
+    for name, start, end in _mp4_atoms(r, 0, file_size):
+        if name == b"mdat":
+            mdat_bytes += end - start  # yalnızca boyu; içerik okunmaz
+        if name != b"moov":
+            continue
+        for name2, start2, end2 in _mp4_atoms(r, start, end):
+            if name2 == b"mvhd":
+                r.seek(start2)
+                box = r.read(32)
+                if box[0] == 1:
+                    scale, length = int.from_bytes(box[20:24], "big"), int.from_bytes(box[24:32], "big")
+                else:
+                    scale, length = int.from_bytes(box[12:16], "big"), int.from_bytes(box[16:20], "big")
+                if scale:
+                    tags["duration"] = length * 1000 // scale
+            elif name2 == b"trak" and "codec" not in tags:
+                _scan_mp4_sample_entry(r, start2, end2, tags)
+            elif name2 == b"udta":
+                for name3, start3, end3 in _mp4_atoms(r, start2, end2):
+                    if name3 != b"meta":
+                        continue
+                    # meta tam kutudur: 4 bayt sürüm/bayrak
+                    for name4, start4, end4 in _mp4_atoms(r, start3 + 4, end3):
+                        if name4 != b"ilst":
+                            continue
+                        for name5, start5, end5 in _mp4_atoms(r, start4, end4):
+                            key = _MP4_KEYS.get(name5)  # covr hiç okunmaz
+                            number_key = _MP4_NUMBER_KEYS.get(name5)
+                            if (key or number_key) and end5 - start5 <= SCAN_FRAME_LIMIT:
+                                r.seek(start5)
+                                atom = r.read(end5 - start5)
+                                if atom[4:8] != b"data":
+                                    continue
+                                if key:
+                                    tags[key] = atom[16:].decode("utf-8", "replace")
+                                else:
+                                    # ikili: 2 bayt dolgu, 2 bayt numara, 2 bayt toplam
+                                    tags[number_key] = int.from_bytes(atom[18:20], "big") or None
+    if tags["duration"]:
+        # covr ve diğer meta veriler sayılmasın: yalnızca mdat
+        tags["bitrate"] = (mdat_bytes or file_size) * 8 // tags["duration"]
+    return tags
+
+
+def _scan_mp4_sample_entry(r: _BoundedReader, start: int, end: int, tags: Dict[str, Any]):
+    """trak/mdia/minf/stbl/stsd altındaki ilk ses örnek girdisinden codec bilgisi."""
+    path = (b"mdia", b"minf", b"stbl", b"stsd")
+    for wanted in path:
+        for name, child_start, child_end in _mp4_atoms(r, start, end):
+            if name == wanted:
+                start, end = child_start, child_end
+                break
+        else:
+            return
+    # stsd tam kutudur: 4 bayt sürüm/bayrak + 4 bayt girdi sayısı
+    for name, entry_start, _ in _mp4_atoms(r, start + 8, end):
+        codec = _MP4_CODECS.get(name)
+        if codec:
+            r.seek(entry_start)
+            entry = r.read(28)
+            tags["codec"] = codec
+            tags["channels"] = int.from_bytes(entry[16:18], "big")
+            tags["samplerate"] = int.from_bytes(entry[24:28], "big") >> 16
+        return
+
+
+_SCAN_READERS = {".mp3": _scan_mp3, ".flac": _scan_flac, ".ogg": _scan_ogg, ".m4a": _scan_mp4}
+
+
+def read_scan_tags(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Tarama kipi etiket okuyucu: read_full_tags ile aynı alanlar (etiketler,
+    süre ms, bit hızı, örnekleme hızı, kanal, codec).
+    Kapaklar ve büyük ikili bloklar (ID3 APIC, FLAC PICTURE, MP4 covr)
+    okunmadan atlanır; dosya başına en çok SCAN_READ_LIMIT bayt okunur.
+    Desteklenmeyen ya da okunamayan dosyada None döner, çağıran tam
+    (Mutagen) okuyucuya düşer.
+    """
+    reader = _SCAN_READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        return None
+    try:
+        size = os.path.getsize(path)
+        with open(path, "rb") as fh:
+            tags = reader(_BoundedReader(fh, SCAN_READ_LIMIT), size)
+    except (OSError, _ScanBudgetExceeded, ValueError, IndexError, ZeroDivisionError, KeyError):
+        return None
+    return None if tags is None else _normalize_tags(tags)
+
+
+SIGNATURE_CHUNK = 16 * 1024       # imza için okunan parça boyu (baş, orta, son)
+
+
+def _audio_span(fh, size: int) -> tuple:
+    """
+    Etiket bloklarını dışarıda bırakan ses verisi aralığı: baştaki ID3v2
+    ve FLAC meta veri blokları, sondaki ID3v1 ve APEv2 etiketleri atlanır.
+    """
+    start, end = 0, size
+    head = fh.read(10)
+    if len(head) == 10 and head[:3] == b"ID3":
+        start = 10 + _syncsafe(head[6:10]) + (10 if head[5] & 0x10 else 0)
+        fh.seek(start)
+        head = fh.read(4)
+    if head[:4] == b"fLaC":
+        pos = start + 4
+        while True:
+            fh.seek(pos)
+            block = fh.read(4)
+            if len(block) < 4:
+                break
+            pos += 4 + int.from_bytes(block[1:4], "big")
+            if block[0] & 0x80:
+                break
+        start = pos
+    if end - start >= 128:
+        fh.seek(end - 128)
+        if fh.read(3) == b"TAG":
+            end -= 128
+    if end - start >= 32:
+        fh.seek(end - 32)
+        footer = fh.read(32)
+        if footer[:8] == b"APETAGEX":
+            end -= int.from_bytes(footer[12:16], "little")
+            if int.from_bytes(footer[20:24], "little") & 0x80000000:
+                end -= 32  # başlık da var
+    return start, max(start, end)
+
+
+def content_signature(path: str, sizes: Optional[set] = None) -> Optional[str]:
+    """
+    Etiketlerden bağımsız ucuz içerik imzası: "ses_boyu:özet". Özet, ses
+    aralığının başından, ortasından ve sonundan SIGNATURE_CHUNK baytlık
+    parçaların BLAKE2b'sidir; etiket düzenlemesi imzayı değiştirmez.
+    (MP4/Ogg'da etiketler kapsayıcı içinde olduğundan imza yalnızca
+    taşımayı ayırt eder.) sizes verilirse boyu bu kümede olmayan dosyanın
+    özeti hiç hesaplanmaz. Okunamayan dosyada None döner.
+    """
+    try:
+        size = os.path.getsize(path)
+        with open(path, "rb") as fh:
+            start, end = _audio_span(fh, size)
+            length = end - start
+            if sizes is not None and length not in sizes:
+                return None
+            digest = hashlib.blake2b(digest_size=16)
+            offsets = (start, start + (length - SIGNATURE_CHUNK) // 2, end - SIGNATURE_CHUNK)
+            for offset in sorted({max(start, o) for o in offsets}):
+                fh.seek(offset)
+                digest.update(fh.read(min(SIGNATURE_CHUNK, end - offset)))
+    except OSError:
+        return None
+    return f"{length}:{digest.hexdigest()}"
+
+
+def benchmark_tag_readers(folder: str):
+    """--bench-tags KLASÖR: tam ve hızlı okuyucuyu süre/tepe bellek ile karşılaştırır."""
+    import tracemalloc
+
+    paths = [
+        os.path.join(root, f)
+        for root, _, files in os.walk(folder)
+        for f in files if f.lower().endswith(AUDIO_EXTENSIONS)
+    ]
+
+    def full_reader(path):
+        audio = MutagenFile(path)
+        return audio.info.length if audio and audio.info else 0
+
+    print(f"{len(paths)} dosya: {folder}")
+    for label, reader in (("Mutagen (tam)", full_reader), ("Tarama kipi", read_scan_tags)):
+        if label.startswith("Mutagen") and not MutagenFile:
+            continue
+        tracemalloc.start()
+        start = time.perf_counter()
+        for path in paths:
+            try:
+                reader(path)
+            except Exception:
+                pass
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"  {label:<14} {elapsed * 1000:9.1f} ms   tepe bellek {peak / 1024:9.1f} KiB")
+
+
+# ---------------------------------------------------------------------------
+# KÜTÜPHANE İZLEYİCİ
+# ---------------------------------------------------------------------------
+
+class LibraryWatcher(QObject):
+    """
+    Kütüphane köklerini QFileSystemWatcher ile (klasör başına) izler.
+    Oluşturma/silme/taşıma olayları bir gecikme penceresinde birleştirilir;
+    değişen klasörler toplu halde dirs_changed ile bildirilir. Uzun süren
+    kopyalamalarda da en geç MAX_WAIT_MS'de bir toplu bildirim yapılır.
+    """
+
+    DEBOUNCE_MS = 1500
+    MAX_WAIT_MS = 5000
+
+    dirs_changed = pyqtSignal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._pending = set()
+        self._first_event = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._flush)
+
+    def watch_dirs(self, dirs: List[str]):
+        # Klasörler işçide dolaşılır; burada yalnızca izleyiciye eklenir
+        known = set(self._watcher.directories())
+        new = [d for d in dirs if d not in known]
+        if new:
+            failed = self._watcher.addPaths(new)
+            if failed:
+                print(f"Uyarı: {len(failed)} klasör izlenemiyor (inotify sınırı?).")
+
+    def unwatch_trees(self, roots: List[str]):
+        prefixes = tuple(root.rstrip(os.sep) + os.sep for root in roots)
+        gone = [d for d in self._watcher.directories()
+                if d in roots or d.startswith(prefixes)]
+        if gone:
+            self._watcher.removePaths(gone)
+
+    def _on_directory_changed(self, path: str):
+        if not self._pending:
+            self._first_event = time.monotonic()
+        self._pending.add(path)
+        waited_ms = (time.monotonic() - self._first_event) * 1000
+        if waited_ms >= self.MAX_WAIT_MS:
+            self._flush()
+        else:
+            self._timer.start()
+
+    def _flush(self):
+        self._timer.stop()
+        if not self._pending:
+            return
+        dirs = sorted(self._pending)
+        self._pending.clear()
+        self._first_event = None
+        self.dirs_changed.emit(dirs)
+
+
+# ---------------------------------------------------------------------------
+# DOSYA TARAYICI MODELİ
+# ---------------------------------------------------------------------------
+
+class _BrowserNode:
+    __slots__ = ("path", "name", "is_dir", "parent", "children", "row", "info")
+
+    def __init__(self, path, name, is_dir, parent=None, row=0, info=None):
+        self.path = path
+        self.name = name
+        self.is_dir = is_dir
+        self.parent = parent
+        self.children = None  # None: henüz listelenmedi
+        self.row = row
+        self.info = info
+
+
+class AudioBrowserModel(QAbstractItemModel):
+    """
+    Yalnızca klasörleri ve desteklenen ses dosyalarını gösteren tembel
+    dosya ağacı. Her klasörün scandir sonucu mtime ile önbelleklenir;
+    dosyalar (okunmadan) kütüphanedeki sanatçı/süre ile etiketlenir.
+    """
+
+    COLUMNS = ("Ad", "Sanatçı", "Süre")
+
+    def __init__(self, library: "LibraryManager", parent=None):
+        super().__init__(parent)
+        self.library = library
+        self._listings: Dict[str, tuple] = {}  # klasör -> (mtime_ns, girdiler)
+        root = os.path.abspath(os.sep)
+        self._root = _BrowserNode(root, root, True)
+        self._dir_icon = QIcon.fromTheme("folder")
+        self._audio_icon = QIcon.fromTheme("audio-x-generic")
+
+    # --- listeleme / önbellek ---
+    def _scan(self, path: str) -> List[tuple]:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+        cached = self._listings.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        dirs, files = [], []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir():
+                            dirs.append(entry.name)
+                        elif entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        dirs.sort(key=str.lower)
+        files.sort(key=str.lower)
+        entries = [(name, True) for name in dirs] + [(name, False) for name in files]
+        self._listings[path] = (mtime, entries)
+        return entries
+
+    def _load_children(self, node: _BrowserNode) -> List[_BrowserNode]:
+        entries = self._scan(node.path)
+        paths = [os.path.join(node.path, name) for name, _ in entries]
+        known = self.library.get_tracks_by_paths(
+            [p for p, (_, is_dir) in zip(paths, entries) if not is_dir]
+        )
+        return [
+            _BrowserNode(path, name, is_dir, node, row, known.get(path))
+            for row, (path, (name, is_dir)) in enumerate(zip(paths, entries))
+        ]
+
+    def _node(self, index: QModelIndex) -> _BrowserNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    # --- QAbstractItemModel ---
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if node.children is None or not 0 <= row < len(node.children):
+            return QModelIndex()
+        return self.createIndex(row, column, node.children[row])
+
+    def parent(self, index=None):
+        if index is None:
+            return QObject.parent(self)
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        children = self._node(parent).children
+        return len(children) if children else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._node(parent)
+        return node.is_dir and (node.children is None or bool(node.children))
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return node.is_dir and node.children is None
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        if not node.is_dir or node.children is not None:
+            return
+        children = self._load_children(node)
+        if children:
+            self.beginInsertRows(parent, 0, len(children) - 1)
+            node.children = children
+            self.endInsertRows()
+        else:
+            node.children = []
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return node.name
+            if node.info is None:
+                return None
+            _, artist, _, duration = node.info
+            if column == 1:
+                return artist
+            if duration:
+                minutes, seconds = divmod(int(duration) // 1000, 60)
+                return f"{minutes:02d}:{seconds:02d}"
+            return None
+        if role == Qt.DecorationRole and column == 0:
+            return self._dir_icon if node.is_dir else self._audio_icon
+        if role == Qt.ToolTipRole:
+            return node.path
+        if role == Qt.TextAlignmentRole and column == 2:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def mimeTypes(self):
+        return ["text/uri-list"]
+
+    def mimeData(self, indexes):
+        seen = []
+        for index in indexes:
+            path = self.filePath(index)
+            if path and path not in seen:
+                seen.append(path)
+        mime = QMimeData()
+        mime.setUrls([QUrl.fromLocalFile(p) for p in seen])
+        return mime
+
+    # --- QFileSystemModel ile uyumlu yardımcılar ---
+    def filePath(self, index: QModelIndex) -> str:
+        return self._node(index).path
+
+    def isDir(self, index: QModelIndex) -> bool:
+        return self._node(index).is_dir
+
+    def index_for_path(self, path: str) -> QModelIndex:
+        """Kökten başlayarak yol üzerindeki klasörleri (gerekirse) listeler."""
+        path = os.path.abspath(path)
+        relative = os.path.relpath(path, self._root.path)
+        index = QModelIndex()
+        if relative == os.curdir:
+            return index
+        for part in relative.split(os.sep):
+            if self.canFetchMore(index):
+                self.fetchMore(index)
+            node = self._node(index)
+            match = next((c for c in node.children or [] if c.name == part), None)
+            if match is None:
+                return index
+            index = self.createIndex(match.row, 0, match)
+        return index
+
+    def revalidate(self, index: QModelIndex):
+        """Klasör diskte değiştiyse (mtime) içeriğini yeniden listeler."""
+        node = self._node(index)
+        if not node.is_dir or node.children is None:
+            return
+        try:
+            mtime = os.stat(node.path).st_mtime_ns
+        except OSError:
+            return
+        cached = self._listings.get(node.path)
+        if cached is not None and cached[0] == mtime:
+            return
+        if node.children:
+            self.beginRemoveRows(index, 0, len(node.children) - 1)
+            node.children = None
+            self.endRemoveRows()
+        else:
+            node.children = None
+        self.fetchMore(index)
+
+
+# ---------------------------------------------------------------------------
+# EKOLAYZIR
+# ---------------------------------------------------------------------------
+
+EQ_MAX_DB = 12.0  # slider kazancı 0..2 -> -12..+12 dB
+
+
+def eq_db_from_gains(gains: List[float]) -> List[float]:
+    return [(g - 1.0) * EQ_MAX_DB for g in gains]
+
+
+def eq_gains_from_db(amps_db: List[float]) -> List[float]:
+    return [1.0 + max(-EQ_MAX_DB, min(EQ_MAX_DB, db)) / EQ_MAX_DB for db in amps_db]
+
+
+def eq_bar_gains(gains: List[float], num_bars: int) -> List[float]:
+    """Görsel EQ için her çubuğun kazancı (çubuk -> en yakın bant)."""
+    if not gains:
+        return [1.0] * num_bars
+    last = len(gains) - 1
+    vector = []
+    for i in range(num_bars):
+        frac = i / (num_bars - 1) if num_bars > 1 else 0
+        vector.append(gains[min(int(frac * last), last)])
+    return vector
+
+
+class EqPreset:
+    """Bir EQ ön ayarı; ses (bant dB) ve görsel (çubuk kazancı) eğrileri önceden hesaplanır."""
+
+    VIS_BARS = 96  # process_pcm çubuk sayısı
+
+    def __init__(self, name: str, amps_db: List[float], builtin=False):
+        self.name = name
+        amps_db = [float(db) for db in amps_db]
+        # libvlc eğrileri ±20 dB'ye kadar çıkar; slider aralığına kırpılmaz,
+        # eğrinin biçimi korunarak orantılı küçültülür
+        peak = max((abs(db) for db in amps_db), default=0.0)
+        scale = EQ_MAX_DB / peak if peak > EQ_MAX_DB else 1.0
+        self.amps_db = [db * scale for db in amps_db]
+        self.gains = eq_gains_from_db(self.amps_db)
+        self.bar_gains = eq_bar_gains(self.gains, self.VIS_BARS)
+        self.builtin = builtin
+
+
+class EqPresetBank:
+    """
+    libvlc'nin yerleşik ön ayarları + veritabanındaki kullanıcı ön ayarları.
+    Tür -> ön ayar eşlemesi tek sözlük aramasıdır.
+    """
+
+    FLAT = "Flat"
+    GENRE_PRESETS = {
+        "rock": "Rock", "hard rock": "Rock", "metal": "Rock",
+        "soft rock": "Soft rock", "pop": "Pop", "dance": "Dance",
+        "electronic": "Techno", "techno": "Techno", "house": "Club",
+        "club": "Club", "reggae": "Reggae", "ska": "Ska",
+        "classical": "Classical", "klasik": "Classical",
+        "live": "Live", "party": "Party", "hip-hop": "Full bass",
+        "hip hop": "Full bass", "rap": "Full bass", "jazz": "Soft",
+        "blues": "Soft", "acoustic": "Soft",
+    }
+
+    def __init__(self, library: "LibraryManager"):
+        self.library = library
+        self.presets: Dict[str, EqPreset] = {}
+        self.reload()
+
+    def reload(self):
+        presets = {self.FLAT: EqPreset(self.FLAT, [0.0] * 10, builtin=True)}
+        presets.update(self._load_vlc_presets())
+        for name, amps in self.library.get_eq_presets().items():
+            presets[name] = EqPreset(name, amps)
+        self.presets = presets
+
+    @staticmethod
+    def _load_vlc_presets() -> Dict[str, EqPreset]:
+        if not vlc:
+            return {}
+        presets = {}
+        try:
+            bands = vlc.libvlc_audio_equalizer_get_band_count()
+            for i in range(vlc.libvlc_audio_equalizer_get_preset_count()):
+                name = vlc.libvlc_audio_equalizer_get_preset_name(i)
+                if isinstance(name, bytes):
+                    name = name.decode("utf-8", "replace")
+                eq = vlc.libvlc_audio_equalizer_new_from_preset(i)
+                presets[name] = EqPreset(
+                    name, [eq.get_amp_at_index(b) for b in range(bands)], builtin=True
+                )
+                eq.release()
+        except Exception as e:
+            print("VLC EQ ön ayarları okunamadı:", e)
+        return presets
+
+    def names(self) -> List[str]:
+        return list(self.presets)
+
+    def get(self, name: str) -> Optional[EqPreset]:
+        return self.presets.get(name)
+
+    def save_user_preset(self, name: str, amps_db: List[float]) -> Optional[EqPreset]:
+        current = self.presets.get(name)
+        if current is not None and current.builtin:
+            return None
+        self.library.save_eq_preset(name, amps_db)
+        preset = self.presets[name] = EqPreset(name, amps_db)
+        return preset
+
+    def delete_user_preset(self, name: str) -> bool:
+        preset = self.presets.get(name)
+        if preset is None or preset.builtin:
+            return False
+        self.library.delete_eq_preset(name)
+        del self.presets[name]
+        return True
+
+    def preset_for_genre(self, genre: Optional[str]) -> Optional[EqPreset]:
+        if not genre:
+            return None
+        return self.presets.get(self.GENRE_PRESETS.get(genre.strip().lower()))
+
 
 class EqualizerWidget(QWidget):
     eq_changed_signal = pyqtSignal(list)
+    preset_selected = pyqtSignal(str)
+    preset_save_requested = pyqtSignal()
+    preset_delete_requested = pyqtSignal(str)
+    auto_genre_toggled = pyqtSignal(bool)
+    gains_edited = pyqtSignal()  # yalnızca kullanıcı slider oynattığında
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -187,9 +3002,35 @@ class EqualizerWidget(QWidget):
         self._init_ui()
 
     def _init_ui(self):
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(6, 6, 6, 6)
+        outer = QVBoxLayout(self)
+        outer.setContentsMargins(6, 6, 6, 6)
+        outer.setSpacing(4)
+
+        preset_row = QHBoxLayout()
+        self.presetCombo = QComboBox()
+        self.presetCombo.setMinimumWidth(140)
+        self.presetCombo.activated[str].connect(self.preset_selected)
+        self.savePresetButton = QPushButton("💾")
+        self.savePresetButton.setToolTip("Ön Ayar Olarak Kaydet")
+        self.savePresetButton.clicked.connect(self.preset_save_requested)
+        self.deletePresetButton = QPushButton("🗑")
+        self.deletePresetButton.setToolTip("Ön Ayarı Sil")
+        self.deletePresetButton.clicked.connect(
+            lambda: self.preset_delete_requested.emit(self.presetCombo.currentText())
+        )
+        self.autoGenreCheck = QCheckBox("Türe göre otomatik")
+        self.autoGenreCheck.toggled.connect(self.auto_genre_toggled)
+        preset_row.addWidget(QLabel("Ön Ayar:"))
+        preset_row.addWidget(self.presetCombo)
+        preset_row.addWidget(self.savePresetButton)
+        preset_row.addWidget(self.deletePresetButton)
+        preset_row.addWidget(self.autoGenreCheck)
+        preset_row.addStretch(1)
+        outer.addLayout(preset_row)
+
+        layout = QHBoxLayout()
         layout.setSpacing(6)
+        outer.addLayout(layout)
 
         for i, freq in enumerate(self.frequencies):
             v_layout = QVBoxLayout()
@@ -207,6 +3048,10 @@ class EqualizerWidget(QWidget):
             slider.valueChanged.connect(
                 lambda: self.eq_changed_signal.emit(self.get_gains())
             )
+            # Elle oynanınca artık hiçbir ön ayar seçili değil (set_gains
+            # slider sinyallerini kapattığından ön ayar uygulaması buraya düşmez)
+            slider.valueChanged.connect(lambda: self.presetCombo.setCurrentIndex(-1))
+            slider.valueChanged.connect(self.gains_edited)
             self.sliders.append(slider)
 
             freq_label = QLabel(freq)
@@ -217,11 +3062,23 @@ class EqualizerWidget(QWidget):
             v_layout.addWidget(freq_label)
             layout.addLayout(v_layout)
 
-        self.setLayout(layout)
+    def _set_label(self, index: int, value: int):
+        db = eq_db_from_gains([value / 50.0])[0]
+        self.labels[index].setText(f"{db:+.1f} dB")
+
+    def set_presets(self, names: List[str], current: Optional[str] = None):
+        self.presetCombo.blockSignals(True)
+        self.presetCombo.clear()
+        self.presetCombo.addItems(names)
+        self.presetCombo.setCurrentIndex(self.presetCombo.findText(current) if current else -1)
+        self.presetCombo.blockSignals(False)
+
+    def show_preset(self, name: Optional[str]):
+        self.presetCombo.setCurrentIndex(self.presetCombo.findText(name) if name else -1)
 
     def _update_label(self, value):
         # Uyumluluk: bazen lambda ile label parametresi de gönderiliyor
-        db = (value - 50) / 5
+        db = eq_db_from_gains([value / 50.0])[0]
         sender = self.sender()
         try:
             # Eğer çağıran widget doğrudan bağlı ise index ile bul
@@ -246,11 +3103,20 @@ class EqualizerWidget(QWidget):
         return gains
 
     def set_gains(self, gains: List[float]):
+        """Tüm bantları tek seferde ayarlar (ön ayar geçişi tek uygulama olur)."""
         if len(gains) != len(self.sliders):
             return
-        for s, gain in zip(self.sliders, gains):
+        for i, (s, gain) in enumerate(zip(self.sliders, gains)):
             val = int(gain * 50)
+            s.blockSignals(True)
             s.setValue(val)
+            s.blockSignals(False)
+            self._set_label(i, val)
+        self.eq_changed_signal.emit(self.get_gains())
+
+    def set_gains_from_preset(self, preset: "EqPreset"):
+        self.set_gains(preset.gains)
+        self.show_preset(preset.name)
 
 
 # ---------------------------------------------------------------------------
@@ -314,18 +3180,18 @@ class InfoDisplayWidget(QWidget):
 
         cover_data = None
 
-        if path and MutagenFile is not None and os.path.exists(path):
+        if path and MutagenFile and os.path.exists(path):
             try:
                 audio = MutagenFile(path)
                 if audio and audio.tags:
-                    if ID3 and isinstance(audio.tags, ID3):
+                    if ID3 and isinstance(audio.tags, ID3.load()):
                         for key in audio.tags.keys():
                             if key.startswith("APIC"):
                                 apic = audio.tags[key]
                                 if hasattr(apic, "data") and isinstance(apic.data, bytes):
                                     cover_data = apic.data
                                     break
-                    elif MP4 and isinstance(audio, MP4):
+                    elif MP4 and isinstance(audio, MP4.load()):
                         covr = audio.tags.get("covr")
                         if covr and isinstance(covr, list) and len(covr) > 0:
                             data = covr[0]
@@ -380,6 +3246,47 @@ class InfoDisplayWidget(QWidget):
 # ---------------------------------------------------------------------------
 
 class SeekSlider(QSlider):
+    """
+    Stil sayfası kullanmadan kendini çizen ilerleme çubuğu. Renkler temadan
+    bir kez alınır; tutamacın piksel konumu değişmedikçe yeniden çizilmez.
+    """
+
+    GROOVE_HEIGHT = 8
+    HANDLE_SIZE = 12
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._groove_color = QColor("#2E2E2E")
+        self._handle_color = QColor("#FFFFFF")
+        self._handle_border = QColor("#888888")
+        self._primary = QColor("#40C4FF")
+        self._accent = QColor("#FFFFFF")
+        self._fill_brush = None
+        self._painted_x = None
+
+    def set_theme_colors(self, primary: str, accent: str = "#FFFFFF"):
+        self._primary = QColor(primary)
+        self._accent = QColor(accent)
+        self._fill_brush = None
+        self.update()
+
+    def _handle_x(self) -> int:
+        span = self.maximum() - self.minimum()
+        usable = max(1, self.width() - self.HANDLE_SIZE)
+        frac = (self.value() - self.minimum()) / span if span > 0 else 0.0
+        return self.HANDLE_SIZE // 2 + int(frac * usable)
+
+    def sliderChange(self, change):
+        # Saniyede onlarca konum güncellemesi çoğu zaman aynı piksele düşer
+        if change == QAbstractSlider.SliderValueChange and \
+                self._handle_x() == self._painted_x:
+            return
+        super().sliderChange(change)
+
+    def resizeEvent(self, event):
+        self._fill_brush = None
+        super().resizeEvent(event)
+
     def wheelEvent(self, event):
         delta = event.angleDelta().y()
         step = 5000
@@ -407,9 +3314,33 @@ class SeekSlider(QSlider):
         super().mousePressEvent(event)
 
     def paintEvent(self, event):
-        # Varsayılan çizimi bırakarak sadece handle çizimini kullanıyoruz;
-        # ancak ilerleme için alt arka plan rengini stil ile ayarlıyoruz (yapılandırma ana uygulamada yapılır).
-        super().paintEvent(event)
+        if self._fill_brush is None:
+            # Degrade yalnızca tema/boyut değişince kurulur
+            gradient = QLinearGradient(0, 0, self.width(), 0)
+            gradient.setColorAt(0.0, self._primary)
+            gradient.setColorAt(1.0, self._accent)
+            self._fill_brush = QBrush(gradient)
+
+        x = self._handle_x()
+        self._painted_x = x
+        h = self.GROOVE_HEIGHT
+        top = (self.height() - h) / 2
+        radius = h / 2
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._groove_color)
+        painter.drawRoundedRect(QRectF(0, top, self.width(), h), radius, radius)
+        if x > 0:
+            painter.setBrush(self._fill_brush)
+            painter.drawRoundedRect(QRectF(0, top, x, h), radius, radius)
+
+        r = self.HANDLE_SIZE / 2
+        painter.setPen(QPen(self._handle_border, 1))
+        painter.setBrush(self._handle_color)
+        painter.drawEllipse(QPointF(x, self.height() / 2), r, r)
+        painter.end()
 
 
 # ---------------------------------------------------------------------------
@@ -469,6 +3400,872 @@ class PlaylistListWidget(QListWidget):
         self.save_playlist()
 
 
+class PlayQueueOverlay(QListWidget):
+    """Çalma listesinin sağ üstünde duran küçük kuyruk görünümü."""
+
+    def __init__(self, host: QWidget, player=None):
+        super().__init__(host)
+        self.player = player
+        self.setFixedWidth(240)
+        self.setSelectionMode(QListWidget.ExtendedSelection)
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(self._show_context_menu)
+        self.setStyleSheet(
+            "QListWidget { background-color: rgba(20, 20, 20, 210);"
+            " border: 1px solid #40C4FF; border-radius: 6px; }"
+        )
+        host.installEventFilter(self)
+        self.hide()
+
+    def set_entries(self, labels: List[str]):
+        self.clear()
+        if not labels:
+            self.hide()
+            return
+        self.addItem(f"⏭️ Kuyruk ({len(labels)})")
+        self.item(0).setFlags(Qt.NoItemFlags)
+        for i, label in enumerate(labels[:50]):
+            self.addItem(f"{i + 1}. {label}")
+        if len(labels) > 50:
+            # Taşma satırı bir parça değildir; seçilip kaldırılamaz
+            self.addItem(f"... +{len(labels) - 50}")
+            self.item(self.count() - 1).setFlags(Qt.NoItemFlags)
+        rows = min(self.count(), 8)
+        self.setFixedHeight(rows * self.sizeHintForRow(0) + 8)
+        self._reposition()
+        self.show()
+        self.raise_()
+
+    def _reposition(self):
+        host = self.parentWidget()
+        if host is not None:
+            self.move(max(0, host.width() - self.width() - 8), 8)
+
+    def eventFilter(self, obj, event):
+        if obj is self.parentWidget() and event.type() == event.Resize:
+            self._reposition()
+        return super().eventFilter(obj, event)
+
+    def _show_context_menu(self, point):
+        if self.player is None:
+            return
+        # İlk satır başlık; kuyruk indeksleri 1'den başlar, taşma satırı sayılmaz
+        rows = [self.row(it) - 1 for it in self.selectedItems() if 0 < self.row(it) <= 50]
+        menu = QMenu(self)
+        if rows:
+            removeAction = QAction("Kuyruktan Kaldır", self)
+            removeAction.triggered.connect(lambda: self.player.remove_from_queue(rows))
+            menu.addAction(removeAction)
+        clearAction = QAction("Kuyruğu Temizle", self)
+        clearAction.triggered.connect(self.player.clear_queue)
+        menu.addAction(clearAction)
+        menu.exec_(self.mapToGlobal(point))
+
+
+# ---------------------------------------------------------------------------
+# KARIŞTIRMA MOTORU
+# ---------------------------------------------------------------------------
+
+class ShuffleEngine:
+    """
+    Önceden hesaplanmış permütasyon + imleç ile karıştırma.
+    - order[:cursor+1] çalınmış parçalar (geri geçmişi), gerisi sıradakiler
+    - Ekleme O(1): yeni indeks çalınmamış bölgede rastgele bir yere konur
+    - Yayma modu: aynı sanatçı/albümün art arda gelmesini engeller
+    """
+
+    SPREAD_WINDOW = 16
+
+    def __init__(self, meta_lookup=None):
+        self.order = []
+        self.cursor = -1
+        self.spread = False
+        # index -> (artist, album); yayma modunda kullanılır
+        self.meta_lookup = meta_lookup
+        # "Tümünü tekrarla" ile bir sonraki tur (peek_next önceden hazırlar)
+        self._next_round = None
+
+    def __len__(self):
+        return len(self.order)
+
+    def reset(self, count: int, current: Optional[int] = None):
+        self.order = list(range(count))
+        random.shuffle(self.order)
+        self.cursor = -1
+        self._next_round = None
+        if current is not None and 0 <= current < count:
+            pos = self.order.index(current)
+            self.order[0], self.order[pos] = self.order[pos], self.order[0]
+            self.cursor = 0
+
+    def current(self) -> Optional[int]:
+        if 0 <= self.cursor < len(self.order):
+            return self.order[self.cursor]
+        return None
+
+    def insert_range(self, start: int, count: int):
+        """Çalma listesine [start, start+count) eklendi."""
+        if count <= 0:
+            return
+        self._next_round = None
+        # order her zaman range(len) permütasyonudur
+        if start < len(self.order):
+            self.order = [i + count if i >= start else i for i in self.order]
+        for i in range(start, start + count):
+            self.order.append(i)
+            j = random.randint(self.cursor + 1, len(self.order) - 1)
+            self.order[-1], self.order[j] = self.order[j], self.order[-1]
+
+    def remove_range(self, start: int, end: int):
+        """Çalma listesinden [start, end] silindi."""
+        count = end - start + 1
+        self._next_round = None
+        new_order = []
+        new_cursor = self.cursor
+        for pos, i in enumerate(self.order):
+            if start <= i <= end:
+                if pos <= self.cursor:
+                    new_cursor -= 1
+                continue
+            new_order.append(i - count if i > end else i)
+        self.order = new_order
+        self.cursor = max(-1, min(new_cursor, len(new_order) - 1))
+
+    def jump_to(self, index: int):
+        """Kullanıcı belirli bir parçayı seçti: onu geçmişin sonuna taşı."""
+        if self.current() == index:
+            return
+        try:
+            pos = self.order.index(index)
+        except ValueError:
+            return
+        if pos > self.cursor:
+            self.cursor += 1
+            self.order[pos], self.order[self.cursor] = \
+                self.order[self.cursor], self.order[pos]
+        else:
+            self.order.pop(pos)
+            self.order.insert(self.cursor, index)
+
+    def _apply_spread(self, pos: int):
+        """pos konumuna, mevcut parçayla aynı sanatçı/albümden olmayanı getir."""
+        if self.meta_lookup is None or self.cursor < 0:
+            return
+        cur_artist, cur_album = self.meta_lookup(self.order[self.cursor])
+        last = min(len(self.order), pos + self.SPREAD_WINDOW)
+        for j in range(pos, last):
+            artist, album = self.meta_lookup(self.order[j])
+            if (not artist or artist != cur_artist) and \
+                    (not album or album != cur_album):
+                self.order[pos], self.order[j] = self.order[j], self.order[pos]
+                return
+
+    def _prepare_next_round(self):
+        if self._next_round is None:
+            # Yeni tur; son çalınan hemen tekrar gelmesin
+            last = self.current()
+            new_round = self.order[:]
+            random.shuffle(new_round)
+            if len(new_round) > 1 and new_round[0] == last:
+                new_round[0], new_round[-1] = new_round[-1], new_round[0]
+            self._next_round = new_round
+        return self._next_round
+
+    def peek_next(self, repeat_all=False) -> Optional[int]:
+        """İmleci ilerletmeden sıradaki parçayı döndürür."""
+        if self.cursor + 1 >= len(self.order):
+            if not (repeat_all and self.order):
+                return None
+            return self._prepare_next_round()[0]
+        if self.spread:
+            self._apply_spread(self.cursor + 1)
+        return self.order[self.cursor + 1]
+
+    def next(self, repeat_all=False) -> Optional[int]:
+        if self.cursor + 1 >= len(self.order):
+            if not (repeat_all and self.order):
+                return None
+            self.order = self._prepare_next_round()
+            self._next_round = None
+            self.cursor = 0
+            return self.order[0]
+        if self.spread:
+            self._apply_spread(self.cursor + 1)
+        self.cursor += 1
+        return self.order[self.cursor]
+
+    def previous(self) -> Optional[int]:
+        if self.cursor > 0:
+            self.cursor -= 1
+            return self.order[self.cursor]
+        return None
+
+
+# ---------------------------------------------------------------------------
+# OYNATMA ARKA UÇLARI (QtMultimedia / libvlc)
+# ---------------------------------------------------------------------------
+
+class _BackendMeta(type(QObject), ABCMeta):
+    """QObject (sip) ve ABC üst sınıflarını birleştirir."""
+
+
+class PlaybackBackend(QObject, metaclass=_BackendMeta):
+    """
+    Oynatma arka uçlarının ortak arayüzü: yükle, çal, konumlan, ses,
+    konum/süre olayları, PCM musluğu ve EQ.
+    Durum ve ortam durumu için QMediaPlayer sabitleri ortak dil olarak
+    kullanılır; deck'ler, crossfade ve analiz arka uçtan bağımsızdır.
+    """
+
+    name = ""
+    supports_equalizer = False
+
+    position_changed = pyqtSignal("qint64")
+    duration_changed = pyqtSignal("qint64")
+    state_changed = pyqtSignal(int)
+    media_status_changed = pyqtSignal(int)
+    # Ham PCM: (veri, örnek bit sayısı, kanal sayısı)
+    pcm_ready = pyqtSignal(bytes, int, int)
+
+    def __init__(self, parent=None):
+        # sip örnek oluşturmada soyutluk denetimi atlanabilir; eksik metot
+        # çalma ortasında değil, arka uç kurulurken hata versin
+        missing = getattr(type(self), "__abstractmethods__", None)
+        if missing:
+            raise TypeError(
+                f"{type(self).__name__} arka ucu şu metotları uygulamıyor: "
+                f"{', '.join(sorted(missing))}"
+            )
+        super().__init__(parent)
+
+    @abstractmethod
+    def load(self, path: str):
+        ...
+
+    @abstractmethod
+    def play(self):
+        ...
+
+    @abstractmethod
+    def pause(self):
+        ...
+
+    @abstractmethod
+    def stop(self):
+        ...
+
+    def preroll(self):
+        """Yüklü parçayı açıp ilk tamponu çözer, duraklatılmış bekler."""
+        self.pause()
+
+    @abstractmethod
+    def seek(self, position_ms: int):
+        ...
+
+    @abstractmethod
+    def set_volume(self, volume: int):
+        ...
+
+    @abstractmethod
+    def volume(self) -> int:
+        ...
+
+    @abstractmethod
+    def set_muted(self, muted: bool):
+        ...
+
+    @abstractmethod
+    def position(self) -> int:
+        ...
+
+    @abstractmethod
+    def duration(self) -> int:
+        ...
+
+    @abstractmethod
+    def state(self) -> int:
+        ...
+
+    @abstractmethod
+    def media_status(self) -> int:
+        ...
+
+    @abstractmethod
+    def is_seekable(self) -> bool:
+        ...
+
+    def enable_pcm_tap(self) -> bool:
+        """pcm_ready sinyalini etkinleştirir; desteklenmiyorsa False."""
+        return False
+
+    def set_equalizer(self, amps_db: Optional[List[float]]) -> bool:
+        """Bant kazançlarını (dB) uygular; None EQ'yu kapatır."""
+        return False
+
+
+class QtMultimediaBackend(PlaybackBackend):
+    """QMediaPlayer üzerine ince sarmalayıcı; PCM musluğu QAudioProbe'dur."""
+
+    name = "qt"
+
+    def __init__(self, parent=None, player: Optional[QMediaPlayer] = None):
+        super().__init__(parent)
+        self._player = player if player is not None else QMediaPlayer(self)
+        self._probe = None
+        self._probe_ok = False
+        self._player.positionChanged.connect(self.position_changed)
+        self._player.durationChanged.connect(self.duration_changed)
+        self._player.stateChanged.connect(self.state_changed)
+        self._player.mediaStatusChanged.connect(self.media_status_changed)
+
+    def load(self, path: str):
+        self._player.setMedia(QMediaContent(QUrl.fromLocalFile(path)))
+
+    def play(self):
+        self._player.play()
+
+    def pause(self):
+        self._player.pause()
+
+    def stop(self):
+        self._player.stop()
+
+    def seek(self, position_ms: int):
+        self._player.setPosition(int(position_ms))
+
+    def set_volume(self, volume: int):
+        self._player.setVolume(int(volume))
+
+    def volume(self) -> int:
+        return self._player.volume()
+
+    def set_muted(self, muted: bool):
+        self._player.setMuted(muted)
+
+    def position(self) -> int:
+        return self._player.position()
+
+    def duration(self) -> int:
+        return self._player.duration()
+
+    def state(self) -> int:
+        return self._player.state()
+
+    def media_status(self) -> int:
+        return self._player.mediaStatus()
+
+    def is_seekable(self) -> bool:
+        return self._player.isSeekable()
+
+    def enable_pcm_tap(self) -> bool:
+        if self._probe is None:
+            self._probe = QAudioProbe(self)
+            self._probe.audioBufferProbed.connect(self._on_buffer)
+            self._probe_ok = self._probe.setSource(self._player)
+        return self._probe_ok
+
+    def _on_buffer(self, buffer):
+        byte_count = buffer.byteCount()
+        if byte_count <= 0:
+            return
+        fmt = buffer.format()
+        raw = ctypes.string_at(int(buffer.constData()), byte_count)
+        self.pcm_ready.emit(raw, fmt.sampleSize(), fmt.channelCount())
+
+
+class PcmRingBuffer(QIODevice):
+    """
+    libvlc ses iş parçacığının yazdığı, QAudioOutput'un (pull modu) okuduğu
+    iş parçacığı güvenli PCM tamponu. Tampon dolunca yazan taraf bekler
+    (geri basınç); boşken çıkışa sessizlik verilir.
+    """
+
+    def __init__(self, max_bytes: int, parent=None):
+        super().__init__(parent)
+        self._chunks = deque()
+        self._size = 0
+        self._max_bytes = max_bytes
+        self._accepting = True
+        self._cond = threading.Condition()
+
+    def push(self, data: bytes):
+        with self._cond:
+            while self._accepting and self._size >= self._max_bytes:
+                if not self._cond.wait(0.5):
+                    break
+            if not self._accepting:
+                return
+            self._chunks.append(data)
+            self._size += len(data)
+
+    def set_accepting(self, accepting: bool):
+        # Kapalıyken push beklemeden döner; libvlc durdurulurken
+        # ses iş parçacığı tamponda takılı kalmaz
+        with self._cond:
+            self._accepting = accepting
+            self._cond.notify_all()
+
+    def clear(self):
+        with self._cond:
+            self._chunks.clear()
+            self._size = 0
+            self._cond.notify_all()
+
+    def readData(self, maxlen):
+        out = bytearray()
+        with self._cond:
+            while self._chunks and len(out) < maxlen:
+                chunk = self._chunks[0]
+                need = maxlen - len(out)
+                if len(chunk) <= need:
+                    out += chunk
+                    self._chunks.popleft()
+                else:
+                    out += chunk[:need]
+                    self._chunks[0] = chunk[need:]
+            self._size -= len(out)
+            self._cond.notify_all()
+        if len(out) < maxlen:
+            out += bytes(maxlen - len(out))
+        return bytes(out)
+
+    def writeData(self, data):
+        return -1
+
+    def isSequential(self):
+        return True
+
+    def bytesAvailable(self):
+        return self._size + super().bytesAvailable()
+
+
+class VlcBackend(PlaybackBackend):
+    """
+    libvlc arka ucu. libvlc olayları kendi iş parçacığında gelir; bir Qt
+    sinyaliyle ana iş parçacığına aktarılır (libvlc'yi geri çağrı içinden
+    çağırmak kilitlenmeye yol açar). Konum, çalarken zamanlayıcıyla okunur.
+
+    PCM musluğu açıkken çözülen ses audio_set_callbacks ile alınır: aynı
+    bytes nesnesi hem analize (pcm_ready) hem de gerçek çıkışa
+    (PcmRingBuffer -> QAudioOutput) gider. Ses seviyesi çıkışta uygulanır.
+    """
+
+    name = "vlc"
+    supports_equalizer = True
+    POLL_MS = 100
+    TAP_RATE = 44100
+    TAP_CHANNELS = 2
+    TAP_FRAME_BYTES = 4  # S16N, 2 kanal
+    TAP_BUFFER_MS = 250
+
+    _vlc_event = pyqtSignal(str)
+
+    def __init__(self, parent=None, instance=None):
+        super().__init__(parent)
+        self._instance = instance or vlc.Instance("--no-video", "--quiet")
+        self._player = self._instance.media_player_new()
+        self._state = QMediaPlayer.StoppedState
+        self._status = QMediaPlayer.NoMedia
+        self._volume = 100
+        self._muted = False
+        self._prerolling = False
+        self._equalizer = None
+        self._sink = None
+        self._ring = None
+        self._tap_callbacks = None
+        self._eq_amps = []
+
+        self._poll = QTimer(self)
+        self._poll.setInterval(self.POLL_MS)
+        self._poll.timeout.connect(lambda: self.position_changed.emit(self.position()))
+
+        self._vlc_event.connect(self._on_vlc_event)
+        events = self._player.event_manager()
+        for event_type, name in (
+            (vlc.EventType.MediaPlayerPlaying, "playing"),
+            (vlc.EventType.MediaPlayerPaused, "paused"),
+            (vlc.EventType.MediaPlayerStopped, "stopped"),
+            (vlc.EventType.MediaPlayerEndReached, "end"),
+            (vlc.EventType.MediaPlayerEncounteredError, "error"),
+            (vlc.EventType.MediaPlayerLengthChanged, "length"),
+        ):
+            events.event_attach(event_type, lambda _e, n=name: self._vlc_event.emit(n))
+
+    def _set_state(self, state):
+        if state != self._state:
+            self._state = state
+            self.state_changed.emit(state)
+
+    def _set_status(self, status):
+        if status != self._status:
+            self._status = status
+            self.media_status_changed.emit(status)
+
+    def _on_vlc_event(self, name: str):
+        if name == "playing":
+            # Ses çıkışı artık var: ses/sessiz ayarını yeniden uygula
+            self._apply_volume()
+            if self._prerolling:
+                self._player.set_pause(1)
+                return
+            self._set_status(QMediaPlayer.BufferedMedia)
+            self._set_state(QMediaPlayer.PlayingState)
+            self._poll.start()
+            if self._sink is not None:
+                if self._sink.state() == QAudio.SuspendedState:
+                    self._sink.resume()
+                elif self._sink.state() == QAudio.StoppedState:
+                    self._sink.start(self._ring)
+        elif name == "paused":
+            self._poll.stop()
+            self._set_status(QMediaPlayer.BufferedMedia)
+            if self._prerolling:
+                self._prerolling = False
+                return
+            if self._sink is not None:
+                self._sink.suspend()
+            self._set_state(QMediaPlayer.PausedState)
+            self.position_changed.emit(self.position())
+        elif name == "stopped":
+            self._poll.stop()
+            self._set_state(QMediaPlayer.StoppedState)
+        elif name == "end":
+            # Çıkış açık kalır: tampondaki son parça sonuna kadar çalınır
+            self._poll.stop()
+            self._set_state(QMediaPlayer.StoppedState)
+            self._set_status(QMediaPlayer.EndOfMedia)
+        elif name == "error":
+            self._poll.stop()
+            self._prerolling = False
+            self._stop_sink()
+            self._set_state(QMediaPlayer.StoppedState)
+            self._set_status(QMediaPlayer.InvalidMedia)
+        elif name == "length":
+            self.duration_changed.emit(self.duration())
+
+    def _halt(self, action):
+        # libvlc durdurma/değiştirme ses iş parçacığını bekler; tampon
+        # doluysa iş parçacığı push'ta beklememeli
+        if self._ring is None:
+            action()
+            return
+        self._ring.set_accepting(False)
+        try:
+            action()
+        finally:
+            self._ring.clear()
+            self._ring.set_accepting(True)
+
+    def _stop_sink(self):
+        if self._sink is not None:
+            self._sink.stop()
+        if self._ring is not None:
+            self._ring.clear()
+
+    def load(self, path: str):
+        self._prerolling = False
+        self._poll.stop()
+        self._halt(lambda: self._player.set_media(self._instance.media_new(path)))
+        self._stop_sink()
+        self._set_state(QMediaPlayer.StoppedState)
+        self._set_status(QMediaPlayer.LoadedMedia)
+        self.duration_changed.emit(0)
+
+    def play(self):
+        self._prerolling = False
+        if self._state == QMediaPlayer.PausedState:
+            self._player.set_pause(0)
+        else:
+            self._player.play()
+
+    def pause(self):
+        if self._state == QMediaPlayer.PlayingState:
+            self._player.set_pause(1)
+
+    def stop(self):
+        self._prerolling = False
+        self._halt(self._player.stop)
+        self._stop_sink()
+
+    def preroll(self):
+        media = self._player.get_media()
+        if media is None or self._state != QMediaPlayer.StoppedState:
+            return
+        # Parça açılır, ilk tampon çözülür ve Playing olayında duraklatılır
+        media.add_option(":start-paused")
+        self._prerolling = True
+        self._player.play()
+
+    def seek(self, position_ms: int):
+        self._player.set_time(int(position_ms))
+
+    def _apply_volume(self):
+        if self._sink is not None:
+            self._sink.setVolume(0.0 if self._muted else self._volume / 100.0)
+        else:
+            self._player.audio_set_volume(self._volume)
+            self._player.audio_set_mute(self._muted)
+
+    def set_volume(self, volume: int):
+        self._volume = int(volume)
+        self._apply_volume()
+
+    def volume(self) -> int:
+        return self._volume
+
+    def set_muted(self, muted: bool):
+        self._muted = bool(muted)
+        self._apply_volume()
+
+    def position(self) -> int:
+        return max(0, self._player.get_time())
+
+    def duration(self) -> int:
+        return max(0, self._player.get_length())
+
+    def state(self) -> int:
+        return self._state
+
+    def media_status(self) -> int:
+        return self._status
+
+    def is_seekable(self) -> bool:
+        return bool(self._player.is_seekable())
+
+    def enable_pcm_tap(self) -> bool:
+        if self._sink is not None:
+            return True
+        fmt = QAudioFormat()
+        fmt.setSampleRate(self.TAP_RATE)
+        fmt.setChannelCount(self.TAP_CHANNELS)
+        fmt.setSampleSize(16)
+        fmt.setCodec("audio/pcm")
+        fmt.setByteOrder(QAudioFormat.LittleEndian)
+        fmt.setSampleType(QAudioFormat.SignedInt)
+        if sys.byteorder != "little" or \
+                not QAudioDeviceInfo.defaultOutputDevice().isFormatSupported(fmt):
+            # Musluk yok: libvlc kendi çıkışını kullanmaya devam eder
+            return False
+
+        self._ring = PcmRingBuffer(
+            self.TAP_RATE * self.TAP_FRAME_BYTES * self.TAP_BUFFER_MS // 1000, self
+        )
+        self._ring.open(QIODevice.ReadOnly)
+        self._sink = QAudioOutput(fmt, self)
+        # ctypes geri çağrıları çöp toplanmasın diye saklanır
+        self._tap_callbacks = (
+            vlc.AudioPlayCb(self._tap_play),
+            vlc.AudioFlushCb(self._tap_flush),
+        )
+        self._player.audio_set_callbacks(
+            self._tap_callbacks[0], None, None, self._tap_callbacks[1], None, None
+        )
+        self._player.audio_set_format("S16N", self.TAP_RATE, self.TAP_CHANNELS)
+        self._player.audio_set_volume(100)
+        self._apply_volume()
+        return True
+
+    def _tap_play(self, _opaque, samples, count, _pts):
+        # libvlc ses iş parçacığı: tek kopya, iki tüketici
+        raw = ctypes.string_at(samples, count * self.TAP_FRAME_BYTES)
+        self._ring.push(raw)
+        self.pcm_ready.emit(raw, 16, self.TAP_CHANNELS)
+
+    def _tap_flush(self, _opaque, _pts):
+        # Konumlanmada eski örnekler atılır
+        self._ring.clear()
+
+    def set_equalizer(self, amps_db: Optional[List[float]]) -> bool:
+        try:
+            if amps_db is None:
+                self._equalizer = None
+                self._eq_amps = []
+                self._player.set_equalizer(None)
+                return True
+            if self._equalizer is None:
+                self._equalizer = vlc.AudioEqualizer()
+                self._eq_amps = [None] * len(amps_db)
+            # Yalnızca değişen bantlar yazılır; uygulama tek çağrıdır
+            changed = False
+            for i, db in enumerate(amps_db):
+                db = float(db)
+                if i >= len(self._eq_amps) or self._eq_amps[i] != db:
+                    self._equalizer.set_amp_at_index(db, i)
+                    changed = True
+            self._eq_amps = [float(db) for db in amps_db]
+            if changed:
+                self._player.set_equalizer(self._equalizer)
+            return True
+        except Exception as e:
+            print("EQ apply error:", e)
+            return False
+
+
+PLAYBACK_BACKENDS = {
+    QtMultimediaBackend.name: QtMultimediaBackend,
+    VlcBackend.name: VlcBackend,
+}
+
+
+def select_playback_backend(config: ConfigStore) -> str:
+    """
+    Başlangıçta kullanılacak arka uç: ANGOLLA_BACKEND ortam değişkeni,
+    yoksa Tercihler'de seçilen değer. libvlc yoksa QtMultimedia'ya düşer.
+    """
+    name = os.environ.get("ANGOLLA_BACKEND") or config.get("playback_backend")
+    name = str(name).lower()
+    if name not in PLAYBACK_BACKENDS:
+        name = DEFAULT_BACKEND
+    if name == VlcBackend.name and not vlc:
+        name = QtMultimediaBackend.name
+    return name
+
+
+def create_playback_backend(name: str, parent=None, **kwargs) -> PlaybackBackend:
+    return PLAYBACK_BACKENDS.get(name, QtMultimediaBackend)(parent, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# TEMA MOTORU
+# ---------------------------------------------------------------------------
+
+# Renk içermeyen, bir kez kurulan stil sayfası; renkler paletten gelir
+THEME_BASE_STYLESHEET = """
+QListWidget, QTreeView, QTableWidget {
+    border: 1px solid #444;
+}
+"""
+
+
+class ThemeEngine:
+    """
+    Temaları bir kez QPalette'e derler ve ad başına önbellekler. Geçişte
+    uygulama stil sayfası yeniden kurulmaz (tüm widget'ları yeniden
+    cilalar); yalnızca palet değişir.
+    """
+
+    def __init__(self, themes: Dict[str, tuple]):
+        self.themes = themes
+        self._palettes: Dict[str, QPalette] = {}
+        self._base_installed = False
+
+    @staticmethod
+    def compile(primary: str, text: str, bg: str) -> QPalette:
+        primary_c, text_c, bg_c = QColor(primary), QColor(text), QColor(bg)
+        palette = QPalette()
+        for group in (QPalette.Active, QPalette.Inactive):
+            palette.setColor(group, QPalette.Window, bg_c)
+            palette.setColor(group, QPalette.WindowText, text_c)
+            palette.setColor(group, QPalette.Base, bg_c.lighter(105))
+            palette.setColor(group, QPalette.AlternateBase, bg_c.lighter(115))
+            palette.setColor(group, QPalette.Text, text_c)
+            palette.setColor(group, QPalette.Button, bg_c.lighter(110))
+            palette.setColor(group, QPalette.ButtonText, text_c)
+            palette.setColor(group, QPalette.Highlight, primary_c)
+            palette.setColor(group, QPalette.HighlightedText, QColor("black"))
+            palette.setColor(group, QPalette.Light, primary_c.lighter(130))
+            palette.setColor(group, QPalette.Midlight, primary_c)
+            palette.setColor(group, QPalette.Mid, primary_c.darker(150))
+            palette.setColor(group, QPalette.Dark, primary_c.darker(200))
+            palette.setColor(group, QPalette.ToolTipBase, bg_c.lighter(120))
+            palette.setColor(group, QPalette.ToolTipText, text_c)
+        disabled = text_c.darker(170)
+        palette.setColor(QPalette.Disabled, QPalette.WindowText, disabled)
+        palette.setColor(QPalette.Disabled, QPalette.Text, disabled)
+        palette.setColor(QPalette.Disabled, QPalette.ButtonText, disabled)
+        palette.setColor(QPalette.Disabled, QPalette.Window, bg_c)
+        palette.setColor(QPalette.Disabled, QPalette.Base, bg_c)
+        palette.setColor(QPalette.Disabled, QPalette.Button, bg_c.lighter(110))
+        return palette
+
+    def palette(self, name: str) -> Optional[QPalette]:
+        palette = self._palettes.get(name)
+        if palette is None and name in self.themes:
+            palette = self._palettes[name] = self.compile(*self.themes[name])
+        return palette
+
+    def apply(self, name: str) -> bool:
+        palette = self.palette(name)
+        if palette is None:
+            return False
+        app = QApplication.instance()
+        if not self._base_installed:
+            # Fusion paleti tam olarak uygular; stil sayfası tek sefer kurulur
+            app.setStyle("Fusion")
+            app.setStyleSheet(THEME_BASE_STYLESHEET)
+            self._base_installed = True
+        app.setPalette(palette)
+        return True
+
+
+# ---------------------------------------------------------------------------
+# SES GEÇİŞ (CROSSFADE) MOTORU
+# ---------------------------------------------------------------------------
+
+class CrossfadeEngine(QObject):
+    """
+    Tüm ses rampalarını tek bir saatle (QTimer) süren motor.
+    - Eşit güç eğrileri: çıkış cos(t·π/2), giriş sin(t·π/2)
+    - Kazanç her tikte geçen gerçek süreden hesaplanır (tik kaymaz)
+    - Aynı oynatıcıya yeni rampa gelirse eskisinin yerine geçer,
+      mevcut sesten devam eder (üst üste binen fade olmaz)
+    """
+
+    TICK_MS = 15
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ramps = {}
+        self._clock = QTimer(self)
+        self._clock.setInterval(self.TICK_MS)
+        self._clock.timeout.connect(self._tick)
+
+    def ramp(self, player, target: int, duration_ms: int, curve="in", on_done=None):
+        if duration_ms <= 0:
+            self._ramps.pop(id(player), None)
+            player.set_volume(int(target))
+            if on_done:
+                on_done()
+            return
+        self._ramps[id(player)] = {
+            "player": player,
+            "start": player.volume(),
+            "end": int(target),
+            "curve": curve,
+            "t0": time.monotonic(),
+            "duration": duration_ms / 1000.0,
+            "on_done": on_done,
+        }
+        if not self._clock.isActive():
+            self._clock.start()
+
+    def cancel(self, player):
+        self._ramps.pop(id(player), None)
+
+    def is_active(self, player) -> bool:
+        return id(player) in self._ramps
+
+    def _tick(self):
+        now = time.monotonic()
+        for key, r in list(self._ramps.items()):
+            t = min(1.0, (now - r["t0"]) / r["duration"])
+            if r["curve"] == "out":
+                gain = math.cos(t * math.pi / 2)
+                vol = r["end"] + (r["start"] - r["end"]) * gain
+            else:
+                gain = math.sin(t * math.pi / 2)
+                vol = r["start"] + (r["end"] - r["start"]) * gain
+            r["player"].set_volume(int(round(vol)))
+            if t >= 1.0:
+                # on_done yeni rampa ekleyebilir; önce bu rampayı kaldır
+                if self._ramps.get(key) is r:
+                    del self._ramps[key]
+                if r["on_done"]:
+                    r["on_done"]()
+        if not self._ramps:
+            self._clock.stop()
+
+
 # ---------------------------------------------------------------------------
 # GÖRSELLEŞTİRME WIDGET
 # ---------------------------------------------------------------------------
@@ -524,7 +4321,7 @@ class AnimatedVisualizationWidget(QWidget):
         self.update()
 
     def _initialize_particles(self, reset_only=False):
-        if np is None:
+        if not np:
             self.particles = []
             return
 
@@ -663,7 +4460,7 @@ class AnimatedVisualizationWidget(QWidget):
 
         for p in self.particles:
             angle = random.uniform(0.0, 6.28318)  # ~2π
-            if np is not None:
+            if np:
                 fx = float(np.cos(angle)) * magnitude
                 fy = float(np.sin(angle)) * magnitude
             else:
@@ -828,7 +4625,7 @@ class AnimatedVisualizationWidget(QWidget):
             angle = i * (360 / band_count)
             factor = 1.0 - (i / band_count) * 0.5
             dist = max_r * 0.75 * factor
-            if np is not None:
+            if np:
                 x = cx + int(dist * np.cos(np.deg2rad(angle)))
                 y = cy + int(dist * np.sin(np.deg2rad(angle)))
             else:
@@ -917,7 +4714,7 @@ class AnimatedVisualizationWidget(QWidget):
             return
 
         # NumPy gerekli
-        if np is None:
+        if not np:
             # NumPy yoksa basit bar göster
             self._draw_spectrum_mode(painter, w, h, data)
             return
@@ -986,7 +4783,7 @@ class AnimatedVisualizationWidget(QWidget):
             # Merkezden dışarı doğru ışın
             length = max_r * (0.3 + v * 0.7)
 
-            if np is not None:
+            if np:
                 end_x = cx + int(length * np.cos(np.deg2rad(angle)))
                 end_y = cy + int(length * np.sin(np.deg2rad(angle)))
             else:
@@ -1012,7 +4809,7 @@ class AnimatedVisualizationWidget(QWidget):
         count = len(data)
         max_r = min(w, h) // 2 * 0.85
 
-        if np is None:
+        if not np:
             # NumPy yoksa basit daireler çiz
             for i in range(count):
                 v = data[i]
@@ -1056,7 +4853,7 @@ class AnimatedVisualizationWidget(QWidget):
         count = len(data)
         max_h = h * 0.45
 
-        if np is None:
+        if not np:
             # NumPy yoksa basit bar çiz
             self._draw_spectrum_mode(painter, w, h, data)
             return
@@ -1099,7 +4896,7 @@ class AnimatedVisualizationWidget(QWidget):
             angle = (i / count) * 360 + (self.bar_phase * 0.5)
             length = max_len * (0.2 + v * 0.8)
 
-            if np is not None:
+            if np:
                 ex = cx + int(length * np.cos(np.deg2rad(angle)))
                 ey = cy + int(length * np.sin(np.deg2rad(angle)))
             else:
@@ -1169,7 +4966,7 @@ class AnimatedVisualizationWidget(QWidget):
             v = data[i]
             angle = (i / count) * 360 + self.bar_phase
             length = max_r * (0.15 + v * 0.85)
-            if np is not None:
+            if np:
                 ex = cx + int(length * np.cos(np.deg2rad(angle)))
                 ey = cy + int(length * np.sin(np.deg2rad(angle)))
             else:
@@ -1512,7 +5309,9 @@ class AnimatedVisualizationWidget(QWidget):
         menu = QMenu(self)
         app = QApplication.instance()
         from_main = next(
-            (w for w in app.topLevelWidgets() if isinstance(w, AngollaPlayer)),
+            # Görselleştirme pencereleri de bu sınıftandır; ana pencerede player yok
+            (w for w in app.topLevelWidgets()
+             if isinstance(w, VisualizationWindow) and getattr(w, "player", None) is None),
             None
         )
 
@@ -1595,61 +5394,155 @@ class VisualizationWindow(QMainWindow):
     # ------------------------------------------------------------------
     # DOSYA OYNATMA
     # ------------------------------------------------------------------
-    def play_file(self, filepath):
-        media = self.vlc_instance.media_new(filepath)
-        self.vlc_player.set_media(media)
-        self.vlc_player.play()
-
-        # VLC EQ yeniden uygula
-        try:
-            self.vlc_player.set_equalizer(self.vlc_eq)
-        except Exception as e:
-            print("EQ apply error:", e)
+    def play_file(self, filepath, index=None):
+        """
+        Dosyayı etkin deck üzerinden çalar; geçiş, EQ ve analiz tek yoldan
+        işler. Listede yoksa çalan parçanın arkasına eklenir.
+        """
+        if index is None:
+            index = self._playlist_index_of(filepath)
+        if index < 0:
+            index = self.playlist.currentIndex() + 1
+            self._insert_playlist_item(index, filepath)
+        if index == self.playlist.currentIndex():
+            # Aynı parça: baştan başlat
+            self._load_deck(filepath, force=True)
+        else:
+            self.playlist.setCurrentIndex(index)
+        self.mediaPlayer.play()
 
     # ==========================================================
-    #  EQ DEĞİŞİNCE ÇALIŞIR  (ŞU ANDA SADECE GÖRSELLEŞTIRMEYE ETKİ EDER)
+    #  EQ DEĞİŞİNCE ÇALIŞIR
     # ==========================================================
     def _on_eq_changed(self, gains=None):
         """
-        EQ değişince VLC equalizer güncellenecek
+        EQ değişince her iki deck'in arka uç EQ'su güncellenir
+        (arka uç desteklemiyorsa yalnızca görselleştirme etkilenir).
+        Slider sürüklenirken değişiklikler birikir; kare başına en çok
+        bir kez uygulanır.
         """
         if gains is None:
             gains = self.equalizerWidget.get_gains()
 
-        # VLC equalizer değerlerini güncelle
-        for i, g in enumerate(gains):
-            db = (g - 1.0) * 12  # -12 dB ile +12 dB arası
-            try:
-                self.vlc_eq.set_amp_at_index(db, i)
-            except Exception as e:
-                print("EQ set error:", e)
-
-        # Equalizer'ı uygula
-        try:
-            self.vlc_player.set_equalizer(self.vlc_eq)
-        except Exception as e:
-            print("EQ apply error:", e)
-
-        # --- EQ DEĞERLERİNİ KAYDET ---
+        # --- EQ DEĞERLERİNİ KAYDET (analiz hemen, disk gecikmeli) ---
         self.current_eq_gains = gains
+        self._eq_bar_gains = None  # görsel eğri ilk analizde yeniden kurulur
         self.config_data["eq_gains"] = gains
 
+        timer = getattr(self, "_eq_timer", None)
+        if timer is None:
+            timer = self._eq_timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(EQ_APPLY_MS)
+            timer.timeout.connect(lambda: self._apply_eq_to_decks(self.current_eq_gains))
+        if not timer.isActive():
+            timer.start()
+
+    # ------------------------------------------------------------------
+    # EQ ÖN AYARLARI
+    # ------------------------------------------------------------------
+    def _get_eq_bank(self) -> EqPresetBank:
+        bank = getattr(self, "eq_bank", None)
+        if bank is None:
+            bank = self.eq_bank = EqPresetBank(self.library)
+        return bank
+
+    def _init_eq_presets(self):
+        # Ön ayar listesi (libvlc yüklemesi dahil) EQ ilk açıldığında kurulur
+        eq = self.equalizerWidget
+        eq.preset_selected.connect(self.apply_eq_preset)
+        eq.preset_save_requested.connect(self.save_eq_preset)
+        eq.preset_delete_requested.connect(self.delete_eq_preset)
+        eq.auto_genre_toggled.connect(self._set_eq_auto_genre)
+        eq.gains_edited.connect(lambda: self.config_data.pop("eq_preset", None))
+
+    def _ensure_eq_presets_listed(self):
+        if getattr(self, "_eq_presets_listed", False):
+            return
+        self._eq_presets_listed = True
+        self.equalizerWidget.set_presets(
+            self._get_eq_bank().names(), self.config_data.get("eq_preset")
+        )
+
+    def apply_eq_preset(self, name: str):
+        preset = self._get_eq_bank().get(name)
+        if preset is None:
+            return
+        # Tek atomik uygulama; görsel eğri önceden hesaplı
+        self.equalizerWidget.set_gains_from_preset(preset)
+        self._eq_bar_gains = preset.bar_gains
+        self.config_data["eq_preset"] = name
+
+    def save_eq_preset(self):
+        name, ok = QInputDialog.getText(self, "EQ Ön Ayarı", "Ön ayar adı:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        bank = self._get_eq_bank()
+        preset = bank.save_user_preset(name, eq_db_from_gains(self.current_eq_gains))
+        if preset is None:
+            QMessageBox.warning(self, "EQ Ön Ayarı", f"'{name}' yerleşik bir ön ayar.")
+            return
+        self.equalizerWidget.set_presets(bank.names(), name)
+        self.config_data["eq_preset"] = name
+
+    def delete_eq_preset(self, name: str):
+        bank = self._get_eq_bank()
+        if not bank.delete_user_preset(name):
+            self.statusBar().showMessage("Yerleşik ön ayarlar silinemez.", 3000)
+            return
+        self.equalizerWidget.set_presets(bank.names())
+        self.config_data.pop("eq_preset", None)
+
+    def _set_eq_auto_genre(self, enabled: bool):
+        self.config_data["eq_auto_genre"] = enabled
+
+    def _get_genre(self, file_path: str) -> Optional[str]:
+        # Kütüphanedeki parça: tek indeksli sorgu; değilse hızlı etiket okuyucu
+        genre = self.library.get_genre(file_path)
+        if genre is not None:
+            return genre or None
+        if not os.path.exists(file_path):
+            return None
+        tags = read_scan_tags(file_path)
+        if tags is None:
+            tags = read_full_tags(file_path)
+        return tags.get("genre")
+
+    def _auto_eq_for_track(self, file_path: str):
+        if not self.config_data.get("eq_auto_genre", False):
+            return
+        preset = self._get_eq_bank().preset_for_genre(self._get_genre(file_path))
+        if preset is not None and preset.name != self.config_data.get("eq_preset"):
+            self.apply_eq_preset(preset.name)
+
+    def _get_config_store(self) -> ConfigStore:
+        store = getattr(self, "config_data", None)
+        if not isinstance(store, ConfigStore):
+            store = self.config_data = ConfigStore(CONFIG_FILE, self)
+        return store
+
+    def _apply_eq_to_decks(self, gains):
+        if not gains:
+            return
+        amps = eq_db_from_gains(gains)
+        if amps == getattr(self, "_applied_eq_amps", None):
+            return
+        self._applied_eq_amps = amps
+        for deck in (getattr(self, "mediaPlayer", None), getattr(self, "standbyPlayer", None)):
+            if isinstance(deck, PlaybackBackend):
+                deck.set_equalizer(amps)
+
     # ==========================================================
     #  SOL PANEL (Kütüphane – Listeler – Dosyalar)
     # ==========================================================
     def _create_side_panel(self):
         """Sol taraftaki Kütüphane / Listeler / Dosyalar panelini kurar ve ALT'ta albüm kapağı."""
         # --- DOSYA TARAYICI (sol Dosyalar sekmesi) ---
-        self.file_model = QFileSystemModel()
-        self.file_model.setRootPath(QDir.homePath())
-
+        # Model ilk kez Dosyalar sekmesi açılınca kurulur (_ensure_file_model)
+        self.file_model = None
         self.file_tree = QTreeView()
-        self.file_tree.setModel(self.file_model)
-        self.file_tree.hideColumn(1)
-        self.file_tree.hideColumn(2)
-        self.file_tree.hideColumn(3)
         self.file_tree.setHeaderHidden(True)
-        self.file_tree.setRootIndex(self.file_model.index(QDir.homePath()))
 
         # Çoklu seçim + sadece sürükle (drop yok)
         self.file_tree.setSelectionMode(QAbstractItemView.ExtendedSelection)
@@ -1658,10 +5551,44 @@ class VisualizationWindow(QMainWindow):
         self.file_tree.setDragDropMode(QAbstractItemView.DragOnly)
 
         # --- KÜTÜPHANE GÖRÜNÜMÜ ---
+        # Sanatçı/albüm ağacı (model ilk gösterimde kurulur) ya da düz tablo
+        self.library_model = None
+        self.libraryTree = QTreeView()
+        self.libraryTree.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.libraryTree.setDragEnabled(True)
+        self.libraryTree.setDragDropMode(QAbstractItemView.DragOnly)
+        self.libraryTree.setContextMenuPolicy(Qt.CustomContextMenu)
+
+        self.libraryViewStack = QStackedWidget()
+        self.libraryViewStack.addWidget(self.libraryTree)
+        self.libraryViewStack.addWidget(self.libraryTableWidget)
+
+        library_nav_bar = QHBoxLayout()
+        self.librarySearchEdit = QLineEdit()
+        self.librarySearchEdit.setPlaceholderText("Kütüphanede ara (sanatçı, albüm, başlık)")
+        self.librarySearchEdit.setClearButtonEnabled(True)
+        self.librarySearchEdit.textChanged.connect(self._on_library_search_changed)
+        library_nav_bar.addWidget(self.librarySearchEdit, 1)
+        self.libraryFacetButton = QPushButton("⧩ Süzgeçler")
+        self.libraryFacetButton.setCheckable(True)
+        self.libraryFacetButton.setToolTip("Tür, yıl, biçim ve bit hızına göre süz")
+        self.libraryFacetButton.toggled.connect(self._set_library_facets_visible)
+        library_nav_bar.addWidget(self.libraryFacetButton)
+        self.libraryViewButton = QPushButton("☰ Liste")
+        self.libraryViewButton.setCheckable(True)
+        self.libraryViewButton.setToolTip("Sanatçı/albüm ağacı ile düz liste arasında geçiş")
+        self.libraryViewButton.toggled.connect(self._set_library_flat_view)
+        library_nav_bar.addWidget(self.libraryViewButton)
+
         library_view = QWidget()
         library_layout = QVBoxLayout(library_view)
         library_layout.setContentsMargins(0, 0, 0, 0)
-        library_layout.addWidget(self.libraryTableWidget)
+        library_layout.addLayout(library_nav_bar)
+        self.libraryFacetPane = LibraryFacetPane()
+        self.libraryFacetPane.setVisible(False)
+        self.libraryFacetPane.filters_changed.connect(self._on_library_facets_changed)
+        library_layout.addWidget(self.libraryFacetPane)
+        library_layout.addWidget(self.libraryViewStack)
 
         # --- ÇALMA LİSTELERİ GÖRÜNÜMÜ ---
         playlist_view = QWidget()
@@ -1801,6 +5728,15 @@ class VisualizationWindow(QMainWindow):
         addFolderAction.triggered.connect(self.menu_add_folder)
         fileMenu.addAction(addFolderAction)
 
+        fileMenu.addSeparator()
+        importPlaylistAction = QAction("Çalma Listesi İçe Aktar...", self)
+        importPlaylistAction.triggered.connect(self.menu_import_playlist)
+        fileMenu.addAction(importPlaylistAction)
+
+        exportPlaylistAction = QAction("Çalma Listesini Dışa Aktar...", self)
+        exportPlaylistAction.triggered.connect(self.menu_export_playlist)
+        fileMenu.addAction(exportPlaylistAction)
+
         fileMenu.addSeparator()
         exitAction = QAction("&Çıkış", self)
         exitAction.triggered.connect(self.close)
@@ -1829,6 +5765,18 @@ class VisualizationWindow(QMainWindow):
         scanLibAction.triggered.connect(self.scan_library)
         toolsMenu.addAction(scanLibAction)
 
+        maintenanceAction = QAction("Kütüphane Bakımı (Eksik Dosyaları Temizle)", self)
+        maintenanceAction.triggered.connect(lambda: self.run_library_maintenance(interactive=True))
+        toolsMenu.addAction(maintenanceAction)
+
+        self.shuffleSpreadAction = QAction("Karıştırmada Sanatçı/Albüm Dağıt", self)
+        self.shuffleSpreadAction.setCheckable(True)
+        self.shuffleSpreadAction.setChecked(
+            getattr(self, "config_data", {}).get("shuffle_spread", False)
+        )
+        self.shuffleSpreadAction.triggered.connect(self.toggle_shuffle_spread)
+        toolsMenu.addAction(self.shuffleSpreadAction)
+
         prefsAction = QAction("Tercihler", self)
         prefsAction.triggered.connect(self.show_preferences)
         toolsMenu.addAction(prefsAction)
@@ -1856,22 +5804,41 @@ class VisualizationWindow(QMainWindow):
             self.show_playlist_context_menu
         )
         self.libraryTableWidget.doubleClicked.connect(self.library_double_clicked)
+        self.libraryTableWidget.sort_requested.connect(self._on_library_sort_requested)
         self.libraryTableWidget.customContextMenuRequested.connect(
             self.show_library_context_menu
         )
+        self.libraryTree.doubleClicked.connect(self.library_tree_double_clicked)
+        self.libraryTree.customContextMenuRequested.connect(
+            self.show_library_context_menu
+        )
 
-        self.volumeSlider.valueChanged.connect(self.mediaPlayer.setVolume)
+        self.volumeSlider.valueChanged.connect(self._set_player_volume)
         self.volumeSlider.valueChanged.connect(self._update_volume_label)
         self.volumeSlider.valueChanged.connect(self.save_config)
 
         self.positionSlider.sliderMoved.connect(self._set_position_safely_moved)
         self.positionSlider.sliderReleased.connect(self._set_position_safely)
 
-        self.mediaPlayer.positionChanged.connect(self.position_changed)
-        self.mediaPlayer.durationChanged.connect(self.duration_changed)
+        # Oynatıcı sinyalleri her iki deck için _init_playback_decks'te bağlanır
+        self._init_playback_decks()
+        self._init_eq_presets()
+        self._defer_startup("kütüphane izleyici", self._init_library_watcher)
+        # Veritabanı yazarı ve tarayıcı iş parçacıklarından gelen bildirimler
+        self.library.events.tracks_changed.connect(self._schedule_library_refresh)
+        self.library.events.scan_finished.connect(self._on_library_scan_finished)
+        self.library.events.maintenance_finished.connect(self._on_library_maintenance_finished)
+        self.library.events.watch_requested.connect(
+            lambda dirs: self._get_library_watcher().watch_dirs(dirs)
+        )
+        self.library.events.unwatch_requested.connect(
+            lambda roots: self._get_library_watcher().unwatch_trees(roots)
+        )
+        self.library.events.ingest_progress.connect(self._on_library_ingest_progress)
+        self._defer_startup("kütüphane bakım zamanlayıcı", self._init_library_maintenance)
         self.playlist.currentIndexChanged.connect(self.playlist_position_changed)
-        self.mediaPlayer.stateChanged.connect(self._update_status_bar)
-        self.mediaPlayer.mediaStatusChanged.connect(self._media_status_changed)
+        self.playlist.mediaInserted.connect(self._on_playlist_media_inserted)
+        self.playlist.mediaRemoved.connect(self._on_playlist_media_removed)
 
         QShortcut(QKeySequence("Space"), self, activated=self.play_pause)
         QShortcut(QKeySequence("Ctrl+Right"), self,
@@ -1885,105 +5852,546 @@ class VisualizationWindow(QMainWindow):
                  activated=self.playlistWidget.selectAll)
         QShortcut(QKeySequence("Ctrl+A"), self.libraryTableWidget,
                  activated=self.libraryTableWidget.selectAll)
+        QShortcut(QKeySequence("Ctrl+A"), self.libraryTree,
+                 activated=self.libraryTree.selectAll)
         QShortcut(QKeySequence("Ctrl+A"), self.file_tree,
                  activated=self.file_tree.selectAll)
 
 
-    # ------------------------------------------------------------------#
-    # OYNATMA
-    # ------------------------------------------------------------------#
+    # ------------------------------------------------------------------#
+    # OYNATMA
+    # ------------------------------------------------------------------#
+
+    def play_pause(self):
+        if self.mediaPlayer.state() == QMediaPlayer.PlayingState:
+            self.mediaPlayer.pause()
+        elif self.mediaPlayer.state() == QMediaPlayer.PausedState:
+            self.mediaPlayer.play()
+        else:
+            if self.playlist.currentIndex() >= 0:
+                self._load_deck(
+                    self.playlist.media(self.playlist.currentIndex()).request().url().toLocalFile()
+                )
+                self.mediaPlayer.play()
+
+    def _next_track(self):
+        if self.playlist.mediaCount() == 0 and not self._get_play_queue():
+            return
+        self._queue_skip(forward=True)
+
+    def _prev_track(self):
+        if self.playlist.mediaCount() == 0:
+            return
+        self._queue_skip(forward=False)
+
+    # ------------------------------------------------------------------#
+    # ATLAMA BİRLEŞTİRME
+    # ------------------------------------------------------------------#
+    # Hızlı ileri/geri basışlarında imleç yalnızca mantıksal olarak ilerler
+    # (kuyruk, karıştırma motoru ya da indeks aritmetiği; dosya açılmaz).
+    # Basışlar SKIP_COALESCE_MS boyunca durunca yalnızca son hedef yüklenir.
+
+    def _queue_skip(self, forward=True):
+        target = getattr(self, "_skip_target", None)
+        if target is None:
+            target = self._skip_target = {
+                "index": self.playlist.currentIndex(),
+                "queue_path": None,
+                "popped": [],     # bu atlama dizisinde kuyruktan alınanlar
+                "moved": False,
+            }
+
+        queue = self._get_play_queue()
+        popped = target["popped"]
+        if forward and queue:
+            # Üzerinden geçilen kuyruk parçaları ayrı basışlardaki gibi
+            # tüketilmiş sayılır; yalnızca geri basış onları kuyruğa döndürür
+            popped.append(queue.popleft())
+            target["queue_path"] = popped[-1]
+        elif not forward and target["queue_path"] is not None:
+            # Kuyruk parçasından geri: önceki kuyruk parçasına, o da yoksa
+            # listede durulan parçaya dön
+            queue.appendleft(popped.pop())
+            target["queue_path"] = popped[-1] if popped else None
+        else:
+            target["queue_path"] = None
+            base = target["index"] if target["moved"] else None
+            index = self._neighbour_index(forward, base=base)
+            if index is not None:
+                target["index"] = index
+                target["moved"] = True
+
+        # Yalnızca ucuz arayüz geri bildirimi: etiket ve seçili satır
+        if target["queue_path"] is not None:
+            label = os.path.basename(target["queue_path"])
+        else:
+            item = self.playlistWidget.item(target["index"])
+            label = item.text() if item else "-"
+            if item:
+                self.playlistWidget.setCurrentRow(target["index"])
+        self.fileLabel.setText(f"Şu An Çalınan: ⏭ {label}")
+        self._refresh_queue_view()
+
+        timer = getattr(self, "_skip_timer", None)
+        if timer is None:
+            timer = self._skip_timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(self._commit_skip)
+        timer.start(SKIP_COALESCE_MS)
+
+    def _commit_skip(self):
+        # Fade out sürüyorsa bitişinde güncel hedef uygulanır
+        if getattr(self, "_pending_advance", None) is not None:
+            return
+        self._fade_and_advance(apply=self._apply_skip_target)
+
+    def _apply_skip_target(self) -> bool:
+        target = getattr(self, "_skip_target", None)
+        self._skip_target = None
+        if target is None:
+            return False
+        # Üzerinden geçilen kuyruk parçaları tüketilmiştir (geri basışlar
+        # onları _queue_skip içinde zaten kuyruğa döndürdü); hedef kuyruk
+        # parçasıysa yalnızca o başa konup çalınır
+        if target["queue_path"] is not None:
+            self._get_play_queue().appendleft(target["queue_path"])
+            return self._play_from_queue()
+        index = target["index"]
+        if index == self.playlist.currentIndex() or \
+                not 0 <= index < self.playlist.mediaCount():
+            # Hedef değişmedi: etiketi geri getir (etiket okumadan)
+            item = self.playlistWidget.item(self.playlist.currentIndex())
+            self.fileLabel.setText(f"Şu An Çalınan: {item.text() if item else '-'}")
+            return False
+        self.playlist.setCurrentIndex(index)
+        return True
+
+    def _fade_and_advance(self, next=True, fade_ms=600, apply=None):
+        if apply is None:
+            apply = lambda: self._step_playlist(next)
+
+        # Çalarken crossfade açıksa: iki deck üst üste biner
+        if self._crossfade_ms() > 0 and \
+                self.mediaPlayer.state() == QMediaPlayer.PlayingState:
+            self._crossfade_pending = True
+            try:
+                if apply():
+                    self.mediaPlayer.play()
+            finally:
+                self._crossfade_pending = False
+            return
+
+        # Aksi halde fade out -> değiştir -> fade in. Fade sürerken yeni
+        # zamanlayıcı açılmaz; bekleyen geçiş tek sefer uygulanır.
+        if getattr(self, "_pending_advance", None) is not None:
+            return
+        self._pending_advance = apply
+
+        def _advance():
+            pending = self._pending_advance
+            self._pending_advance = None
+            if pending is not None:
+                pending()
+            self.mediaPlayer.play()
+            # Fade sırasında ses ayarı değiştiyse güncel değere açılır
+            self._fade_in_to(self.volumeSlider.value(), fade_ms)
+
+        self._get_crossfader().ramp(
+            self.mediaPlayer, 0, fade_ms, curve="out", on_done=_advance
+        )
+
+    def _step_playlist(self, next=True) -> bool:
+        """
+        Sıradaki/önceki parçaya geç. Sıra: çalma kuyruğu -> karıştırma
+        -> liste sırası. Geçilecek parça yoksa False döner.
+        """
+        if next and self._play_from_queue():
+            return True
+        target = self._neighbour_index(next)
+        if target is None:
+            return False
+        if target == self.playlist.currentIndex():
+            # Tek parçalık listede "tümünü tekrarla": indeks değişmez,
+            # sinyal gelmez; parça baştan yüklenir (ön yüklüyse deck değişir)
+            self._load_deck(self.current_file_path, force=True)
+            return True
+        self.playlist.setCurrentIndex(target)
+        return True
+
+    def _neighbour_index(self, next=True, consume=True, base=None) -> Optional[int]:
+        count = self.playlist.mediaCount()
+        if count == 0:
+            return None
+        repeat_all = self.is_repeating == QMediaPlaylist.Loop
+
+        resume = getattr(self, "_queue_resume_index", None)
+        if consume and next:
+            # Kuyruk bitti; liste kaldığı yerden devam eder
+            self._queue_resume_index = None
+
+        if getattr(self, "shuffle_enabled", False):
+            engine = self._get_shuffle_engine()
+            if not next:
+                return engine.previous() if consume else None
+            if consume:
+                return engine.next(repeat_all=repeat_all)
+            return engine.peek_next(repeat_all=repeat_all)
+
+        if base is None:
+            base = resume if (next and resume is not None) else self.playlist.currentIndex()
+        target = base + (1 if next else -1)
+        if 0 <= target < count:
+            return target
+        if repeat_all:
+            return target % count
+        return None
+
+    def _fade_in_to(self, target_vol=70, fade_ms=600):
+        self._get_crossfader().ramp(self.mediaPlayer, target_vol, fade_ms, curve="in")
+
+    def _get_crossfader(self) -> CrossfadeEngine:
+        fader = getattr(self, "crossfader", None)
+        if fader is None:
+            fader = self.crossfader = CrossfadeEngine(self)
+        return fader
+
+    def _crossfade_ms(self) -> int:
+        return int(self.config_data.get("crossfade_duration", 1000))
+
+    # ------------------------------------------------------------------#
+    # KARIŞTIRMA
+    # ------------------------------------------------------------------#
+
+    def _get_shuffle_engine(self) -> ShuffleEngine:
+        engine = getattr(self, "shuffle_engine", None)
+        if engine is None:
+            engine = ShuffleEngine(meta_lookup=self._shuffle_meta)
+            engine.spread = self.config_data.get("shuffle_spread", False)
+            self.shuffle_engine = engine
+        # Sinyaller kaçırıldıysa (ör. ilk açılış) listeyle yeniden eşitle
+        if len(engine) != self.playlist.mediaCount():
+            current = self.playlist.currentIndex()
+            engine.reset(self.playlist.mediaCount(), current if current >= 0 else None)
+        return engine
+
+    def _shuffle_meta(self, index: int):
+        """Yayma modu için (sanatçı, albüm); önce kütüphane önbelleği."""
+        item = self.playlistWidget.item(index)
+        if item is None:
+            return None, None
+        path = item.data(Qt.UserRole)
+        cache = getattr(self, "_shuffle_meta_cache", None)
+        if cache is None:
+            cache = self._shuffle_meta_cache = {}
+        if path not in cache:
+            row = self.library.get_tracks_by_paths([path]).get(path)
+            if row:
+                cache[path] = (row[1], row[2])
+            else:
+                cache[path] = (_split_display_title(item.text()).get("artist"), None)
+        return cache[path]
+
+    def _on_playlist_media_inserted(self, start, end):
+        if getattr(self, "shuffle_engine", None) is not None:
+            self.shuffle_engine.insert_range(start, end - start + 1)
+        resume = getattr(self, "_queue_resume_index", None)
+        if resume is not None and start <= resume:
+            self._queue_resume_index = resume + (end - start + 1)
+
+    def _on_playlist_media_removed(self, start, end):
+        if getattr(self, "shuffle_engine", None) is not None:
+            self.shuffle_engine.remove_range(start, end)
+        resume = getattr(self, "_queue_resume_index", None)
+        if resume is not None and resume >= start:
+            if resume <= end:
+                self._queue_resume_index = start - 1
+            else:
+                self._queue_resume_index = resume - (end - start + 1)
+
+    # ------------------------------------------------------------------#
+    # KESİNTİSİZ ÇALMA (İKİ DECK + ÖN YÜKLEME)
+    # ------------------------------------------------------------------#
+
+    def _init_playback_decks(self):
+        """
+        Başlangıçta seçilen arka uçla (QtMultimedia / libvlc) iki deck kurar.
+        Çalma listesi oynatıcıya bağlı değildir; parçayı
+        playlist_position_changed yükler. Sıradaki parça bitişten birkaç
+        saniye önce standby deck'te açılıp duraklatılır (preroll), bitişte
+        deck'ler yer değiştirir.
+        """
+        if getattr(self, "standbyPlayer", None) is not None:
+            return
+        legacy = self.mediaPlayer
+        legacy.setPlaylist(None)
+        # Analiz artık arka ucun PCM musluğundan beslenir
+        probe = getattr(self, "probe", None)
+        if probe is not None:
+            try:
+                probe.audioBufferProbed.disconnect()
+            except TypeError:
+                pass
+
+        name = select_playback_backend(self._get_config_store())
+        if name == QtMultimediaBackend.name:
+            self.mediaPlayer = QtMultimediaBackend(self, player=legacy)
+            self.standbyPlayer = QtMultimediaBackend(self)
+        else:
+            kwargs = {"instance": getattr(self, "vlc_instance", None)}
+            self.mediaPlayer = create_playback_backend(name, self, **kwargs)
+            self.standbyPlayer = create_playback_backend(name, self, **kwargs)
+        self._loaded_path = None
+        self._preloaded_path = None
+        self.probe_working = False
+        for deck in (self.mediaPlayer, self.standbyPlayer):
+            self._connect_deck_signals(deck)
+            deck.set_volume(self.volumeSlider.value())
+            self.probe_working = deck.enable_pcm_tap() or self.probe_working
+        self._apply_eq_to_decks(getattr(self, "current_eq_gains", None))
+
+    def _connect_deck_signals(self, deck):
+        # Yalnızca etkin deck'in sinyalleri arayüze ulaşır
+        deck.position_changed.connect(
+            lambda pos, d=deck: d is self.mediaPlayer and self._on_deck_position(pos)
+        )
+        deck.duration_changed.connect(
+            lambda dur, d=deck: d is self.mediaPlayer and self.duration_changed(dur)
+        )
+        deck.state_changed.connect(
+            lambda st, d=deck: d is self.mediaPlayer and self._update_status_bar(st)
+        )
+        deck.media_status_changed.connect(
+            lambda st, d=deck: d is self.mediaPlayer and self._media_status_changed(st)
+        )
+        deck.pcm_ready.connect(
+            lambda raw, bits, ch, d=deck: d is self.mediaPlayer and self.process_pcm(raw, bits, ch)
+        )
+
+    def _set_player_volume(self, value):
+        # Kullanıcı sesi değiştirdiyse etkin deck'teki rampayı bırak
+        # (bekleyen parça geçişi varsa onun çıkış rampası sürmeli; yeni
+        # değer geçişten sonraki fade in'in hedefi olur)
+        if getattr(self, "_pending_advance", None) is None:
+            self._get_crossfader().cancel(self.mediaPlayer)
+            self.mediaPlayer.set_volume(value)
 
-    def play_pause(self):
-        if self.mediaPlayer.state() == QMediaPlayer.PlayingState:
-            self.mediaPlayer.pause()
-        elif self.mediaPlayer.state() == QMediaPlayer.PausedState:
-            self.mediaPlayer.play()
+    def _load_deck(self, path: str, force=False) -> bool:
+        """
+        Parçayı etkin deck'e yükler. Standby deck'te ön yüklüyse deck'leri
+        değiştirir ve True döner (açma/çözme gecikmesi olmaz).
+        """
+        if not path or (path == self._loaded_path and not force):
+            return False
+        standby = self.standbyPlayer
+        fader = self._get_crossfader()
+        crossfade = getattr(self, "_crossfade_pending", False)
+        self._crossfade_pending = False
+        preloaded = path == self._preloaded_path and standby.media_status() in (
+            QMediaPlayer.LoadedMedia, QMediaPlayer.BufferingMedia,
+            QMediaPlayer.BufferedMedia
+        )
+        swapped = False
+        if preloaded or crossfade:
+            if not preloaded:
+                # Standby hâlâ önceki geçişten sönüyorsa onu kes; aynı parçayı
+                # hâlâ açıyorsa yeniden yükleyip preroll'u baştan başlatma
+                fader.cancel(standby)
+                if path != self._preloaded_path or standby.media_status() not in (
+                        QMediaPlayer.LoadingMedia, QMediaPlayer.StalledMedia):
+                    standby.load(path)
+            old = self.mediaPlayer
+            self.mediaPlayer, self.standbyPlayer = standby, old
+            self.mediaPlayer.set_muted(False)
+            if crossfade:
+                ms = self._crossfade_ms()
+                self.mediaPlayer.set_volume(0)
+                fader.ramp(self.mediaPlayer, self.volumeSlider.value(), ms, curve="in")
+                fader.ramp(
+                    old, 0, ms, curve="out",
+                    on_done=lambda p=old: p is not self.mediaPlayer and p.stop()
+                )
+            else:
+                fader.cancel(old)
+                self.mediaPlayer.set_volume(old.volume())
+                old.stop()
+            self.duration_changed(self.mediaPlayer.duration())
+            swapped = True
         else:
-            if self.playlist.currentIndex() >= 0:
-                self.mediaPlayer.play()
+            self.mediaPlayer.load(path)
+        self._loaded_path = path
+        self._preloaded_path = None
+        return swapped
+
+    def _peek_next_path(self) -> Optional[str]:
+        """Sıradaki parçanın yolu (kuyruk, tekrar, karıştırma sırasına göre)."""
+        queue = self._get_play_queue()
+        if queue:
+            return queue[0]
+        if self.is_repeating == QMediaPlaylist.CurrentItemInLoop:
+            return self.current_file_path
+        index = self._neighbour_index(next=True, consume=False)
+        if index is None:
+            return None
+        item = self.playlistWidget.item(index)
+        return item.data(Qt.UserRole) if item else None
+
+    def _on_deck_position(self, position):
+        self.position_changed(position)
+
+        duration = self.mediaPlayer.duration()
+        if duration <= 0:
+            return
+        remaining = duration - position
+        xfade_ms = self._crossfade_ms()
 
-    def _next_track(self):
-        if self.playlist.mediaCount() == 0:
+        # Crossfade penceresine girildi: ön yüklü parçaya üst üste geçiş
+        if xfade_ms > 0 and remaining <= xfade_ms and self._preloaded_path and \
+                self.mediaPlayer.state() == QMediaPlayer.PlayingState:
+            self._crossfade_pending = True
+            try:
+                if not self._auto_advance():
+                    self._preloaded_path = None
+            finally:
+                self._crossfade_pending = False
             return
-        # Manuel geçişlerde önce volümü hızlıca azalt, sonra parçayı değiştir ve tekrar aç
-        self._fade_and_advance(next=True)
 
-    def _prev_track(self):
-        if self.playlist.mediaCount() == 0:
+        lead_ms = int(self.config_data.get("preload_seconds", 5) * 1000)
+        if xfade_ms > 0:
+            lead_ms = max(lead_ms, xfade_ms + 1000)
+        if lead_ms <= 0 or remaining > lead_ms:
+            return
+        path = self._peek_next_path()
+        if not path or path == self._preloaded_path:
             return
-        # Manuel geçişlerde önce volümü azalt, sonra parçayı geri al ve tekrar aç
-        self._fade_and_advance(next=False)
+        standby = self.standbyPlayer
+        if self._get_crossfader().is_active(standby):
+            # Önceki geçiş hâlâ bu deck'te sönüyor
+            return
+        # Sessizce aç ve duraklat: arka uç dosyayı açar, ilk tamponu çözer
+        standby.set_muted(True)
+        standby.load(path)
+        standby.preroll()
+        self._preloaded_path = path
 
-    def _fade_and_advance(self, next=True, fade_ms=600):
-        # Basit fade out, değiştir, fade in
-        try:
-            start_vol = self.volumeSlider.value()
-            steps = 12
-            interval = max(20, int(fade_ms / steps))
-            step_delta = max(1, int(start_vol / steps))
-
-            def do_fade_out():
-                nonlocal steps
-                v = self.mediaPlayer.volume()
-                v = max(0, v - step_delta)
-                self.mediaPlayer.setVolume(v)
-                if v <= 0:
-                    fade_timer.stop()
-                    # İleri/geri
-                    if next:
-                        self.playlist.next()
-                    else:
-                        self.playlist.previous()
-                    # Yeni parçayı oynat
-                    self.mediaPlayer.play()
-                    # Fade in
-                    self._fade_in_to(start_vol)
+    def _apply_playback_mode(self):
+        """
+        İlerlemeyi (kuyruk, karıştırma, tekrar) biz yönetiriz; QMediaPlaylist
+        yalnızca tek parçayı çalar ya da "tekini tekrarla"da döngüye alır.
+        """
+        if self.is_repeating == QMediaPlaylist.CurrentItemInLoop:
+            self.playlist.setPlaybackMode(QMediaPlaylist.CurrentItemInLoop)
+        else:
+            self.playlist.setPlaybackMode(QMediaPlaylist.CurrentItemOnce)
 
-            fade_timer = QTimer(self)
-            fade_timer.timeout.connect(do_fade_out)
-            fade_timer.start(interval)
-        except Exception:
-            # Fallback: normal davranış
-            if next:
-                self.playlist.next()
+    # ------------------------------------------------------------------#
+    # ÇALMA KUYRUĞU ("Sıradaki olarak çal")
+    # ------------------------------------------------------------------#
+
+    def _get_play_queue(self) -> deque:
+        queue = getattr(self, "play_queue", None)
+        if queue is None:
+            queue = self.play_queue = deque()
+        return queue
+
+    def queue_paths(self, paths: List[str], play_next=False):
+        queue = self._get_play_queue()
+        if play_next:
+            queue.extendleft(reversed(paths))
+        else:
+            queue.extend(paths)
+        self._refresh_queue_view()
+        self.statusBar().showMessage(
+            f"{len(paths)} parça kuyruğa eklendi ({len(queue)} bekliyor).", 3000
+        )
+
+    def _playlist_index_of(self, path: str) -> int:
+        for i in range(self.playlistWidget.count()):
+            if self.playlistWidget.item(i).data(Qt.UserRole) == path:
+                return i
+        return -1
+
+    def _play_from_queue(self) -> bool:
+        """Kuyrukta parça varsa onu çalmaya hazırla (listeyi yeniden kurmadan)."""
+        queue = self._get_play_queue()
+        while queue:
+            path = queue.popleft()
+            if not os.path.exists(path):
+                continue
+            current = self.playlist.currentIndex()
+            if getattr(self, "_queue_resume_index", None) is None:
+                self._queue_resume_index = current
+            index = self._playlist_index_of(path)
+            if index < 0:
+                # Listede yoksa yalnızca tek bir öğe olarak araya ekle
+                index = current + 1
+                self._insert_playlist_item(index, path)
+                # Kaldığı yerin hemen ardına eklenen kuyruk parçası da geride
+                # kalmalı; yoksa kuyruk bitince liste onu yeniden çalar
+                if self._queue_resume_index == index - 1:
+                    self._queue_resume_index = index
+            self._from_queue = True
+            try:
+                self.playlist.setCurrentIndex(index)
+            finally:
+                self._from_queue = False
+            self._refresh_queue_view()
+            return True
+        self._refresh_queue_view()
+        return False
+
+    def _insert_playlist_item(self, index: int, path: str):
+        title, artist, _, _ = self._get_tags_from_file_with_duration(path)
+        item = QListWidgetItem(f"{artist} - {title}")
+        item.setData(Qt.UserRole, path)
+        self.playlist.insertMedia(index, QMediaContent(QUrl.fromLocalFile(path)))
+        self.playlistWidget.insertItem(index, item)
+
+    def _refresh_queue_view(self):
+        overlay = getattr(self, "queueOverlay", None)
+        if overlay is None:
+            overlay = self.queueOverlay = PlayQueueOverlay(self.playlistWidget, self)
+        queue = self._get_play_queue()
+        cached = self.library.get_tracks_by_paths(list(queue)) if queue else {}
+        labels = []
+        for path in queue:
+            if path in cached:
+                title, artist, _, _ = cached[path]
+                labels.append(f"{artist} - {title}")
             else:
-                self.playlist.previous()
-            self.mediaPlayer.play()
+                labels.append(os.path.basename(path))
+        overlay.set_entries(labels)
 
-    def _fade_in_to(self, target_vol=70, fade_ms=600):
-        try:
-            current = self.mediaPlayer.volume()
-            steps = 12
-            interval = max(20, int(fade_ms / steps))
-            step_delta = max(1, int((target_vol - current) / steps))
-
-            def do_fade_in():
-                v = self.mediaPlayer.volume()
-                v = min(target_vol, v + step_delta)
-                self.mediaPlayer.setVolume(v)
-                if v >= target_vol:
-                    tin.stop()
-
-            tin = QTimer(self)
-            tin.timeout.connect(do_fade_in)
-            tin.start(interval)
-        except Exception:
-            pass
+    def remove_from_queue(self, rows: List[int]):
+        queue = self._get_play_queue()
+        keep = [p for i, p in enumerate(queue) if i not in set(rows)]
+        queue.clear()
+        queue.extend(keep)
+        self._refresh_queue_view()
+
+    def clear_queue(self):
+        self._get_play_queue().clear()
+        self._refresh_queue_view()
 
     def toggle_shuffle(self):
-        if self.playlist.playbackMode() != QMediaPlaylist.Random:
-            self.is_repeating = self.playlist.playbackMode()
-            self.playlist.setPlaybackMode(QMediaPlaylist.Random)
+        self.shuffle_enabled = not getattr(self, "shuffle_enabled", False)
+        if self.shuffle_enabled:
+            current = self.playlist.currentIndex()
+            self._get_shuffle_engine().reset(
+                self.playlist.mediaCount(), current if current >= 0 else None
+            )
             self.shuffleButton.setText("🔀 (On)")
         else:
-            self.playlist.setPlaybackMode(self.is_repeating)
             self.shuffleButton.setText("🔀 (Off)")
+        self._apply_playback_mode()
+        self.save_config()
+
+    def toggle_shuffle_spread(self, checked):
+        self.config_data["shuffle_spread"] = bool(checked)
+        self._get_shuffle_engine().spread = bool(checked)
         self.save_config()
 
     def toggle_repeat(self):
-        current_mode = self.playlist.playbackMode()
-        if current_mode == QMediaPlaylist.Random and self.is_repeating != QMediaPlaylist.Random:
-            current_mode = self.is_repeating
+        current_mode = self.is_repeating
 
         if current_mode == QMediaPlaylist.Sequential:
             new_mode = QMediaPlaylist.CurrentItemInLoop
@@ -1998,9 +6406,8 @@ class VisualizationWindow(QMainWindow):
             new_mode = QMediaPlaylist.Sequential
             self.repeatButton.setText("🔁 (Off)")
 
-        if self.playlist.playbackMode() != QMediaPlaylist.Random:
-            self.playlist.setPlaybackMode(new_mode)
         self.is_repeating = new_mode
+        self._apply_playback_mode()
         self.save_config()
 
     def _update_volume_label(self, value):
@@ -2011,13 +6418,15 @@ class VisualizationWindow(QMainWindow):
             self.equalizerWidget.hide()
             self.statusBar().showMessage("Ekolayzır Gizlendi", 2000)
         else:
+            self._ensure_eq_presets_listed()
             self.equalizerWidget.show()
             # Kullanıcıyı ilk açılışta bilgilendir
-            if not hasattr(self, '_eq_first_shown'):
+            if not hasattr(self, '_eq_first_shown') and \
+                    not self.mediaPlayer.supports_equalizer:
                 self._eq_first_shown = True
                 self.statusBar().showMessage(
-                    "⚠️ NOT: Ekolayzır şu anda sadece görselleştirmeyi etkiler. "
-                    "Gerçek ses efekti için gelecek sürümlerde VLC desteği eklenecek.",
+                    "⚠️ NOT: Bu ses motorunda ekolayzır sadece görselleştirmeyi etkiler. "
+                    "Gerçek ses efekti için Tercihler'den VLC motorunu seçin.",
                     6000
                 )
             else:
@@ -2071,52 +6480,41 @@ class VisualizationWindow(QMainWindow):
     # MEDYA OLAYLARI
     # ------------------------------------------------------------------#
 
+    @staticmethod
+    def _format_time(ms: int) -> str:
+        minutes, seconds = divmod(max(0, int(ms)) // 1000, 60)
+        return f"{minutes:02d}:{seconds:02d}"
+
+    def _show_time(self, position: int, duration: int):
+        # Etiket yalnızca görünen saniye değişince güncellenir
+        key = (position // 1000, duration // 1000)
+        if key == getattr(self, "_shown_time_key", None):
+            return
+        self._shown_time_key = key
+        self.timeLabel.setText(
+            f"{self._format_time(position)} / {self._format_time(duration)}"
+        )
+
     def position_changed(self, position):
         if not self.positionSlider.isSliderDown():
             self.positionSlider.setValue(position)
 
         total_duration = self.mediaPlayer.duration()
         if total_duration > 0:
-            current_time = QTime(0, 0).addMSecs(position).toString("mm:ss")
-            total_time = QTime(0, 0).addMSecs(total_duration).toString("mm:ss")
-            self.timeLabel.setText(f"{current_time} / {total_time}")
-            # İlerleme çubuğunun dolu kısmını tema rengine göre renklendir
-            try:
-                pct = int((position / total_duration) * 100)
-            except Exception:
-                pct = 0
-            primary = self.themes.get(self.theme, ("#40C4FF", "#FFFFFF", "#2A2A2A"))[0]
-            accent = "#FFFFFF"
-            # Stil: sub-page rengi tema renkleriyle degrade
-            style = f"QSlider::groove:horizontal{{height:8px;background:#333333;border-radius:4px;}}"
-            style += (
-                "QSlider::sub-page:horizontal{height:8px;border-radius:4px;"
-                f"background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 {primary}, stop:1 {accent});}}"
-            )
-            style += "QSlider::add-page:horizontal{background: #2E2E2E;border-radius:4px;}QSlider::handle:horizontal{background:#FFFFFF;border:1px solid #888;width:12px;margin:-3px 0;border-radius:6px;}"
-            try:
-                self.positionSlider.setStyleSheet(style)
-            except Exception:
-                pass
+            self._show_time(position, total_duration)
 
     def duration_changed(self, duration):
         self.positionSlider.setRange(0, duration)
-        if duration > 0:
-            total_time = QTime(0, 0).addMSecs(duration).toString("mm:ss")
-            self.timeLabel.setText(f"00:00 / {total_time}")
-        else:
-            self.timeLabel.setText("00:00 / 00:00")
+        self._show_time(0, max(0, duration))
 
     def _set_position_safely_moved(self, position):
         total_duration = self.mediaPlayer.duration()
         if total_duration > 0:
-            current_time = QTime(0, 0).addMSecs(position).toString("mm:ss")
-            total_time = QTime(0, 0).addMSecs(total_duration).toString("mm:ss")
-            self.timeLabel.setText(f"{current_time} / {total_time}")
+            self._show_time(position, total_duration)
 
     def _set_position_safely(self):
-        if self.mediaPlayer.isSeekable():
-            self.mediaPlayer.setPosition(self.positionSlider.value())
+        if self.mediaPlayer.is_seekable():
+            self.mediaPlayer.seek(self.positionSlider.value())
 
     def playlist_position_changed(self, index):
         if index < 0 or index >= self.playlist.mediaCount():
@@ -2132,6 +6530,8 @@ class VisualizationWindow(QMainWindow):
 
         url = self.playlist.media(index).request().url()
         self.current_file_path = url.toLocalFile()
+        swapped = self._load_deck(self.current_file_path)
+        self._auto_eq_for_track(self.current_file_path)
         title, artist, album = self._get_tags_from_file(self.current_file_path)
 
         self.fileLabel.setText(f"Şu An Çalınan: {artist} - {title}")
@@ -2145,11 +6545,20 @@ class VisualizationWindow(QMainWindow):
         except Exception:
             pass
 
-        for i in range(self.playlistWidget.count()):
-            item = self.playlistWidget.item(i)
-            item.setSelected(i == index)
+        # Tüm satırları dolaşmadan yalnızca çalan satırı seç
+        self.playlistWidget.clearSelection()
         if 0 <= index < self.playlistWidget.count():
             self.playlistWidget.setCurrentRow(index)
+            self.playlistWidget.item(index).setSelected(True)
+
+        # Elle seçilen parçayı karıştırma geçmişine işle (kuyruktan gelen hariç)
+        if getattr(self, "shuffle_enabled", False) and \
+                not getattr(self, "_from_queue", False):
+            self._get_shuffle_engine().jump_to(index)
+
+        # Ön yüklenmiş deck devraldıysa ses zaten doğru seviyede (kesintisiz geçiş)
+        if swapped:
+            return
 
         # Yeni parçaya geçildiğinde yumuşak açma (volume fade-in)
         try:
@@ -2158,22 +6567,31 @@ class VisualizationWindow(QMainWindow):
             # Başlangıçta volüm çok düşükse (otomatik geçişlerde), önce 0'a çek ve yavaşça aç
             if self.mediaPlayer.volume() > target_vol:
                 # Eğer oynatılanın volümü hedefin üzerinde ise doğrudan ayarla
-                self.mediaPlayer.setVolume(target_vol)
+                self.mediaPlayer.set_volume(target_vol)
             else:
                 # Eğer şu an küçükse, fade in
-                self.mediaPlayer.setVolume(0)
+                self.mediaPlayer.set_volume(0)
                 self._fade_in_to(target_vol)
         except Exception:
             pass
 
     def _media_status_changed(self, status):
         if status == QMediaPlayer.EndOfMedia:
-            if (
-                self.playlist.playbackMode() == QMediaPlaylist.Sequential
-                and self.playlist.currentIndex() == self.playlist.mediaCount() - 1
-            ):
+            if not self._auto_advance():
                 self.statusBar().showMessage("Çalma listesi sona erdi.", 3000)
 
+    def _auto_advance(self) -> bool:
+        """Parça bitişinde (ya da crossfade başında) sıradakine geç."""
+        if self.is_repeating == QMediaPlaylist.CurrentItemInLoop and self.current_file_path:
+            self._load_deck(self.current_file_path, force=True)
+            self.mediaPlayer.play()
+            return True
+        # Sıradakini kuyruk/karıştırma/liste sırası belirler
+        if self._step_playlist(next=True):
+            self.mediaPlayer.play()
+            return True
+        return False
+
     def update_playlist_order_after_drag(self):
         new_paths = []
         for i in range(self.playlistWidget.count()):
@@ -2204,21 +6622,19 @@ class VisualizationWindow(QMainWindow):
             return
 
         ext = os.path.splitext(file_path)[1].lower()
-        if ext not in [".mp3", ".flac", ".ogg", ".m4a", ".wav"]:
+        if ext not in AUDIO_EXTENSIONS:
             self.statusBar().showMessage(
                 f"Hata: Desteklenmeyen dosya türü: {ext}", 5000
             )
             return
 
-        title, artist, album, duration = self._get_tags_from_file_with_duration(file_path)
-
         if add_to_library:
-            self.library.add_track(file_path, {
-                "title": title,
-                "artist": artist,
-                "album": album,
-                "duration": duration,
-            })
+            # Tek okuma: sıralama ve teknik alanlar da kütüphaneye yazılır
+            tags = self._read_track_tags(file_path)
+            self.library.add_track(file_path, tags)
+            title, artist = tags["title"], tags["artist"]
+        else:
+            title, artist, _, _ = self._get_tags_from_file_with_duration(file_path)
 
         url = QUrl.fromLocalFile(file_path)
         self.playlist.addMedia(QMediaContent(url))
@@ -2238,8 +6654,6 @@ class VisualizationWindow(QMainWindow):
                 self._add_folder(path, add_to_library)
             else:
                 self._add_media(path, add_to_library)
-        if add_to_library:
-            self.refresh_library_view()
 
     def _add_folder(self, folder_path, add_to_library=False):
         if not os.path.isdir(folder_path):
@@ -2247,40 +6661,144 @@ class VisualizationWindow(QMainWindow):
         for root, _, files in os.walk(folder_path):
             for file in files:
                 ext = os.path.splitext(file)[1].lower()
-                if ext in [".mp3", ".flac", ".ogg", ".m4a", ".wav"]:
+                if ext in AUDIO_EXTENSIONS:
                     self._add_media(os.path.join(root, file), add_to_library)
 
     def _get_tags_from_file_with_duration(self, file_path):
-        title = os.path.basename(file_path)
-        artist = "Bilinmeyen Sanatçı"
-        album = "Bilinmeyen Albüm"
-        duration = 0
-
-        if MutagenFile is not None and os.path.exists(file_path):
-            try:
-                audio = MutagenFile(file_path)
-                if audio:
-                    if audio.info and hasattr(audio.info, "length"):
-                        duration = int(audio.info.length * 1000)
-
-                    if audio.tags:
-                        if ID3 and isinstance(audio.tags, ID3):
-                            title = str(audio.tags.get("TIT2", [title])[0])
-                            artist = str(audio.tags.get("TPE1", [artist])[0])
-                            album = str(audio.tags.get("TALB", [album])[0])
-                        elif MP4 and isinstance(audio, MP4):
-                            title = str(audio.tags.get("\xa9nam", [title])[0])
-                            artist = str(audio.tags.get("\xa9ART", [artist])[0])
-                            album = str(audio.tags.get("\xa9alb", [album])[0])
-            except Exception:
-                pass
-
-        return title, artist, album, duration
+        tags = read_full_tags(file_path) if os.path.exists(file_path) else {}
+        return (
+            tags.get("title", os.path.basename(file_path)),
+            tags.get("artist", "Bilinmeyen Sanatçı"),
+            tags.get("album", "Bilinmeyen Albüm"),
+            tags.get("duration", 0),
+        )
 
     def _get_tags_from_file(self, file_path):
         t, a, al, _ = self._get_tags_from_file_with_duration(file_path)
         return t, a, al
 
+    def _read_track_tags(self, file_path) -> Dict[str, Any]:
+        """Tarama için: önce hızlı okuyucu, olmazsa tam Mutagen okuması."""
+        tags = read_scan_tags(file_path)
+        if tags is None:
+            tags = read_full_tags(file_path)
+        tags.setdefault("title", os.path.basename(file_path))
+        tags.setdefault("artist", "Bilinmeyen Sanatçı")
+        tags.setdefault("album", "Bilinmeyen Albüm")
+        tags.setdefault("duration", 0)
+        tags["signature"] = content_signature(file_path)
+        return tags
+
+    def _match_moved_tracks(self, new_paths: List[str], missing_paths: List[str]):
+        """
+        Yeni görünen dosyaları kaybolan kayıtlarla içerik imzasıyla eşleştirir;
+        eşleşen satırlar yeni yola taşınır, etiketleri yeniden okunmaz. Özet
+        yalnızca ses boyu bir adayla tutan dosyalar için hesaplanır.
+        Dönüş: (hâlâ okunacak yollar, taşınan (eski, yeni) çiftleri).
+        """
+        if not new_paths or not missing_paths:
+            return list(new_paths), []
+        known = self.library.get_signatures(list(new_paths) + list(missing_paths))
+        candidates: Dict[str, List[str]] = {}
+        for path in missing_paths:
+            if known.get(path):
+                candidates.setdefault(known[path], []).append(path)
+        if not candidates:
+            return list(new_paths), []
+        sizes = {int(sig.split(":", 1)[0]) for sig in candidates}
+        remaining, moves = [], []
+        for path in new_paths:
+            # Veritabanında zaten olan yol değişmiş dosyadır, taşınmış değil
+            if path not in known:
+                matches = candidates.get(content_signature(path, sizes))
+                if matches:
+                    moves.append((matches.pop(), path))
+                    continue
+            remaining.append(path)
+        self.library.move_tracks(moves)
+        return remaining, moves
+
+    def _scan_library_tree(self, root: str):
+        """
+        Artımlı kütüphane taraması. mtime değeri kayıtlı olanla aynı klasörler
+        listelenmez; alt klasörleri veritabanındaki ağaçtan alınıp yalnızca
+        stat edilir. Listelenen klasörlerde DirEntry tür bilgisi kullanılır,
+        etiketler yalnızca yeni/değişen dosyalar için okunur.
+        Dönüş: (okunan dosya, atlanan klasör) sayıları.
+        """
+        root = os.path.normpath(root)
+        known_dirs = self.library.get_dir_states_under(root)
+        children: Dict[str, List[str]] = {}
+        for path, (parent, _, _) in known_dirs.items():
+            children.setdefault(parent, []).append(path)
+        known_files = self.library.get_scan_times_under(root, recursive=True)
+        files_by_dir: Dict[str, List[str]] = {}
+        for path in known_files:
+            files_by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+        # Tarama sırasında değişmiş olabilecek klasörün mtime'ı güvenilmez
+        # sayılır (kaba zaman çözünürlüklü dosya sistemleri); bir sonraki
+        # taramada yeniden listelenir.
+        racy_after = time.time_ns() - 2_000_000_000
+        to_read, to_remove, gone_dirs, dir_rows = [], [], [], []
+        skipped = 0
+        stack = [root]
+        while stack:
+            folder = stack.pop()
+            try:
+                mtime_ns = os.stat(folder).st_mtime_ns
+            except OSError:
+                gone_dirs.append(folder)
+                continue
+            state = known_dirs.get(folder)
+            if state is not None and state[1] == mtime_ns:
+                skipped += 1
+                stack.extend(children.get(folder, ()))
+                continue
+
+            subdirs, on_disk, count = [], set(), 0
+            try:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        count += 1
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.name.lower().endswith(AUDIO_EXTENSIONS) and entry.is_file():
+                                on_disk.add(entry.path)
+                                if entry.stat().st_mtime > known_files.get(entry.path, -1):
+                                    to_read.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+            to_remove.extend(p for p in files_by_dir.get(folder, ()) if p not in on_disk)
+            present = set(subdirs)
+            gone_dirs.extend(d for d in children.get(folder, ()) if d not in present)
+            stack.extend(subdirs)
+            dir_rows.append((
+                folder, os.path.dirname(folder),
+                -1 if mtime_ns > racy_after else mtime_ns, count
+            ))
+
+        # Silinen klasörlerdeki parçalar da taşınmış olabilir; taşıma
+        # yazar kuyruğunda silmeden önce yer alır
+        gone_prefixes = tuple(d.rstrip(os.sep) + os.sep for d in gone_dirs)
+        missing = to_remove + [p for p in known_files if p.startswith(gone_prefixes)]
+        to_read, moves = self._match_moved_tracks(to_read, missing)
+        moved = {old for old, _ in moves}
+        self.library.remove_dirs(gone_dirs)
+        self.library.remove_tracks([p for p in to_remove if p not in moved])
+        for start in range(0, len(to_read), LIBRARY_INGEST_CHUNK):
+            self.library.add_tracks([
+                (path, self._read_track_tags(path))
+                for path in to_read[start:start + LIBRARY_INGEST_CHUNK]
+            ])
+        # Klasör durumu en son yazılır; yarıda kalan tarama bir dahakine tekrarlanır
+        self.library.save_dir_states(dir_rows)
+        return len(to_read), skipped
+
     # ------------------------------------------------------------------#
     # KÜTÜPHANE
     # ------------------------------------------------------------------#
@@ -2289,27 +6807,400 @@ class VisualizationWindow(QMainWindow):
         folder = QFileDialog.getExistingDirectory(
             self, "Kütüphaneye Klasör Ekle ve Tara"
         )
-        if folder:
-            self.statusBar().showMessage("Kütüphane taranıyor...", 0)
-            self._add_folder(folder, add_to_library=True)
-            self.refresh_library_view()
-            self.statusBar().showMessage("Kütüphane taraması tamamlandı.", 3000)
+        if not folder:
+            return
+        worker = getattr(self, "_library_scan_thread", None)
+        if worker is not None and worker.is_alive():
+            self.statusBar().showMessage("Önceki kütüphane taraması sürüyor.", 3000)
+            return
+        self.statusBar().showMessage("Kütüphane taranıyor...", 0)
+        # Tarama arka planda; yazmalar veritabanı yazar kuyruğundan geçer
+        self._library_scan_thread = threading.Thread(
+            target=self._run_library_scan, args=(folder,),
+            name="angolla-library-scan", daemon=True
+        )
+        self._library_scan_thread.start()
+
+    def _run_library_scan(self, folder: str):
+        try:
+            read, skipped = self._scan_library_tree(folder)
+        except Exception as e:
+            print(f"Kütüphane tarama hatası: {e}")
+            read, skipped = 0, 0
+        self.library.flush()
+        self.library.release_reader()
+        self.library.events.scan_finished.emit(folder, read, skipped)
+
+    def _on_library_scan_finished(self, folder: str, read: int, skipped: int):
+        self.statusBar().showMessage(
+            f"Kütüphane taraması tamamlandı: {read} dosya okundu, "
+            f"{skipped} klasör değişmemiş.", 3000
+        )
+        # Parçalar çalma listesine önbellekteki etiketlerle eklenir
+        paths = sorted(self.library.get_scan_times_under(folder, recursive=True))
+        self._start_playlist_import(((p, {}) for p in paths), "Parçalar ekleniyor...")
+        # Klasör artık izlenir; sonraki değişiklikler kendiliğinden gelir
+        roots = list(self.config_data.get("library_roots", []))
+        if folder not in roots:
+            roots.append(folder)
+            self.config_data["library_roots"] = roots
+        self._watch_library_root(folder)
+
+    # ------------------------------------------------------------------#
+    # KÜTÜPHANE BAKIMI
+    # ------------------------------------------------------------------#
+
+    def _init_library_maintenance(self):
+        # Boşta (çalma yokken) ve son bakımdan bu yana yeterli süre geçtiyse çalışır
+        timer = self._library_maintenance_timer = QTimer(self)
+        timer.setInterval(LIBRARY_MAINTENANCE_CHECK_MS)
+        timer.timeout.connect(self._maybe_run_library_maintenance)
+        timer.start()
+
+    def _maybe_run_library_maintenance(self):
+        last = self.config_data.get("library_maintenance_at", 0.0)
+        if time.time() - last < LIBRARY_MAINTENANCE_INTERVAL:
+            return
+        if self.mediaPlayer.state() == QMediaPlayer.PlayingState:
+            return
+        scan = getattr(self, "_library_scan_thread", None)
+        if scan is not None and scan.is_alive():
+            return
+        self.run_library_maintenance(interactive=False)
+
+    def run_library_maintenance(self, interactive=True):
+        worker = getattr(self, "_library_maintenance_thread", None)
+        if worker is not None and worker.is_alive():
+            if interactive:
+                self.statusBar().showMessage("Kütüphane bakımı zaten sürüyor.", 3000)
+            return
+        if interactive:
+            self.statusBar().showMessage("Kütüphane bakımı: eksik dosyalar aranıyor...", 0)
+        roots = list(self.config_data.get("library_roots", []))
+        self._library_maintenance_thread = threading.Thread(
+            target=self._run_library_maintenance, args=(roots, interactive),
+            name="angolla-library-maintenance", daemon=True
+        )
+        self._library_maintenance_thread.start()
+
+    def _run_library_maintenance(self, roots: List[str], interactive: bool):
+        try:
+            removed, unreachable = self.library.prune_missing(roots)
+            self.library.flush()
+            self.library.optimize()
+        except Exception as e:
+            print(f"Kütüphane bakım hatası: {e}")
+            removed, unreachable = [], 0
+        self.library.release_reader()
+        self.library.events.maintenance_finished.emit(removed, unreachable, interactive)
+
+    def _on_library_maintenance_finished(self, removed: List[str], unreachable: int,
+                                         interactive: bool):
+        self.config_data["library_maintenance_at"] = time.time()
+        for path in removed:
+            print(f"Kütüphaneden silindi (dosya yok): {path}")
+        message = f"Kütüphane bakımı: {len(removed)} eksik dosya kaydı silindi."
+        if unreachable:
+            message += f" Erişilemeyen konumdaki {unreachable} parça korundu."
+        self.statusBar().showMessage(message, 5000)
+        if interactive and removed:
+            listed = "\n".join(removed[:20])
+            more = f"\n… ve {len(removed) - 20} dosya daha" if len(removed) > 20 else ""
+            QMessageBox.information(self, "Kütüphane Bakımı", f"{message}\n\n{listed}{more}")
+
+    def _schedule_library_refresh(self):
+        # Yazar her COMMIT'te bildirir; art arda gelenler tek yenilemeye iner
+        timer = getattr(self, "_library_refresh_timer", None)
+        if timer is None:
+            timer = self._library_refresh_timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(250)
+            timer.timeout.connect(self.refresh_library_view)
+        timer.start()
+
+    # ------------------------------------------------------------------#
+    # CANLI KÜTÜPHANE GÜNCELLEME
+    # ------------------------------------------------------------------#
+
+    def _get_library_watcher(self) -> LibraryWatcher:
+        watcher = getattr(self, "library_watcher", None)
+        if watcher is None:
+            watcher = self.library_watcher = LibraryWatcher(self)
+            watcher.dirs_changed.connect(self._on_library_dirs_changed)
+        return watcher
+
+    def _library_worker(self) -> ThreadPoolExecutor:
+        """
+        Canlı güncelleme işçisi: klasör listeleme, os.walk, etiket okuma ve
+        imza hesabı arayüz iş parçacığında yapılmaz. Tek iş parçacığı,
+        olay kümeleri sırayla işlenir; arayüze yalnızca izleyiciye
+        ekle/çıkar ve ilerleme bildirimleri (LibraryEvents) döner.
+        """
+        worker = getattr(self, "_library_ingest_worker", None)
+        if worker is None:
+            worker = self._library_ingest_worker = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="angolla-library-ingest"
+            )
+        return worker
+
+    def _submit_library_task(self, func, *args):
+        def _report(done):
+            error = done.exception()
+            if error is not None:
+                print(f"Kütüphane güncelleme hatası: {error}")
+
+        try:
+            self._library_worker().submit(func, *args).add_done_callback(_report)
+        except RuntimeError:
+            pass  # kapanışta işçi durdurulmuş
+
+    def _init_library_watcher(self):
+        self._get_library_watcher()
+        for root in self.config_data.get("library_roots", []):
+            self._watch_library_root(root)
+        self._submit_library_task(self._backfill_library_signatures)
+
+    def _backfill_library_signatures(self):
+        # İşçide: imza sütunu sonradan eklendiyse eski kayıtlar etiketleri
+        # yeniden okunmadan, yalnızca içerik imzasıyla doldurulur
+        for paths in self.library.iter_unsigned_paths(LIBRARY_PRUNE_BATCH):
+            rows = [(content_signature(path), path) for path in paths]
+            self.library.fill_signatures([row for row in rows if row[0]])
+
+    def _watch_library_root(self, root: str):
+        self._submit_library_task(self._walk_library_root, root)
+
+    def _walk_library_root(self, root: str):
+        # İşçide: kökün tüm klasörleri tek bildirimle izleyiciye eklenir
+        if os.path.isdir(root):
+            self.library.events.watch_requested.emit([d for d, _, _ in os.walk(root)])
+
+    def _on_library_dirs_changed(self, dirs: List[str]):
+        self._submit_library_task(self._process_library_dirs, dirs)
+
+    def _process_library_dirs(self, dirs: List[str]):
+        """
+        İşçide: birleştirilmiş klasör olaylarını artımlı alıma çevirir.
+        Diskteki ses dosyaları ile veritabanındaki kayıtlar karşılaştırılır,
+        yalnızca yeni/değişen dosyalar okunur. Kaybolan dosyalar
+        LIBRARY_MOVE_GRACE_MS boyunca bekletilir; bu sürede başka klasörde
+        aynı imzayla görünen dosya taşıma sayılır, kalanlar toplu kaldırılır.
+        Ses dosyası olmayan yeni klasörler (kapak/"Scans") hatırlanır, her
+        olayda yeniden dolaşılmaz.
+        """
+        events = self.library.events
+        empty_dirs = getattr(self, "_library_empty_dirs", None)
+        if empty_dirs is None:
+            empty_dirs = self._library_empty_dirs = set()
+        to_read, to_remove, gone, watch = [], [], [], []
+        for folder in dirs:
+            # Olay doğrudan bu klasörden geldiyse içeriği yeniden değerlendirilir
+            empty_dirs.discard(folder)
+            if not os.path.isdir(folder):
+                gone.append(folder)
+                to_remove.extend(self.library.get_scan_times_under(folder, recursive=True))
+                continue
+            known = self.library.get_scan_times_under(folder)
+            on_disk = set()
+            try:
+                with os.scandir(folder) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir():
+                                if entry.path in empty_dirs:
+                                    continue
+                                # Yeni (ya da içeri taşınan) alt klasör
+                                if not self.library.get_scan_times_under(entry.path, recursive=True):
+                                    found = []
+                                    for root, _, files in os.walk(entry.path):
+                                        watch.append(root)
+                                        found.extend(
+                                            os.path.join(root, f) for f in files
+                                            if f.lower().endswith(AUDIO_EXTENSIONS)
+                                        )
+                                    if not found:
+                                        empty_dirs.add(entry.path)
+                                    to_read.extend(found)
+                            elif entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                                on_disk.add(entry.path)
+                                if entry.stat().st_mtime > known.get(entry.path, -1):
+                                    to_read.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            to_remove.extend(p for p in known if p not in on_disk)
+
+        if gone:
+            events.unwatch_requested.emit(gone)
+        if watch:
+            events.watch_requested.emit(watch)
+
+        missing = getattr(self, "_library_missing", None)
+        if missing is None:
+            missing = self._library_missing = {}
+        now = time.monotonic()
+        for path in to_remove:
+            missing.setdefault(path, now)
+        to_read, moves = self._match_moved_tracks(list(dict.fromkeys(to_read)), list(missing))
+        for old, _ in moves:
+            del missing[old]
+        if missing:
+            timer = threading.Timer(
+                LIBRARY_MOVE_GRACE_MS / 1000,
+                self._submit_library_task, args=(self._purge_missing_tracks,)
+            )
+            timer.daemon = True
+            timer.start()
+        self._ingest_library_files(to_read)
+
+    def _purge_missing_tracks(self):
+        # İşçide: süresi dolan kayıplar gerçekten silinmiştir. Oluşturma olayı
+        # silmeden önce geldiyse yeni dosya çoktan eklenmiştir; aynı imzalı
+        # yeni kayıt bulunursa eski satır ona taşınır (kopya kaldırılır).
+        missing = self._library_missing
+        deadline = time.monotonic() - LIBRARY_MOVE_GRACE_MS / 1000
+        expired = [p for p, seen in missing.items() if seen <= deadline and not os.path.exists(p)]
+        for path in [p for p, seen in missing.items() if seen <= deadline]:
+            del missing[path]
+        if not expired:
+            return
+        signatures = {p: sig for p, sig in self.library.get_signatures(expired).items() if sig}
+        since = time.time() - 3 * LIBRARY_MOVE_GRACE_MS / 1000
+        recent = self.library.get_paths_by_signature(list(set(signatures.values())), since)
+        moves, claimed = [], set()
+        for path in expired:
+            target = next((p for p in recent.get(signatures.get(path), ())
+                           if p not in claimed and p not in missing and os.path.exists(p)), None)
+            if target is not None:
+                claimed.add(target)
+                moves.append((path, target))
+        self.library.move_tracks(moves)
+        moved = {old for old, _ in moves}
+        self.library.remove_tracks([p for p in expired if p not in moved])
+
+    def _ingest_library_files(self, paths: List[str]):
+        # İşçide: her LIBRARY_INGEST_CHUNK dosya tek transaction
+        for start in range(0, len(paths), LIBRARY_INGEST_CHUNK):
+            self.library.events.ingest_progress.emit(len(paths) - start)
+            self.library.add_tracks([
+                (path, self._read_track_tags(path))
+                for path in paths[start:start + LIBRARY_INGEST_CHUNK]
+                if os.path.exists(path)
+            ])
+        if paths:
+            self.library.events.ingest_progress.emit(0)
+
+    def _on_library_ingest_progress(self, remaining: int):
+        if remaining:
+            self.statusBar().showMessage(
+                f"Kütüphane güncelleniyor... ({remaining} dosya kaldı)", 0
+            )
+        else:
+            self.statusBar().showMessage("Kütüphane güncellendi.", 3000)
 
     def refresh_library_view(self):
-        tracks = self.library.get_all_tracks()
-        self.libraryTableWidget.load_tracks(tracks)
+        # Görünmeyen görünüm doldurulmaz; sekme açılınca (ya da açılışta
+        # pencere çizildikten sonra) yüklenir
+        view = self.libraryViewStack.currentWidget()
+        if not view.isVisible():
+            self._library_view_dirty = True
+            return
+        self._library_view_dirty = False
+        with STARTUP.phase("kütüphane görünümü"):
+            if view is self.libraryTree:
+                # Yazımlardan sonra ağaç sıfırlanmaz; yalnızca açık dallar eşitlenir
+                self._ensure_library_model().refresh(self.libraryTree.isExpanded)
+            else:
+                order, descending = getattr(self, "_library_sort", ("artist", False))
+                facets = self.libraryFacetPane.filters
+                tracks = self.library.get_all_tracks(
+                    self.librarySearchEdit.text(), order, descending, facets
+                )
+                self.libraryTableWidget.load_tracks(tracks)
+                if self.libraryFacetPane.isVisible():
+                    self.libraryFacetPane.set_counts(
+                        self.library.get_facet_counts(facets, self.librarySearchEdit.text())
+                    )
+
+    def _set_library_facets_visible(self, visible: bool):
+        self.libraryFacetPane.setVisible(visible)
+        if visible:
+            # Süzgeçler düz listeyi daraltır
+            if not self.libraryViewButton.isChecked():
+                self.libraryViewButton.setChecked(True)
+            self.refresh_library_view()
+        else:
+            self.libraryFacetPane.clear_filters()
+
+    def _on_library_facets_changed(self, facets: Dict[str, Any]):
+        self.refresh_library_view()
+
+    def _on_library_sort_requested(self, order: str, descending: bool):
+        self._library_sort = (order, descending)
+        self.refresh_library_view()
+
+    def _on_library_search_changed(self, text: str):
+        # Arama sonuçları düz listede gösterilir; yazarken her tuşta sorgu atılmaz
+        if text.strip() and not self.libraryViewButton.isChecked():
+            self.libraryViewButton.setChecked(True)
+        timer = getattr(self, "_library_search_timer", None)
+        if timer is None:
+            timer = self._library_search_timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(200)
+            timer.timeout.connect(self.refresh_library_view)
+        timer.start()
+
+    def _ensure_library_model(self) -> LibraryBrowseModel:
+        if self.library_model is None:
+            self.library_model = LibraryBrowseModel(self.library, self)
+            self.libraryTree.setModel(self.library_model)
+            self.libraryTree.setUniformRowHeights(True)
+            header = self.libraryTree.header()
+            header.setStretchLastSection(False)
+            header.setSectionResizeMode(0, QHeaderView.Stretch)
+            header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+            header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        return self.library_model
+
+    def _set_library_flat_view(self, flat: bool):
+        self.libraryViewStack.setCurrentWidget(
+            self.libraryTableWidget if flat else self.libraryTree
+        )
+        self.refresh_library_view()
+
+    def _selected_library_paths(self) -> List[str]:
+        if self.libraryViewStack.currentWidget() is self.libraryTree:
+            if self.library_model is None:
+                return []
+            indexes = self.libraryTree.selectionModel().selectedRows()
+            return self.library_model.paths_for_indexes(indexes)
+        return self.libraryTableWidget.get_selected_paths()
 
     def show_library_context_menu(self, point):
         menu = QMenu(self)
-        item = self.libraryTableWidget.itemAt(point)
-        if item:
+        view = self.libraryViewStack.currentWidget()
+        if view.indexAt(point).isValid():
             add_to_playlist = QAction("Çalma Listesine Ekle", self)
             add_to_playlist.triggered.connect(self.add_selected_lib_to_playlist)
             menu.addAction(add_to_playlist)
-        menu.exec_(self.libraryTableWidget.mapToGlobal(point))
+
+            play_next = QAction("Sıradaki Olarak Çal", self)
+            play_next.triggered.connect(
+                lambda: self.queue_paths(self._selected_library_paths(), play_next=True)
+            )
+            menu.addAction(play_next)
+
+            add_to_queue = QAction("Kuyruğa Ekle", self)
+            add_to_queue.triggered.connect(
+                lambda: self.queue_paths(self._selected_library_paths())
+            )
+            menu.addAction(add_to_queue)
+        menu.exec_(view.viewport().mapToGlobal(point))
 
     def add_selected_lib_to_playlist(self):
-        paths = self.libraryTableWidget.get_selected_paths()
+        paths = self._selected_library_paths()
         for path in paths:
             self._add_media(path, add_to_library=False)
 
@@ -2324,6 +7215,23 @@ class VisualizationWindow(QMainWindow):
             removeAction = QAction("Seçili Öğeleri Kaldır", self)
             removeAction.triggered.connect(self.remove_selected_playlist_items)
             menu.addAction(removeAction)
+
+            def _selected_playlist_paths():
+                return [
+                    it.data(Qt.UserRole)
+                    for it in sorted(self.playlistWidget.selectedItems(),
+                                     key=self.playlistWidget.row)
+                ]
+            playNextAction = QAction("Sıradaki Olarak Çal", self)
+            playNextAction.triggered.connect(
+                lambda: self.queue_paths(_selected_playlist_paths(), play_next=True)
+            )
+            menu.addAction(playNextAction)
+            queueAction = QAction("Kuyruğa Ekle", self)
+            queueAction.triggered.connect(
+                lambda: self.queue_paths(_selected_playlist_paths())
+            )
+            menu.addAction(queueAction)
             # Panoya kopyala (seçili öğelerin yolları)
             copyPathAction = QAction("Yolu Kopyala (Panoya)", self)
             def _copy_paths():
@@ -2346,6 +7254,7 @@ class VisualizationWindow(QMainWindow):
                 q = urllib.parse.quote_plus(query)
                 url = f"https://www.youtube.com/results?search_query={q}"
                 try:
+                    import webbrowser
                     webbrowser.open(url)
                 except Exception:
                     pass
@@ -2367,8 +7276,15 @@ class VisualizationWindow(QMainWindow):
             [self.playlistWidget.row(item) for item in items_to_remove],
             reverse=True
         )
-        for row in rows:
-            self.playlist.removeMedia(row)
+        # Ardışık satırları tek aralık olarak sil (her silme tek sinyal üretir)
+        end = start = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == start - 1:
+                start = row
+                continue
+            self.playlist.removeMedia(start, end)
+            if row is not None:
+                end = start = row
         for item in items_to_remove:
             self.playlistWidget.takeItem(self.playlistWidget.row(item))
 
@@ -2389,9 +7305,35 @@ class VisualizationWindow(QMainWindow):
     # DOSYA NAVİGASYONU
     # ------------------------------------------------------------------#
 
+    def _ensure_file_model(self):
+        if self.file_model is not None:
+            return
+        with STARTUP.phase("dosya modeli"):
+            self.file_model = AudioBrowserModel(self.library, self)
+            self.file_tree.setModel(self.file_model)
+            self.file_tree.setUniformRowHeights(True)
+            self.file_tree.setHeaderHidden(False)
+            header = self.file_tree.header()
+            header.setStretchLastSection(False)
+            header.setSectionResizeMode(0, QHeaderView.Stretch)
+            header.setSectionResizeMode(1, QHeaderView.Interactive)
+            header.setSectionResizeMode(2, QHeaderView.Interactive)
+            header.resizeSection(1, 90)
+            header.resizeSection(2, 48)
+            self.file_tree.setRootIndex(self.file_model.index_for_path(QDir.homePath()))
+
+    def _handle_side_panel_click(self, row: int):
+        """Sol menü: sayfayı değiştirir, görünümü ilk açılışta kurar."""
+        self.stackedWidget.setCurrentIndex(row)
+        if row == 0 and getattr(self, "_library_view_dirty", False):
+            self.refresh_library_view()
+        elif row == 2:
+            self._ensure_file_model()
+
     def file_tree_double_clicked(self, index):
         path = self.file_model.filePath(index)
         if self.file_model.isDir(index):
+            self.file_model.revalidate(index)
             self.file_tree.setRootIndex(index)
         else:
             self._add_files_to_playlist([path])
@@ -2399,13 +7341,16 @@ class VisualizationWindow(QMainWindow):
             self.mediaPlayer.play()
 
     def _go_up_directory(self):
+        if self.file_model is None:
+            return
         current_index = self.file_tree.rootIndex()
         parent_index = self.file_model.parent(current_index)
         if parent_index.isValid() and \
                 self.file_model.filePath(current_index) != QDir.homePath():
+            self.file_model.revalidate(parent_index)
             self.file_tree.setRootIndex(parent_index)
         elif self.file_model.filePath(current_index) != QDir.homePath():
-            self.file_tree.setRootIndex(self.file_model.index(QDir.homePath()))
+            self.file_tree.setRootIndex(self.file_model.index_for_path(QDir.homePath()))
 
     def menu_add_files(self):
         files, _ = QFileDialog.getOpenFileNames(
@@ -2422,6 +7367,120 @@ class VisualizationWindow(QMainWindow):
         if folder:
             self._add_folder(folder, add_to_library=False)
 
+    # ------------------------------------------------------------------#
+    # ÇALMA LİSTESİ İÇE / DIŞA AKTARMA
+    # ------------------------------------------------------------------#
+
+    def menu_import_playlist(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Çalma Listesi İçe Aktar", QDir.homePath(), PLAYLIST_FILE_FILTER
+        )
+        if path:
+            self.import_playlist(path)
+
+    def import_playlist(self, path: str):
+        """Listeyi parçalar halinde ekler; her turda olay döngüsüne dönülür."""
+        try:
+            entries = iter_playlist_file(path)
+        except ValueError as e:
+            self.statusBar().showMessage(str(e), 5000)
+            return
+        self._start_playlist_import(entries, "Çalma listesi içe aktarılıyor...")
+
+    def _start_playlist_import(self, entries, message: str):
+        # Önceki aktarım sürüyorsa yeni kaynak onun ardına sıraya girer
+        if getattr(self, "_playlist_import_timer", None) is not None:
+            self._playlist_import_sources.append(iter(entries))
+            self.statusBar().showMessage(message, 0)
+            return
+
+        self._playlist_import_sources = deque([iter(entries)])
+        self._playlist_import_count = 0
+        self._playlist_import_timer = QTimer(self)
+        self._playlist_import_timer.timeout.connect(self._import_playlist_chunk)
+        self._playlist_import_timer.start(0)
+        self.statusBar().showMessage(message, 0)
+
+    def _import_playlist_chunk(self):
+        # Biten ya da hata veren kaynak bırakılır, sıradakiyle devam edilir
+        sources = self._playlist_import_sources
+        chunk = []
+        while sources and len(chunk) < PLAYLIST_IMPORT_CHUNK:
+            try:
+                chunk.append(next(sources[0]))
+            except StopIteration:
+                sources.popleft()
+            except Exception as e:
+                print(f"Çalma listesi okuma hatası: {e}")
+                sources.popleft()
+        finished = not sources
+
+        if chunk:
+            # Listede etiket yoksa kütüphane önbelleğine bak (dosya açılmaz)
+            missing = [p for p, tags in chunk if "title" not in tags]
+            cached = self.library.get_tracks_by_paths(missing) if missing else {}
+
+            self.playlistWidget.setUpdatesEnabled(False)
+            media = []
+            for path, tags in chunk:
+                if "title" not in tags and path in cached:
+                    title, artist, _, _ = cached[path]
+                    tags = {"title": title, "artist": artist}
+                item = QListWidgetItem(_entry_label(path, tags))
+                item.setData(Qt.UserRole, path)
+                self.playlistWidget.addItem(item)
+                media.append(QMediaContent(QUrl.fromLocalFile(path)))
+            self.playlist.addMedia(media)
+            self.playlistWidget.setUpdatesEnabled(True)
+            self._playlist_import_count += len(chunk)
+
+        if finished:
+            self._playlist_import_timer.stop()
+            self._playlist_import_timer.deleteLater()
+            self._playlist_import_timer = None
+            self._playlist_import_sources = None
+            self.save_playlist()
+            self.statusBar().showMessage(
+                f"{self._playlist_import_count} parça içe aktarıldı.", 3000
+            )
+
+    def menu_export_playlist(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Çalma Listesini Dışa Aktar",
+            os.path.join(QDir.homePath(), "angolla.m3u8"), PLAYLIST_FILE_FILTER
+        )
+        if path:
+            self.export_playlist(path)
+
+    def export_playlist(self, path: str):
+        """Metaveriyi kütüphane önbelleğinden alarak listeyi dosyaya yazar."""
+        paths = [
+            self.playlistWidget.item(i).data(Qt.UserRole)
+            for i in range(self.playlistWidget.count())
+        ]
+        cached = self.library.get_tracks_by_paths(paths)
+
+        def _entries():
+            for i, track_path in enumerate(paths):
+                if track_path in cached:
+                    title, artist, album, duration = cached[track_path]
+                    yield track_path, {
+                        "title": title, "artist": artist,
+                        "album": album, "duration": duration or 0,
+                    }
+                else:
+                    text = self.playlistWidget.item(i).text()
+                    yield track_path, _split_display_title(text)
+
+        try:
+            write_playlist_file(path, _entries())
+        except Exception as e:
+            self.statusBar().showMessage(f"Dışa aktarma hatası: {e}", 5000)
+            return
+        self.statusBar().showMessage(
+            f"{len(paths)} parça dışa aktarıldı: {os.path.basename(path)}", 3000
+        )
+
     def playlist_double_clicked(self, index):
         item = self.playlistWidget.item(index.row())
         if not item:
@@ -2432,8 +7491,13 @@ class VisualizationWindow(QMainWindow):
             print("Dosya bulunamadı:", filepath)
             return
 
+        self.play_file(filepath, index=index.row())
 
-        self.play_file(filepath)
+    def library_tree_double_clicked(self, index: QModelIndex):
+        # Sanatçı/albüm çift tıklaması yalnızca düğümü açar
+        path = self.library_model.track_path(index)
+        if path and os.path.exists(path):
+            self.play_file(path)
 
     def library_double_clicked(self, index: QModelIndex):
         row = index.row()
@@ -2480,26 +7544,24 @@ class VisualizationWindow(QMainWindow):
     # ------------------------------------------------------------------#
 
     def process_audio_buffer(self, buffer):
-        # NumPy kontrol et
-        if np is None:
-            return
-
-        import ctypes, time
-
-        # ==================== BUFFER VERİYİ AL ====================
+        """QAudioBuffer'ı ham PCM'e çevirip analize verir."""
         try:
             byte_count = buffer.byteCount()
         except:
             return
         if byte_count <= 0:
             return
+        raw = ctypes.string_at(int(buffer.constData()), byte_count)
+        fmt = buffer.format()
+        self.process_pcm(raw, fmt.sampleSize(), fmt.channelCount())
 
-        ptr = buffer.constData()
-        raw = ctypes.string_at(int(ptr), byte_count)
+    def process_pcm(self, raw: bytes, s: int, ch: int):
+        """Arka ucun PCM musluğundan gelen ham örnekleri (s bit, ch kanal) analiz eder."""
+        # NumPy kontrol et
+        if not np or not raw:
+            return
 
-        fmt = buffer.format()
-        s = fmt.sampleSize()
-        ch = fmt.channelCount()
+        import time
 
         # Sample type seç
         if s == 8:
@@ -2575,19 +7637,13 @@ class VisualizationWindow(QMainWindow):
         # ==================== EQ KAZANÇ UYGULA ====================
         # EQ bands: [31Hz, 63Hz, 125Hz, 250Hz, 500Hz, 1KHz, 2KHz, 4KHz, 8KHz, 16KHz]
         # Map 96 bars to 10 EQ bands logarithmically
-        eq_gains = self.current_eq_gains if hasattr(self, 'current_eq_gains') else [1.0] * 10
-
-        # Map each bar to nearest EQ band based on frequency (log scale)
-        for i in range(len(bars)):
-            # Bar index as fraction (0 to 1)
-            bar_frac = i / max(1, len(bars) - 1) if len(bars) > 1 else 0
-
-            # Map to EQ band index (0 to 9)
-            eq_band_idx = int(bar_frac * (len(eq_gains) - 1))
-            eq_band_idx = min(eq_band_idx, len(eq_gains) - 1)
-
-            # Apply EQ gain
-            bars[i] *= eq_gains[eq_band_idx]
+        # Çubuk başına kazanç vektörü EQ değişince bir kez kurulur
+        bar_gains = getattr(self, "_eq_bar_gains", None)
+        if bar_gains is None or len(bar_gains) != len(bars):
+            eq_gains = self.current_eq_gains if hasattr(self, 'current_eq_gains') else [1.0] * 10
+            bar_gains = self._eq_bar_gains = eq_bar_gains(eq_gains, len(bars))
+        for i, gain in enumerate(bar_gains):
+            bars[i] *= gain
 
         # Clamp bars to [0, 1] after EQ application
         bars = [np.clip(b, 0.0, 1.0) for b in bars]
@@ -2669,57 +7725,13 @@ class VisualizationWindow(QMainWindow):
         if name not in self.themes:
             return
         self.theme = name
-        primary_color, text_color, bg_color = self.themes[name]
-
-        style = f"""
-        QMainWindow, QWidget, QDialog {{
-            background-color: {bg_color};
-            color: {text_color};
-        }}
-        QPushButton, QComboBox, QLineEdit {{
-            color: {text_color};
-            background-color: {QColor(bg_color).lighter(110).name()};
-            border: 1px solid {primary_color};
-            border-radius: 4px;
-        }}
-        QPushButton:hover {{
-            background-color: {QColor(primary_color).darker(150).name()};
-        }}
-        QPushButton:pressed {{
-            background-color: {QColor(primary_color).darker(200).name()};
-        }}
-        QSlider::groove:horizontal {{
-            border: 0px;
-            height: 6px;
-            background: #555;
-            margin: 2px 0;
-            border-radius: 3px;
-        }}
-        QSlider::handle:horizontal {{
-            background: {primary_color};
-            border: 1px solid #333;
-            width: 14px;
-            margin: -4px 0;
-            border-radius: 7px;
-        }}
-        QLabel, QCheckBox {{
-            color: {text_color};
-        }}
-        QListWidget, QTreeView, QTableWidget {{
-            border: 1px solid #444;
-            background-color: {QColor(bg_color).lighter(105).name()};
-        }}
-        QListWidget::item:selected, QTreeView::item:selected,
-        QTableWidget::item:selected {{
-            background: {primary_color};
-            color: black;
-        }}
-        QSplitter::handle {{
-            background-color: {QColor(primary_color).darker(130).name()};
-        }}
-        """
+        primary_color, _, bg_color = self.themes[name]
 
-        QApplication.instance().setStyleSheet(style)
+        engine = getattr(self, "theme_engine", None)
+        if engine is None:
+            engine = self.theme_engine = ThemeEngine(self.themes)
+        engine.apply(name)
+        self.positionSlider.set_theme_colors(primary_color)
 
         if self.vis_widget_main_window:
             self.vis_widget_main_window.set_color_theme(primary_color, bg_color)
@@ -2728,16 +7740,15 @@ class VisualizationWindow(QMainWindow):
                 primary_color, bg_color
             )
             # Görselleştirme penceresinin arka planını da güncelle
-            self.vis_window.setStyleSheet(f"""
-                QMainWindow {{
-                    background-color: {bg_color};
-                }}
-            """)
+            self.vis_window.setPalette(engine.palette(name))
 
         if save:
             self.save_config()
 
     def save_playlist(self):
+        if getattr(self, "_deferred_startup", None):
+            # Kayıtlı liste henüz yüklenmedi; boş listeyle üzerine yazma
+            return
         paths = []
         for i in range(self.playlistWidget.count()):
             item = self.playlistWidget.item(i)
@@ -2745,7 +7756,8 @@ class VisualizationWindow(QMainWindow):
 
         data = {
             "paths": paths,
-            "current_index": self.playlist.currentIndex()
+            "current_index": self.playlist.currentIndex(),
+            "queue": list(self._get_play_queue()),
         }
         try:
             with open(PLAYLIST_FILE, "wb") as f:
@@ -2754,6 +7766,10 @@ class VisualizationWindow(QMainWindow):
             print(f"Çalma listesi kaydetme hatası: {e}")
 
     def load_playlist(self):
+        if not getattr(self, "_first_paint_done", False):
+            # İlk kareyi bekletmemek için pencere çizildikten sonra yüklenir
+            self._defer_startup("çalma listesi", self.load_playlist)
+            return
         if not os.path.exists(PLAYLIST_FILE):
             return
         try:
@@ -2791,6 +7807,11 @@ class VisualizationWindow(QMainWindow):
                     min(current_index, len(valid_paths) - 1)
                 )
 
+            queue = self._get_play_queue()
+            queue.clear()
+            queue.extend(p for p in data.get("queue", []) if os.path.exists(p))
+            self._refresh_queue_view()
+
             self.statusBar().showMessage(
                 f"{len(valid_paths)} parça yüklendi.", 3000
             )
@@ -2800,10 +7821,13 @@ class VisualizationWindow(QMainWindow):
                 os.remove(PLAYLIST_FILE)
 
     def save_config(self):
-        self.config_data["volume"] = self.mediaPlayer.volume()
-        self.config_data["shuffle_mode"] = (
-            self.playlist.playbackMode() == QMediaPlaylist.Random
-        )
+        """
+        Arayüz durumunu ayar deposuna işler. Diske yazmaz: depo yalnızca
+        değişen değerleri kirli işaretler ve kısa gecikmeyle tek seferde yazar.
+        """
+        # Deck sesi fade sırasında rampadadır; kullanıcının seçtiği değer esas
+        self.config_data["volume"] = self.volumeSlider.value()
+        self.config_data["shuffle_mode"] = getattr(self, "shuffle_enabled", False)
         self.config_data["repeat_mode"] = self.is_repeating
         self.config_data["theme"] = self.theme
         self.config_data["show_album_art"] = self.infoDisplayWidget._album_art_visible
@@ -2812,44 +7836,36 @@ class VisualizationWindow(QMainWindow):
         self.config_data["vis_mode"] = self.vis_mode
         self.config_data["eq_gains"] = self.current_eq_gains
 
-        settings = QSettings(SETTINGS_KEY, "AngollaPlayer")
-        try:
-            settings.setValue("config", QByteArray(pickle.dumps(self.config_data)))
-        except Exception as e:
-            print(f"Ayar kaydetme hatası: {e}")
-
     def load_config(self):
-        settings = QSettings(SETTINGS_KEY, "AngollaPlayer")
-        try:
-            data = settings.value("config")
-            if data and isinstance(data, QByteArray):
-                self.config_data = pickle.loads(data.data())
-            else:
-                self.config_data = {}
-        except Exception:
-            self.config_data = {}
+        self._get_config_store()
 
         vol = self.config_data.get("volume", 70)
-        self.mediaPlayer.setVolume(vol)
         self.volumeSlider.setValue(vol)
+        if getattr(self, "standbyPlayer", None) is not None:
+            self._set_player_volume(vol)
 
         repeat_mode_val = self.config_data.get(
             "repeat_mode", QMediaPlaylist.Sequential
         )
         is_shuffle = self.config_data.get("shuffle_mode", False)
-        self.is_repeating = repeat_mode_val
-
-        if is_shuffle:
-            self.playlist.setPlaybackMode(QMediaPlaylist.Random)
-            self.shuffleButton.setText("🔀 (On)")
+        # Eski sürümler karıştırmayı tekrar modu olarak (Random) saklıyordu
+        if repeat_mode_val == QMediaPlaylist.Random:
+            repeat_mode_val = QMediaPlaylist.Sequential
+        self.is_repeating = QMediaPlaylist.PlaybackMode(repeat_mode_val)
+        self.shuffle_enabled = bool(is_shuffle)
+
+        self.shuffleButton.setText("🔀 (On)" if is_shuffle else "🔀 (Off)")
+        if repeat_mode_val == QMediaPlaylist.CurrentItemInLoop:
+            self.repeatButton.setText("🔁 (One)")
+        elif repeat_mode_val == QMediaPlaylist.Loop:
+            self.repeatButton.setText("🔁 (All)")
         else:
-            self.playlist.setPlaybackMode(repeat_mode_val)
-            if repeat_mode_val == QMediaPlaylist.CurrentItemInLoop:
-                self.repeatButton.setText("🔁 (One)")
-            elif repeat_mode_val == QMediaPlaylist.Loop:
-                self.repeatButton.setText("🔁 (All)")
-            else:
-                self.repeatButton.setText("🔁 (Off)")
+            self.repeatButton.setText("🔁 (Off)")
+        self._apply_playback_mode()
+        if hasattr(self, "shuffleSpreadAction"):
+            self.shuffleSpreadAction.setChecked(
+                self.config_data.get("shuffle_spread", False)
+            )
 
         theme_name = self.config_data.get("theme", "AURA Mavi")
         self.set_theme(theme_name, save=False)
@@ -2871,6 +7887,39 @@ class VisualizationWindow(QMainWindow):
         eq_gains = self.config_data.get("eq_gains", [1.0] * 10)
         self.current_eq_gains = eq_gains
         self.equalizerWidget.set_gains(eq_gains)
+        self.equalizerWidget.show_preset(self.config_data.get("eq_preset"))
+        self.equalizerWidget.autoGenreCheck.blockSignals(True)
+        self.equalizerWidget.autoGenreCheck.setChecked(
+            self.config_data.get("eq_auto_genre", False)
+        )
+        self.equalizerWidget.autoGenreCheck.blockSignals(False)
+
+    # ------------------------------------------------------------------#
+    # AÇILIŞ: İLK KAREDEN SONRA YAPILANLAR
+    # ------------------------------------------------------------------#
+
+    def _defer_startup(self, name: str, func):
+        tasks = getattr(self, "_deferred_startup", None)
+        if tasks is None:
+            tasks = self._deferred_startup = []
+        tasks.append((name, func))
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not getattr(self, "_first_paint_done", False):
+            self._first_paint_done = True
+            STARTUP.mark("ilk pencere çizildi")
+            QTimer.singleShot(0, self._run_deferred_startup)
+
+    def _run_deferred_startup(self):
+        for name, func in getattr(self, "_deferred_startup", []):
+            with STARTUP.phase(f"ertelenen: {name}"):
+                func()
+        self._deferred_startup = []
+        if getattr(self, "_library_view_dirty", False):
+            self.refresh_library_view()
+        STARTUP.mark("ertelenen işler bitti")
+        STARTUP.report()
 
     def closeEvent(self, event):
         if self.vis_window:
@@ -2878,8 +7927,14 @@ class VisualizationWindow(QMainWindow):
         try:
             self.save_playlist()
             self.save_config()
+            self.config_data.flush()
+            worker = getattr(self, "_library_ingest_worker", None)
+            if worker is not None:
+                worker.shutdown(wait=False, cancel_futures=True)
             self.library.close()
             self.mediaPlayer.stop()
+            if getattr(self, "standbyPlayer", None) is not None:
+                self.standbyPlayer.stop()
             if hasattr(self, "fallback_timer") and self.fallback_timer.isActive():
                 self.fallback_timer.stop()
             if (self.vis_widget_main_window and
@@ -2938,7 +7993,7 @@ class VisualizationWindow(QMainWindow):
 # ---------------------------------------------------------------------------
 
 class PreferencesDialog(QDialog):
-    def __init__(self, parent: AngollaPlayer):
+    def __init__(self, parent: "VisualizationWindow"):
         super().__init__(parent)
         self.setWindowTitle("Angolla Ayarları")
         self.parent = parent
@@ -2970,6 +8025,14 @@ class PreferencesDialog(QDialog):
             f"{self.crossfadeSlider.value()} ms"
         )
 
+        self.preloadLabel = QLabel("Ön Yükleme (sn):")
+        self.preloadSlider = QSlider(Qt.Horizontal)
+        self.preloadSlider.setRange(0, 30)
+        self.preloadSlider.setValue(
+            int(self.parent.config_data.get("preload_seconds", 5))
+        )
+        self.preloadValueLabel = QLabel(f"{self.preloadSlider.value()} sn")
+
         self.visModeLabel = QLabel("Görselleştirme Modu:")
         self.visModeCombo = QComboBox()
         self.visModeCombo.addItems([
@@ -2982,6 +8045,16 @@ class PreferencesDialog(QDialog):
         current_mode = self.parent.config_data.get("vis_mode", "Çizgiler")
         self.visModeCombo.setCurrentText(current_mode)
 
+        self.backendLabel = QLabel("Ses Motoru:")
+        self.backendCombo = QComboBox()
+        self.backendCombo.addItem("QtMultimedia", QtMultimediaBackend.name)
+        if vlc:
+            self.backendCombo.addItem("VLC (gerçek EQ)", VlcBackend.name)
+        index = self.backendCombo.findData(
+            select_playback_backend(self.parent.config_data)
+        )
+        self.backendCombo.setCurrentIndex(max(0, index))
+
         self.shareLabel = QLabel("Paylaşım Seçeneği:")
         self.shareButton = QPushButton("Şarkıyı Paylaş (Simülasyon)")
 
@@ -3004,19 +8077,40 @@ class PreferencesDialog(QDialog):
         h_layout.addWidget(self.crossfadeValueLabel)
         layout.addLayout(h_layout, 3, 1)
 
-        layout.addWidget(self.shareLabel, 4, 0)
-        layout.addWidget(self.shareButton, 4, 1)
+        layout.addWidget(self.preloadLabel, 4, 0)
+        preload_layout = QHBoxLayout()
+        preload_layout.addWidget(self.preloadSlider)
+        preload_layout.addWidget(self.preloadValueLabel)
+        layout.addLayout(preload_layout, 4, 1)
+
+        layout.addWidget(self.backendLabel, 5, 0)
+        layout.addWidget(self.backendCombo, 5, 1)
+
+        layout.addWidget(self.shareLabel, 6, 0)
+        layout.addWidget(self.shareButton, 6, 1)
 
-        layout.setRowStretch(5, 1)
+        layout.setRowStretch(7, 1)
 
     def _connect_signals(self):
         self.albumArtCheck.stateChanged.connect(self._apply_settings)
         self.themeCombo.currentTextChanged.connect(self._apply_settings)
         self.crossfadeSlider.valueChanged.connect(self._update_crossfade_label)
         self.crossfadeSlider.sliderReleased.connect(self._apply_settings)
+        self.preloadSlider.valueChanged.connect(
+            lambda v: self.preloadValueLabel.setText(f"{v} sn")
+        )
+        self.preloadSlider.sliderReleased.connect(self._apply_settings)
         self.visModeCombo.currentTextChanged.connect(self._apply_settings)
+        self.backendCombo.currentIndexChanged.connect(self._backend_changed)
         self.shareButton.clicked.connect(self._share_clicked)
 
+    def _backend_changed(self, _index):
+        # Arka uç başlangıçta seçilir
+        self.parent.config_data["playback_backend"] = self.backendCombo.currentData()
+        self.parent.statusBar().showMessage(
+            "Ses motoru bir sonraki açılışta değişecek.", 4000
+        )
+
     def _update_crossfade_label(self, value):
         self.crossfadeValueLabel.setText(f"{value} ms")
 
@@ -3025,6 +8119,7 @@ class PreferencesDialog(QDialog):
             self.albumArtCheck.isChecked()
         self.parent.config_data["crossfade_duration"] = \
             self.crossfadeSlider.value()
+        self.parent.config_data["preload_seconds"] = self.preloadSlider.value()
 
         selected_theme = self.themeCombo.currentText()
         if self.parent.theme != selected_theme:
@@ -3066,16 +8161,21 @@ class PreferencesDialog(QDialog):
 # ---------------------------------------------------------------------------
 
 def main():
-    app = QApplication(sys.argv)
-    app.setFont(QFont("Ubuntu", 10))
-    window = AngollaPlayer()
-    window.show()
+    if "--bench-tags" in sys.argv:
+        args = sys.argv[sys.argv.index("--bench-tags") + 1:]
+        benchmark_tag_readers(args[0] if args else os.getcwd())
+        return
+    STARTUP.mark("modül içe aktarımları bitti")
+    with STARTUP.phase("QApplication"):
+        app = QApplication(sys.argv)
+        app.setFont(QFont("Ubuntu", 10))
+    with STARTUP.phase("VisualizationWindow()"):
+        window = VisualizationWindow()
+    with STARTUP.phase("pencereyi göster"):
+        window.show()
     sys.exit(app.exec_())
 
 
 if __name__ == "__main__":
-    if MutagenFile is None:
-        print("\n!!! UYARI: Mutagen yüklenmedi. 'pip install mutagen' ile yükleyin.")
-    if np is None:
-        print("\n!!! UYARI: NumPy yüklenmedi. Görselleştirme sınırlı çalışacak. 'pip install numpy' önerilir.")
+    # Mutagen/NumPy/VLC eksikse uyarı ilk kullanımda basılır
     main()